@@ -15,6 +15,31 @@ async function fetchJSON(filename) {
     return resp.json();
 }
 
+// Expand columnar series ({repo, start, days, <value>}) back into dated rows
+function rowsFromColumnar(series, dateField, valueField) {
+    const rows = [];
+    (Array.isArray(series) ? series : []).forEach(entry => {
+        const day = new Date(`${entry.start}T00:00:00Z`);
+        (entry.days || []).forEach((gap, i) => {
+            day.setUTCDate(day.getUTCDate() + gap);
+            rows.push({
+                repo: entry.repo,
+                [dateField]: day.toISOString().substring(0, 10),
+                [valueField]: entry[valueField][i],
+            });
+        });
+    });
+    return rows;
+}
+
+// Load a time series from its row file, falling back to the columnar file
+function fetchSeries(name, dateField, valueField) {
+    return fetchJSON(`${name}.json`)
+        .catch(() => fetchJSON(`${name}.columnar.json`)
+            .then(series => rowsFromColumnar(series, dateField, valueField)))
+        .catch(() => []);
+}
+
 function isDark() {
     const bsTheme = document.documentElement.dataset.bsTheme;
     if (bsTheme === 'dark') return true;
@@ -629,10 +654,10 @@ async function loadDashboard() {
             fetchJSON('repos.json'),
             fetchJSON('prs.json'),
             fetchJSON('metadata.json'),
-            fetchJSON('coverage_history.json').catch(() => []),
-            fetchJSON('commit_activity.json').catch(() => []),
-            fetchJSON('star_history.json').catch(() => []),
-            fetchJSON('code_scanning_history.json').catch(() => []),
+            fetchSeries('coverage_history', 'date', 'coverage'),
+            fetchSeries('commit_activity', 'week', 'total'),
+            fetchSeries('star_history', 'date', 'stars'),
+            fetchSeries('code_scanning_history', 'date', 'open'),
         ]);
 
         const active = activeRepos(repos);
@@ -686,6 +711,8 @@ document.addEventListener('DOMContentLoaded', () => {
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = {
         fetchJSON,
+        rowsFromColumnar,
+        fetchSeries,
         isDark,
         plotlyTemplate,
         themeLayout,
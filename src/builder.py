@@ -1,9 +1,12 @@
 """Build consolidated dashboard data JSON files from raw collected data."""
 
 # standard imports
+import hashlib
 import json
 import os
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta, timezone
 
 # local imports
 from src import BASE_DIR, TEMPLATE_DIR
@@ -16,6 +19,327 @@ def _safe_name(name: str) -> str:
     return os.path.basename(name)
 
 
+BUILD_MANIFEST_VERSION = 2
+MANIFEST_FILE = 'build_manifest.json'
+PREFETCH_REPOS = 32
+READ_WORKERS = 16
+SERIES_BOTH = 'both'
+SERIES_COLUMNAR = 'columnar'
+SERIES_ROWS = 'rows'
+SERIES_OUTPUTS = {
+    'coverage_history': ('date', 'coverage'),
+    'commit_activity': ('week', 'total'),
+    'star_history': ('date', 'stars'),
+    'code_scanning_history': ('date', 'open'),
+}
+SHARD_DIR = 'shards'
+ROW_OUTPUTS = ('prs', 'coverage_history', 'commit_activity', 'star_history', 'code_scanning_history')
+REPO_DATA_FILES = (
+    ('codecov', '{name}.json'),
+    ('codecov', '{name}_coverage_trend.json'),
+    ('github/languages', '{name}.json'),
+    ('github/pulls', '{name}.json'),
+    ('github/issues', '{name}.json'),
+    ('github/commitActivity', '{name}.json'),
+    ('github/starHistory', '{name}.json'),
+    ('github/codeScanning', '{name}.json'),
+    ('github/codeScanningHistory', '{name}.json'),
+    ('github/prMetrics', '{name}.json'),
+)
+
+
+class DataFiles:
+    """
+    Index of the raw data files under a base directory.
+
+    Each directory is listed once with ``os.scandir``, so missing files are answered from the index instead
+    of a ``stat`` call per repository. Files can be prefetched concurrently and are released once loaded.
+
+    Parameters
+    ----------
+    base_dir : str
+        Root directory containing the gh-pages data.
+    """
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self._listings = {}
+        self._prefetched = {}
+
+    def _entries(self, directory: str) -> dict:
+        if directory not in self._listings:
+            try:
+                with os.scandir(os.path.join(self.base_dir, directory)) as entries:
+                    self._listings[directory] = {entry.name: entry for entry in entries if entry.is_file()}
+            except OSError:
+                self._listings[directory] = {}
+        return self._listings[directory]
+
+    def exists(self, directory: str, filename: str) -> bool:
+        """Return whether the index lists a file."""
+        return filename in self._entries(directory)
+
+    def signature(self, directory: str, filename: str, previous: list | None = None) -> list | None:
+        """
+        Return the change signature of a listed file.
+
+        Parameters
+        ----------
+        directory : str
+            Directory relative to the base directory.
+        filename : str
+            File name within the directory.
+        previous : list, optional
+            Signature recorded by an earlier build; its digest is reused when mtime and size still match.
+
+        Returns
+        -------
+        list | None
+            ``[mtime_ns, size, sha256]``, or ``None`` when the file does not exist.
+        """
+        entry = self._entries(directory).get(filename)
+        if entry is None:
+            return None
+        stat = entry.stat()
+        if previous and previous[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return previous
+        with open(entry.path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        return [stat.st_mtime_ns, stat.st_size, digest]
+
+    def _read(self, directory: str, filename: str):
+        with open(os.path.join(self.base_dir, directory, filename)) as f:
+            return json.load(f)
+
+    def _read_outcome(self, key: tuple) -> tuple:
+        try:
+            return key, self._read(*key), None
+        except Exception as e:
+            return key, None, e
+
+    def prefetch(self, keys: list[tuple[str, str]], workers: int = READ_WORKERS) -> None:
+        """
+        Read the existing files among ``keys`` concurrently.
+
+        Parameters
+        ----------
+        keys : list[tuple[str, str]]
+            ``(directory, filename)`` pairs relative to the base directory.
+        workers : int
+            Maximum number of concurrent reads.
+        """
+        existing = [key for key in keys if self.exists(*key) and key not in self._prefetched]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='data-files') as executor:
+            for key, data, error in executor.map(self._read_outcome, existing):
+                self._prefetched[key] = (data, error)
+
+    def load(self, directory: str, filename: str):
+        """
+        Return the parsed JSON of a data file.
+
+        Parameters
+        ----------
+        directory : str
+            Directory relative to the base directory.
+        filename : str
+            File name within the directory.
+
+        Returns
+        -------
+        Any
+            Parsed JSON content.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the index does not list the file.
+        """
+        if (directory, filename) in self._prefetched:
+            data, error = self._prefetched.pop((directory, filename))
+            if error:
+                raise error
+            return data
+        if not self.exists(directory, filename):
+            raise FileNotFoundError(os.path.join(self.base_dir, directory, filename))
+        return self._read(directory, filename)
+
+
+class JsonArrayWriter:
+    """
+    Stream a JSON array to disk one element at a time.
+
+    The array is written to a temporary file that replaces the target only when the context exits cleanly,
+    so readers never see a partial file and only the element being written is held in memory. Elements are
+    ASCII-encoded JSON, so the character spans returned by ``extend`` are also byte offsets into the file.
+
+    Parameters
+    ----------
+    path : str
+        Destination file path.
+    """
+    brackets = '[]'
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.size = 0
+        self._file = None
+
+    def __enter__(self) -> 'JsonArrayWriter':
+        self._file = open(f'{self.path}.tmp', 'w')
+        self._emit(self.brackets[0])
+        return self
+
+    def _emit(self, text: str) -> None:
+        self._file.write(text)
+        self.size += len(text)
+
+    def _encode(self, item) -> str:
+        return json.dumps(item)
+
+    def _separate(self) -> None:
+        if self.count:
+            self._emit(', ')
+        self.count += 1
+
+    def write(self, item) -> None:
+        """Append one element."""
+        self._separate()
+        self._emit(self._encode(item))
+
+    def extend(self, items) -> list[int] | None:
+        """
+        Append every element of an iterable.
+
+        Parameters
+        ----------
+        items : Iterable
+            Elements to append.
+
+        Returns
+        -------
+        list[int] | None
+            ``[start, end]`` offsets of the appended elements in the file, or ``None`` when nothing was appended.
+        """
+        start = None
+        for item in items:
+            self._separate()
+            if start is None:
+                start = self.size
+            self._emit(self._encode(item))
+        return None if start is None else [start, self.size]
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._emit(self.brackets[1])
+        self._file.close()
+        if exc_type is None:
+            os.replace(f'{self.path}.tmp', self.path)
+            log.info(f'Written: {self.path} ({self.count} items)')
+        else:
+            os.remove(f'{self.path}.tmp')
+
+
+class JsonObjectWriter(JsonArrayWriter):
+    """
+    Stream a JSON object to disk one member at a time.
+
+    Elements passed to ``write`` and ``extend`` are ``(key, value)`` pairs; see ``JsonArrayWriter``.
+
+    Parameters
+    ----------
+    path : str
+        Destination file path.
+    """
+    brackets = '{}'
+
+    def _encode(self, item: tuple) -> str:
+        key, value = item
+        return f'{json.dumps(key)}: {json.dumps(value)}'
+
+
+class RepoShards:
+    """
+    Per-repository dashboard data files plus a small index.
+
+    Each shard holds one repository's entry and rows from every output, without the repeated ``repo`` key.
+    Shards of repositories that were not rebuilt are left untouched and keep their previous index entry.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory containing the dashboard data files.
+    now : datetime
+        Build timestamp recorded for rewritten shards.
+    """
+
+    def __init__(self, data_dir: str, now: datetime):
+        self.data_dir = data_dir
+        self.shard_dir = os.path.join(data_dir, SHARD_DIR)
+        self.now = now
+        self.entries = {}
+        os.makedirs(self.shard_dir, exist_ok=True)
+        try:
+            with open(os.path.join(self.shard_dir, 'index.json')) as f:
+                self.previous = json.load(f)['repos']
+        except Exception:
+            self.previous = {}
+
+    def add(self, name: str, outputs: dict, rebuilt: bool) -> None:
+        """
+        Record a repository's shard, writing it when rebuilt or missing.
+
+        Parameters
+        ----------
+        name : str
+            Repository name.
+        outputs : dict
+            The repository's rows keyed by output name.
+        rebuilt : bool
+            Whether the repository's inputs changed in this build.
+        """
+        filename = f'{_safe_name(name)}.json'
+        path = os.path.join(self.shard_dir, filename)
+        entry = self.previous.get(name)
+        if rebuilt or not entry or not os.path.exists(path):
+            shard = {
+                'repo': outputs['repos'][0] if outputs['repos'] else None,
+                **{
+                    output: [{key: value for key, value in row.items() if key != 'repo'} for row in outputs[output]]
+                    for output in ROW_OUTPUTS
+                },
+            }
+            if 'pr_metrics' in outputs:
+                shard['pr_metrics'] = outputs['pr_metrics']
+            with open(path, 'w') as f:
+                json.dump(shard, f)
+            entry = {
+                'path': f'{SHARD_DIR}/{filename}',
+                'size': os.path.getsize(path),
+                'updated_at': self.now.isoformat(),
+            }
+        self.entries[name] = entry
+
+    def close(self) -> None:
+        """Remove shards of repositories no longer built and write the index."""
+        expected = {'index.json', *(os.path.basename(entry['path']) for entry in self.entries.values())}
+        with os.scandir(self.shard_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.name not in expected:
+                    os.remove(entry.path)
+        with open(os.path.join(self.shard_dir, 'index.json'), 'w') as f:
+            json.dump({'updated_at': self.now.isoformat(), 'repos': self.entries}, f)
+        log.info(f'Written: {len(self.entries)} repository shards in {self.shard_dir}')
+
+
+def _data_files(base_dir: str, files: DataFiles | None) -> DataFiles:
+    return files if files is not None else DataFiles(base_dir)
+
+
+def _repo_data_keys(name: str) -> list[tuple[str, str]]:
+    safe = _safe_name(name)
+    return [(directory, pattern.format(name=safe)) for directory, pattern in REPO_DATA_FILES]
+
+
 def _load_rtd_repos(base_dir: str) -> set:
     rtd_repos = set()
     rtd_path = os.path.join(base_dir, 'readthedocs', 'projects.json')
@@ -33,27 +357,17 @@ def _load_rtd_repos(base_dir: str) -> set:
     return rtd_repos
 
 
-def _get_coverage(base_dir: str, name: str) -> float:
-    safe = _safe_name(name)
-    codecov_path = os.path.join(base_dir, 'codecov', f'{safe}.json')
-    if not os.path.exists(codecov_path):
-        return 0.0
+def _get_coverage(base_dir: str, name: str, files: DataFiles | None = None) -> float:
     try:
-        with open(codecov_path) as f:
-            data = json.load(f)
+        data = _data_files(base_dir, files).load('codecov', f'{_safe_name(name)}.json')
         return float((data.get('totals') or {}).get('coverage', 0) or 0)
     except Exception:
         return 0.0
 
 
-def _collect_coverage_history(base_dir: str, name: str) -> list:
-    safe = _safe_name(name)
-    trend_path = os.path.join(base_dir, 'codecov', f'{safe}_coverage_trend.json')
-    if not os.path.exists(trend_path):
-        return []
+def _collect_coverage_history(base_dir: str, name: str, files: DataFiles | None = None) -> list:
     try:
-        with open(trend_path) as f:
-            trend_data = json.load(f)
+        trend_data = _data_files(base_dir, files).load('codecov', f'{_safe_name(name)}_coverage_trend.json')
         return [
             {'repo': name, 'date': entry.get('timestamp'), 'coverage': float(entry['avg'])}
             for entry in trend_data
@@ -63,43 +377,28 @@ def _collect_coverage_history(base_dir: str, name: str) -> list:
         return []
 
 
-def _get_languages(base_dir: str, name: str) -> dict:
-    safe = _safe_name(name)
-    lang_path = os.path.join(base_dir, 'github', 'languages', f'{safe}.json')
-    if not os.path.exists(lang_path):
-        return {}
+def _get_languages(base_dir: str, name: str, files: DataFiles | None = None) -> dict:
     try:
-        with open(lang_path) as f:
-            return json.load(f)
+        return _data_files(base_dir, files).load('github/languages', f'{_safe_name(name)}.json')
     except Exception:
         return {}
 
 
-def _get_prs(base_dir: str, name: str) -> list:
-    safe = _safe_name(name)
-    pulls_path = os.path.join(base_dir, 'github', 'pulls', f'{safe}.json')
-    if not os.path.exists(pulls_path):
-        return []
+def _get_prs(base_dir: str, name: str, files: DataFiles | None = None) -> list:
     try:
-        with open(pulls_path) as f:
-            return json.load(f)
+        return _data_files(base_dir, files).load('github/pulls', f'{_safe_name(name)}.json')
     except Exception:
         return []
 
 
-def _get_issues(base_dir: str, name: str) -> list | None:
-    safe = _safe_name(name)
-    issues_path = os.path.join(base_dir, 'github', 'issues', f'{safe}.json')
-    if not os.path.exists(issues_path):
-        return None
+def _get_issues(base_dir: str, name: str, files: DataFiles | None = None) -> list | None:
     try:
-        with open(issues_path) as f:
-            return json.load(f)
+        return _data_files(base_dir, files).load('github/issues', f'{_safe_name(name)}.json')
     except Exception:
         return None
 
 
-def _get_commit_activity(base_dir: str, name: str) -> list:
+def _get_commit_activity(base_dir: str, name: str, files: DataFiles | None = None) -> list:
     """
     Read cached commit activity for a repo and return flat weekly records.
 
@@ -109,19 +408,16 @@ def _get_commit_activity(base_dir: str, name: str) -> list:
         Root directory containing the gh-pages data.
     name : str
         Repository name.
+    files : DataFiles, optional
+        Shared file index; a new one is created when omitted.
 
     Returns
     -------
     list
         List of dicts with keys ``repo``, ``week`` (ISO date), and ``total``.
     """
-    safe = _safe_name(name)
-    path = os.path.join(base_dir, 'github', 'commitActivity', f'{safe}.json')
-    if not os.path.exists(path):
-        return []
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = _data_files(base_dir, files).load('github/commitActivity', f'{_safe_name(name)}.json')
         result = []
         for entry in data:
             week_ts = entry.get('week')
@@ -134,7 +430,7 @@ def _get_commit_activity(base_dir: str, name: str) -> list:
         return []
 
 
-def _get_star_history(base_dir: str, name: str) -> list:
+def _get_star_history(base_dir: str, name: str, files: DataFiles | None = None) -> list:
     """
     Read the cached sampled star history for a repo.
 
@@ -144,45 +440,32 @@ def _get_star_history(base_dir: str, name: str) -> list:
         Root directory containing the gh-pages data.
     name : str
         Repository name.
+    files : DataFiles, optional
+        Shared file index; a new one is created when omitted.
 
     Returns
     -------
     list
         List of dicts with keys ``repo``, ``date``, and ``stars``.
     """
-    safe = _safe_name(name)
-    path = os.path.join(base_dir, 'github', 'starHistory', f'{safe}.json')
-    if not os.path.exists(path):
-        return []
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = _data_files(base_dir, files).load('github/starHistory', f'{_safe_name(name)}.json')
         return [{'repo': name, 'date': e['date'], 'stars': e['stars']} for e in data]
     except Exception:
         return []
 
 
-def _get_code_scanning_open(base_dir: str, name: str) -> int:
-    safe = _safe_name(name)
-    path = os.path.join(base_dir, 'github', 'codeScanning', f'{safe}.json')
-    if not os.path.exists(path):
-        return 0
+def _get_code_scanning_open(base_dir: str, name: str, files: DataFiles | None = None) -> int:
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = _data_files(base_dir, files).load('github/codeScanning', f'{_safe_name(name)}.json')
         return int(data.get('open', 0) or 0)
     except Exception:
         return 0
 
 
-def _get_code_scanning_history(base_dir: str, name: str) -> list:
-    safe = _safe_name(name)
-    path = os.path.join(base_dir, 'github', 'codeScanningHistory', f'{safe}.json')
-    if not os.path.exists(path):
-        return []
+def _get_code_scanning_history(base_dir: str, name: str, files: DataFiles | None = None) -> list:
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = _data_files(base_dir, files).load('github/codeScanningHistory', f'{_safe_name(name)}.json')
         return [
             {'repo': name, 'date': entry['date'], 'open': int(entry['open'])}
             for entry in data
@@ -192,6 +475,14 @@ def _get_code_scanning_history(base_dir: str, name: str) -> list:
         return []
 
 
+def _get_pr_metric_cache(base_dir: str, name: str, files: DataFiles | None = None) -> dict | None:
+    try:
+        cache = _data_files(base_dir, files).load('github/prMetrics', f'{_safe_name(name)}.json')
+    except Exception:
+        return None
+    return cache if pr_metrics.is_valid_cache(cache) else None
+
+
 def _build_repo_entry(
         repo: dict,
         coverage: float,
@@ -243,6 +534,258 @@ def _build_repo_entry(
     }
 
 
+def _build_repo_outputs(repo: dict, rtd_repos: set, files: DataFiles) -> dict:
+    """
+    Read one repository's raw data and derive its rows for every dashboard output.
+
+    Parameters
+    ----------
+    repo : dict
+        Raw repository record from ``github/repos.json``.
+    rtd_repos : set
+        Names of repositories with a Read the Docs project.
+    files : DataFiles
+        Shared file index.
+
+    Returns
+    -------
+    dict
+        Rows keyed by output name: ``repos`` and each of ``ROW_OUTPUTS``, plus ``pr_metrics`` for active repos.
+    """
+    name = repo['name']
+    coverage = _get_coverage(BASE_DIR, name, files)
+    coverage_hist = _collect_coverage_history(BASE_DIR, name, files)
+    if not coverage and coverage_hist:
+        coverage = max(coverage_hist, key=lambda e: e.get('date', '')).get('coverage', 0.0)
+    languages = _get_languages(BASE_DIR, name, files)
+    prs = _get_prs(BASE_DIR, name, files)
+    issues = _get_issues(BASE_DIR, name, files)
+    code_scanning_open = _get_code_scanning_open(BASE_DIR, name, files)
+    outputs = {
+        'repos': [_build_repo_entry(repo, coverage, languages, prs, issues, rtd_repos, code_scanning_open)],
+        'prs': [{'repo': name, **pr} for pr in prs],
+        'coverage_history': coverage_hist,
+        'commit_activity': _get_commit_activity(BASE_DIR, name, files),
+        'star_history': _get_star_history(BASE_DIR, name, files),
+        'code_scanning_history': _get_code_scanning_history(BASE_DIR, name, files),
+    }
+    if pr_metrics.is_active_repo(repo):
+        outputs['pr_metrics'] = _get_pr_metric_cache(BASE_DIR, name, files)
+    return outputs
+
+
+def _repo_signature(repo: dict, files: DataFiles, previous: dict | None) -> dict:
+    """
+    Return the manifest entry describing every input of one repository.
+
+    Parameters
+    ----------
+    repo : dict
+        Raw repository record.
+    files : DataFiles
+        Shared file index.
+    previous : dict, optional
+        The repository's entry from the previous manifest.
+
+    Returns
+    -------
+    dict
+        ``repo`` digest of the raw record and ``files`` signatures keyed by relative path.
+    """
+    previous_files = (previous or {}).get('files', {})
+    signatures = {}
+    for directory, filename in _repo_data_keys(repo['name']):
+        path = f'{directory}/{filename}'
+        signature = files.signature(directory, filename, previous_files.get(path))
+        if signature:
+            signatures[path] = signature
+    return {
+        'repo': hashlib.sha256(json.dumps(repo, sort_keys=True).encode()).hexdigest(),
+        'files': signatures,
+    }
+
+
+def _same_inputs(current: dict, previous: dict | None) -> bool:
+    if not previous or current['repo'] != previous.get('repo'):
+        return False
+    previous_digests = {path: signature[2] for path, signature in previous.get('files', {}).items()}
+    return {path: signature[2] for path, signature in current['files'].items()} == previous_digests
+
+
+def _load_manifest(data_dir: str) -> dict:
+    try:
+        with open(os.path.join(data_dir, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except Exception:
+        return {}
+
+
+def _series_format() -> str:
+    """
+    Return the configured time-series output format.
+
+    Returns
+    -------
+    str
+        ``SERIES_ROWS``, ``SERIES_COLUMNAR`` or ``SERIES_BOTH`` from ``DASHBOARD_SERIES_FORMAT``,
+        defaulting to ``SERIES_ROWS``.
+    """
+    series_format = (os.getenv('DASHBOARD_SERIES_FORMAT') or SERIES_ROWS).lower()
+    if series_format not in (SERIES_ROWS, SERIES_COLUMNAR, SERIES_BOTH):
+        log.warning(f'Invalid DASHBOARD_SERIES_FORMAT {series_format!r}, using {SERIES_ROWS}')
+        return SERIES_ROWS
+    return series_format
+
+
+def _columnar_series(name: str, rows: list, date_field: str, value_field: str) -> dict | None:
+    """
+    Convert one repository's time-series rows into parallel day-offset and value arrays.
+
+    Parameters
+    ----------
+    name : str
+        Repository name.
+    rows : list
+        Row-format records with ``date_field`` and ``value_field`` keys.
+    date_field : str
+        Key holding an ISO date or timestamp; only the UTC day is kept.
+    value_field : str
+        Key holding the value.
+
+    Returns
+    -------
+    dict | None
+        ``repo``, ``start`` ISO date, ``days`` gaps in days from the previous point (the first is 0), and
+        the values under ``value_field``; ``None`` when no row has a date.
+    """
+    points = sorted(
+        ((date.fromisoformat(str(row[date_field])[:10]), row[value_field]) for row in rows if row.get(date_field)),
+        key=lambda point: point[0],
+    )
+    if not points:
+        return None
+    ordinals = [day.toordinal() for day, _ in points]
+    return {
+        'repo': name,
+        'start': points[0][0].isoformat(),
+        'days': [0, *(current - previous for previous, current in zip(ordinals, ordinals[1:]))],
+        value_field: [value for _, value in points],
+    }
+
+
+def _rows_from_columnar(series: dict, date_field: str, value_field: str) -> list:
+    day = date.fromisoformat(series['start'])
+    rows = []
+    for offset, value in zip(series['days'], series[value_field]):
+        day += timedelta(days=offset)
+        rows.append({'repo': series['repo'], date_field: day.isoformat(), value_field: value})
+    return rows
+
+
+def _output_files(series_format: str) -> tuple[list, list]:
+    """
+    Return the outputs written as row files and as columnar files in a series format.
+
+    Parameters
+    ----------
+    series_format : str
+        ``SERIES_ROWS``, ``SERIES_COLUMNAR`` or ``SERIES_BOTH``.
+
+    Returns
+    -------
+    tuple[list, list]
+        Output names written to ``{output}.json`` and to ``{output}.columnar.json``.
+    """
+    row_outputs = [
+        output for output in ('repos', *ROW_OUTPUTS)
+        if output not in SERIES_OUTPUTS or series_format != SERIES_COLUMNAR
+    ]
+    columnar_outputs = list(SERIES_OUTPUTS) if series_format != SERIES_ROWS else []
+    return row_outputs, columnar_outputs
+
+
+def _remove_stale_outputs(data_dir: str, series_format: str) -> None:
+    """Delete the output files of formats a series format no longer writes."""
+    row_outputs, columnar_outputs = _output_files(series_format)
+    for output in SERIES_OUTPUTS:
+        stale = []
+        if output not in row_outputs:
+            stale.append(f'{output}.json')
+        if output not in columnar_outputs:
+            stale.append(f'{output}.columnar.json')
+        for filename in stale:
+            path = os.path.join(data_dir, filename)
+            if os.path.exists(path):
+                os.remove(path)
+                log.info(f'Removed: {path}')
+
+
+def _previous_outputs_exist(data_dir: str, series_format: str) -> bool:
+    """Return whether every output file written in a series format exists."""
+    row_outputs, columnar_outputs = _output_files(series_format)
+    filenames = [
+        'pr_metrics.json',
+        *(f'{output}.json' for output in row_outputs),
+        *(f'{output}.columnar.json' for output in columnar_outputs),
+    ]
+    return all(os.path.exists(os.path.join(data_dir, filename)) for filename in filenames)
+
+
+def _read_span(data_dir: str, filename: str, span: list | None) -> list:
+    """Read the elements a previous build wrote at ``span`` in an output array file."""
+    if not span:
+        return []
+    start, end = span
+    with open(os.path.join(data_dir, filename), 'rb') as f:
+        f.seek(start)
+        return json.loads(b'[' + f.read(end - start) + b']')
+
+
+def _previous_repo_outputs(data_dir: str, series_format: str, name: str, offsets: dict) -> dict:
+    """
+    Read one repository's rows from the previous build's outputs.
+
+    Only the repository's own span of each output file is read, so splicing an unchanged repository costs
+    roughly one repository's worth of memory.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory containing the dashboard data files.
+    series_format : str
+        Series format of the previous build.
+    name : str
+        Repository name.
+    offsets : dict
+        The repository's ``[start, end]`` spans keyed by output file name, from the previous manifest.
+
+    Returns
+    -------
+    dict
+        Rows keyed by output name: ``repos`` and each of ``ROW_OUTPUTS``.
+
+    Raises
+    ------
+    ValueError
+        If the previous build did not record the repository's entry.
+    """
+    if not offsets.get('repos.json'):
+        raise ValueError(f'No previous entry for {name}')
+    row_outputs, _columnar_outputs = _output_files(series_format)
+    outputs = {}
+    for output in ('repos', *ROW_OUTPUTS):
+        if output in row_outputs:
+            outputs[output] = _read_span(data_dir, f'{output}.json', offsets.get(f'{output}.json'))
+        else:
+            filename = f'{output}.columnar.json'
+            outputs[output] = [
+                row for series in _read_span(data_dir, filename, offsets.get(filename))
+                for row in _rows_from_columnar(series, *SERIES_OUTPUTS[output])
+            ]
+    return outputs
+
+
 def build():
     """
     Read raw data collected by updater.py and write dashboard-ready JSON files
@@ -259,59 +802,113 @@ def build():
         raw_repos = json.load(f)
 
     rtd_repos = _load_rtd_repos(BASE_DIR)
-    repos = []
-    prs_all = []
-    coverage_history = []
-    commit_activity = []
-    star_history = []
-    code_scanning_history = []
-    pr_metric_caches = {}
-
-    for repo in raw_repos:
-        if repo.get('private') or repo.get('archived'):
-            continue
-
-        name = repo['name']
-        coverage = _get_coverage(BASE_DIR, name)
-        coverage_hist = _collect_coverage_history(BASE_DIR, name)
-        coverage_history.extend(coverage_hist)
-        if not coverage and coverage_hist:
-            coverage = max(coverage_hist, key=lambda e: e.get('date', '')).get('coverage', 0.0)
-        languages = _get_languages(BASE_DIR, name)
-        prs = _get_prs(BASE_DIR, name)
-        issues = _get_issues(BASE_DIR, name)
-        commit_activity.extend(_get_commit_activity(BASE_DIR, name))
-        star_history.extend(_get_star_history(BASE_DIR, name))
-        code_scanning_open = _get_code_scanning_open(BASE_DIR, name)
-        code_scanning_history.extend(_get_code_scanning_history(BASE_DIR, name))
-        if pr_metrics.is_active_repo(repo):
-            pr_metric_caches[name] = pr_metrics.load_cache(BASE_DIR, name)
-
-        repos.append(_build_repo_entry(repo, coverage, languages, prs, issues, rtd_repos, code_scanning_open))
-        prs_all.extend({'repo': name, **pr} for pr in prs)
-
+    visible_repos = [repo for repo in raw_repos if not repo.get('private') and not repo.get('archived')]
     data_dir = os.path.join(TEMPLATE_DIR, 'assets', 'data')
     os.makedirs(data_dir, exist_ok=True)
 
+    files = DataFiles(BASE_DIR)
+    manifest = _load_manifest(data_dir)
+    series_format = _series_format()
+    global_signature = {
+        'version': BUILD_MANIFEST_VERSION,
+        'series_format': series_format,
+        'shards': bool(os.getenv('DASHBOARD_DATA_SHARDS')),
+        'readthedocs': (files.signature('readthedocs', 'projects.json') or [None, None, None])[2],
+    }
+    incremental = (
+        not os.getenv('DASHBOARD_FULL_BUILD')
+        and manifest.get('global') == global_signature
+        and _previous_outputs_exist(data_dir, series_format)
+    )
+    previous_repos = manifest.get('repos', {}) if incremental else {}
+
+    repo_signatures = {}
+    changed = set()
+    for repo in visible_repos:
+        name = repo['name']
+        repo_signatures[name] = _repo_signature(repo, files, manifest.get('repos', {}).get(name))
+        if 'offsets' not in previous_repos.get(name, {}) or not _same_inputs(
+                repo_signatures[name], previous_repos.get(name)):
+            changed.add(name)
+    log.info(f'Rebuilding {len(changed)} of {len(visible_repos)} repositories')
+
+    rewrite = not incremental or changed or list(previous_repos) != [repo['name'] for repo in visible_repos]
+    if not rewrite:
+        log.info('Repository data unchanged; keeping previous outputs')
+    now = datetime.now(timezone.utc)
+    shards = RepoShards(data_dir, now) if os.getenv('DASHBOARD_DATA_SHARDS') else None
+    metrics_engine = pr_metrics.MetricsEngine({}, now)
+    row_outputs, columnar_outputs = _output_files(series_format)
+    with ExitStack() as stack:
+        writers = {
+            f'{output}.json': (output, stack.enter_context(JsonArrayWriter(os.path.join(data_dir, f'{output}.json'))))
+            for output in (row_outputs if rewrite else ())
+        }
+        columnar_writers = {
+            f'{output}.columnar.json': (
+                output, stack.enter_context(JsonArrayWriter(os.path.join(data_dir, f'{output}.columnar.json'))))
+            for output in (columnar_outputs if rewrite else ())
+        }
+        pr_metrics_writer = (
+            stack.enter_context(JsonObjectWriter(os.path.join(data_dir, 'pr_metrics.json'))) if rewrite else None)
+        for position, repo in enumerate(visible_repos):
+            if position % PREFETCH_REPOS == 0:
+                files.prefetch([
+                    key for pending in visible_repos[position:position + PREFETCH_REPOS]
+                    for key in _repo_data_keys(pending['name'])
+                    if pending['name'] in changed
+                    or (key[0] == 'github/prMetrics' and pr_metrics.is_active_repo(pending))
+                ])
+            name = repo['name']
+            repo_outputs = {}
+            if name not in changed and (rewrite or shards):
+                try:
+                    repo_outputs = _previous_repo_outputs(
+                        data_dir, series_format, name, previous_repos[name]['offsets'])
+                except Exception as e:
+                    log.warning(f'Could not reuse previous outputs of {name}, rebuilding: {e}')
+                    changed.add(name)
+            if name in changed:
+                repo_outputs = _build_repo_outputs(repo, rtd_repos, files)
+            elif pr_metrics.is_active_repo(repo):
+                repo_outputs['pr_metrics'] = _get_pr_metric_cache(BASE_DIR, name, files)
+
+            offsets = {}
+            for filename, (output, writer) in writers.items():
+                offsets[filename] = writer.extend(repo_outputs[output])
+            for filename, (output, writer) in columnar_writers.items():
+                series = _columnar_series(name, repo_outputs[output], *SERIES_OUTPUTS[output])
+                offsets[filename] = writer.extend([series] if series else [])
+            repo_signatures[name]['offsets'] = (
+                {filename: span for filename, span in offsets.items() if span}
+                if rewrite else previous_repos[name]['offsets']
+            )
+            if 'pr_metrics' in repo_outputs:
+                cache = repo_outputs['pr_metrics']
+                metrics_engine.add(name, cache)
+                pr_metrics.write_repository_page(TEMPLATE_DIR, name, cache, now, metrics_engine)
+                if pr_metrics_writer:
+                    pr_metrics_writer.write((name, cache))
+            if shards:
+                shards.add(name, repo_outputs, name in changed)
+    if shards:
+        shards.close()
+    _remove_stale_outputs(data_dir, series_format)
+
     def write_json(filename, data):
         path = os.path.join(data_dir, filename)
         with open(path, 'w') as f:
             json.dump(data, f)
         log.info(f'Written: {path}')
 
-    write_json('repos.json', repos)
-    write_json('prs.json', prs_all)
-    write_json('coverage_history.json', coverage_history)
-    write_json('commit_activity.json', commit_activity)
-    write_json('star_history.json', star_history)
-    write_json('code_scanning_history.json', code_scanning_history)
-    write_json('pr_metrics.json', pr_metric_caches)
-    now = datetime.now(timezone.utc)
+    write_json('pr_metrics_summary.json', metrics_engine.summary())
+    write_json('pr_backlog_series.json', metrics_engine.series())
     write_json('metadata.json', {
         'updated_at': now.isoformat(),
-        'repo_count': len(repos),
+        'repo_count': len(visible_repos),
     })
-    pr_metrics.write_report_pages(TEMPLATE_DIR, pr_metric_caches, now)
+    pr_metrics.write_index_page(TEMPLATE_DIR, now, metrics_engine)
+    write_json(MANIFEST_FILE, {'global': global_signature, 'repos': repo_signatures})
 
     log.info('Dashboard build complete.')
 
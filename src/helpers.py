@@ -1,9 +1,16 @@
 # standard imports
+from contextlib import contextmanager
+from datetime import datetime
+import hashlib
 import json
 import os
 import pathlib
+import re
+from collections import deque
+from threading import BoundedSemaphore, Condition, Event, Lock, Thread, local
 import time
 from typing import Union
+from urllib.parse import urlsplit
 from urllib3 import Retry
 
 # lib imports
@@ -11,38 +18,683 @@ import cloudscraper
 from PIL import Image
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 # local imports
+from src import CACHE_DIR
 from src.logger import log
 
 # constants
 HTTPS = 'https://'
 DEFAULT_TIMEOUT = 30  # seconds
+HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+RATE_LIMIT_RESERVE = 50  # requests kept spare for retries and other jobs sharing a token
+RATE_LIMIT_PACE_FRACTION = 0.1  # start pacing when less than this share of the limit remains
+RATE_LIMIT_MAX_CONCURRENT = 20  # concurrent requests per host
+RATE_LIMIT_MAX_WAIT = 15 * 60  # seconds
+RATE_LIMIT_COST_SMOOTHING = 0.3  # weight of the latest point cost in each GraphQL query's running average
 BOT_ISSUE_AUTHOR_LOGINS = frozenset({
     'github-actions[bot]',
     'lizardbyte-bot',
     'renovate[bot]',
 })
 
+# per-thread state for steps run by a StepExecutor
+_step_context = local()
+
+
+class StepTimeoutError(TimeoutError):
+    """Raised when a step does not finish within its timeout."""
+
+
+class StepCancelledError(RuntimeError):
+    """Raised inside an abandoned step when it attempts further network or file work."""
+
+
+def raise_if_step_cancelled():
+    """
+    Stop the current step if its caller has already given up on it.
+
+    Steps run by ``StepExecutor`` keep running after a timeout because Python
+    threads cannot be killed. Shared helpers call this before issuing requests
+    or writing files, so abandoned work stops at its next checkpoint instead of
+    holding connections or overwriting newer results.
+    """
+    cancelled = getattr(_step_context, 'cancelled', None)
+    if cancelled is not None and cancelled.is_set():
+        raise StepCancelledError('Step was abandoned after timing out')
+
+
+class _StepTask:
+    """A single unit of work queued on a ``StepExecutor``."""
+
+    def __init__(self, func: callable):
+        self.func = func
+        self.cancelled = Event()
+        self.started = Event()
+        self.done = Event()
+        self.success = False
+        self.value = None
+
+    def run(self):
+        self.started.set()
+        if self.cancelled.is_set():
+            # abandoned while still queued, never start it
+            self.done.set()
+            return
+        _step_context.cancelled = self.cancelled
+        try:
+            self.value = self.func()
+            self.success = True
+        except Exception as e:
+            self.value = e
+        finally:
+            _step_context.cancelled = None
+            self.done.set()
+
+
+class StepExecutor:
+    """
+    A persistent pool of daemon worker threads that runs steps with a total timeout.
+
+    Worker threads are started on demand up to ``max_workers`` and reused for
+    every later step. A step's timeout starts when a worker picks it up, so time
+    spent queued behind other steps never counts against it. Queueing has its own
+    ``queue_timeout`` instead: a step no worker has picked up by then is skipped,
+    so abandoned steps holding every worker cannot hang the caller. When a step
+    times out it is marked as cancelled and ``raise_if_step_cancelled`` stops it
+    at its next request, file write, or paginated item. Per-step run, error,
+    timeout, and skip counts are kept in ``stats``.
+    """
+
+    def __init__(self, max_workers: int = 32, name: str = 'step', queue_timeout: float = None):
+        self.max_workers = max_workers
+        self.name = name
+        self.queue_timeout = queue_timeout
+        self.stats = {}
+        self._tasks = deque()
+        self._condition = Condition()
+        self._lock = Lock()
+        self._workers = 0
+        self._idle = 0
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                self._idle += 1
+                while not self._tasks:
+                    self._condition.wait()
+                task = self._tasks.popleft()
+                self._idle -= 1
+            task.run()
+
+    def _submit(self, task: _StepTask):
+        with self._condition:
+            self._tasks.append(task)
+            if len(self._tasks) > self._idle and self._workers < self.max_workers:
+                self._workers += 1
+                Thread(target=self._worker, name=f'{self.name}-{self._workers}', daemon=True).start()
+            self._condition.notify()
+
+    def _record(self, step: str, seconds: float, timed_out: bool, failed: bool, skipped: bool = False):
+        with self._lock:
+            stats = self.stats.setdefault(step, {'runs': 0, 'errors': 0, 'timeouts': 0, 'skipped': 0, 'seconds': 0.0})
+            stats['runs'] += 1
+            stats['errors'] += int(failed)
+            stats['timeouts'] += int(timed_out)
+            stats['skipped'] += int(skipped)
+            stats['seconds'] += seconds
+
+    def run(self, step: str, func: callable, timeout: float):
+        """
+        Run a callable on the pool and wait for its result.
+
+        Parameters
+        ----------
+        step : str
+            Step name used for the ``stats`` accounting.
+        func : callable
+            Function to run.
+        timeout : float
+            Maximum seconds the step may run once a worker has started it.
+
+        Returns
+        -------
+        any
+            The callable result.
+
+        Raises
+        ------
+        StepTimeoutError
+            When the step did not finish in time, or no worker picked it up
+            within ``queue_timeout``. The step is cancelled.
+        Exception
+            Any exception raised by the callable.
+        """
+        task = _StepTask(func)
+        self._submit(task)
+        if not task.started.wait(self.queue_timeout):
+            # every worker is busy, likely with abandoned steps; skip instead of hanging
+            task.cancelled.set()
+            self._record(step, 0.0, timed_out=False, failed=False, skipped=True)
+            raise StepTimeoutError(f'{step} was not started within {self.queue_timeout}s')
+        started = time.monotonic()
+        finished = task.done.wait(timeout)
+        self._record(step, time.monotonic() - started, timed_out=not finished, failed=finished and not task.success)
+
+        if not finished:
+            task.cancelled.set()
+            raise StepTimeoutError(f'{step} did not finish within {timeout}s')
+        if not task.success:
+            raise task.value
+        return task.value
+
+
+def iter_cancellable(iterable):
+    """
+    Yield items from an iterable, stopping if the current step has been abandoned.
+
+    PyGithub paginated lists fetch each page lazily while they are iterated, so
+    wrapping them stops a timed-out step before it requests another page.
+
+    Parameters
+    ----------
+    iterable
+        Any iterable, typically a PyGithub ``PaginatedList``.
+
+    Yields
+    ------
+    any
+        Items of ``iterable``.
+    """
+    for item in iterable:
+        raise_if_step_cancelled()
+        yield item
+
+
+def _auth_scope(headers: dict | None) -> str:
+    """
+    Return a stable identifier for the credentials in a set of request headers.
+
+    The ``Authorization`` value is hashed so tokens are never stored or logged.
+    """
+    authorization = CaseInsensitiveDict(headers or {}).get('Authorization') or ''
+    return hashlib.sha256(authorization.encode()).hexdigest() if authorization else 'anonymous'
+
+
+class HttpCache:
+    """
+    An on-disk, size-bounded store of response bodies and their HTTP validators.
+
+    Entries are keyed by URL, query parameters, ``Accept`` header, and a hash of
+    the ``Authorization`` header, so responses are never shared between tokens.
+    Each entry is a ``.json`` metadata file plus a ``.body`` file. When the total
+    size exceeds ``max_bytes`` the least recently used entries are removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._size = None
+
+    @staticmethod
+    def key(url: str, params, headers: dict) -> str:
+        """
+        Return the cache key for a GET request.
+
+        Parameters
+        ----------
+        url : str
+            Request URL.
+        params
+            Query parameters passed to requests.
+        headers : dict
+            Effective request headers.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the request and its auth scope.
+        """
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        scope = _auth_scope(headers)
+        accept = CaseInsensitiveDict(headers or {}).get('Accept') or ''
+        return hashlib.sha256(f'{scope}\n{accept}\n{full_url}'.encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.directory, key[:2], key)
+        return f'{base}.json', f'{base}.body'
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                meta_path = os.path.join(root, name)
+                body_path = f'{meta_path[:-5]}.body'
+                try:
+                    stat = os.stat(meta_path)
+                    size = stat.st_size + os.path.getsize(body_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, size, meta_path[:-5]))
+        return entries
+
+    def load(self, key: str) -> tuple[dict, bytes] | None:
+        """
+        Return the cached metadata and body for a key, if present.
+        """
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+        return meta, body
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """
+        Save a response that carries an ``ETag`` or ``Last-Modified`` validator.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'status_code': response.status_code,
+            'encoding': response.encoding,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() != 'set-cookie'},
+        }
+        body = response.content or b''
+        meta_path, body_path = self._paths(key)
+        pathlib.Path(os.path.dirname(meta_path)).mkdir(parents=True, exist_ok=True)
+
+        # write to temporary files first so concurrent readers never see partial entries
+        suffix = f'.{os.getpid()}.{id(response)}.tmp'
+        with open(f'{body_path}{suffix}', 'wb') as f:
+            f.write(body)
+        with open(f'{meta_path}{suffix}', 'w') as f:
+            json.dump(meta, f)
+        os.replace(f'{body_path}{suffix}', body_path)
+        os.replace(f'{meta_path}{suffix}', meta_path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _mtime, size, _base in self._entries())
+            else:
+                self._size += len(body)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        self._size = sum(size for _mtime, size, _base in entries)
+        target = self.max_bytes * 0.9
+        for _mtime, size, base in entries:
+            if self._size <= target:
+                break
+            for path in (f'{base}.json', f'{base}.body'):
+                pathlib.Path(path).unlink(missing_ok=True)
+            self._size -= size
+
+    @staticmethod
+    def to_response(meta: dict, body: bytes, not_modified: requests.Response) -> requests.Response:
+        """
+        Build a response from a cached entry after the server answered ``304``.
+
+        Fresh headers from the ``304`` response (such as rate-limit counters)
+        replace the cached ones.
+        """
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response.reason = 'OK'
+        response._content = body
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict(meta.get('headers') or {})
+        response.headers.update(not_modified.headers)
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
+
+
+class ConditionalRequestMixin:
+    """
+    Session mixin that revalidates GET requests against an ``HttpCache``.
+
+    Cached validators are sent as ``If-None-Match``/``If-Modified-Since``. A
+    ``304`` answer is turned back into the cached response, so callers keep
+    seeing a normal ``200`` with the full body.
+    """
+    http_cache: HttpCache | None = None
+
+    def request(self, method, url, *args, **kwargs):
+        cache = self.http_cache
+        if cache is None or args or str(method).upper() != 'GET' or kwargs.get('stream'):
+            return super().request(method, url, *args, **kwargs)
+
+        headers = {**self.headers, **(kwargs.get('headers') or {})}
+        key = cache.key(url, kwargs.get('params'), headers)
+        cached = cache.load(key)
+        if cached:
+            meta, body = cached
+            request_headers = dict(kwargs.get('headers') or {})
+            if meta.get('etag'):
+                request_headers.setdefault('If-None-Match', meta['etag'])
+            if meta.get('last_modified'):
+                request_headers.setdefault('If-Modified-Since', meta['last_modified'])
+            kwargs['headers'] = request_headers
+
+        response = super().request(method, url, **kwargs)
+        if response.status_code == 304 and cached:
+            return cache.to_response(meta, body, response)
+        if response.status_code == 200:
+            try:
+                cache.store(key, response)
+            except OSError as e:
+                log.warning(f'Could not cache response for {url}: {e}')
+        return response
+
+
+class RateLimitScheduler:
+    """
+    Share API budgets between every thread that uses the helper sessions.
+
+    Budgets are tracked per host, resource (``core``, ``search`` or ``graphql``)
+    and credential, from the ``X-RateLimit-*`` and ``Retry-After`` response
+    headers or from GraphQL ``rateLimit`` data passed to ``observe``. Requests
+    run unthrottled while the budget is healthy, are spaced out evenly once less
+    than ``pace_fraction`` of the limit remains, and pause until the reset time
+    when only ``reserve`` requests are left. GraphQL point costs are averaged
+    per query, so an expensive query does not throttle cheap ones. A per-host
+    semaphore bounds the number of concurrent requests to stay clear of
+    secondary rate limits.
+    """
+
+    def __init__(
+            self,
+            reserve: int = RATE_LIMIT_RESERVE,
+            pace_fraction: float = RATE_LIMIT_PACE_FRACTION,
+            max_concurrent: int = RATE_LIMIT_MAX_CONCURRENT,
+            max_wait: float = RATE_LIMIT_MAX_WAIT,
+    ):
+        self.reserve = reserve
+        self.pace_fraction = pace_fraction
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self.budgets = {}
+        self._lock = Lock()
+        self._semaphores = {}
+
+    @staticmethod
+    def key(url: str, headers: dict | None) -> tuple[str, str, str]:
+        """
+        Return the ``(host, resource, scope)`` budget key for a request.
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip('/')
+        if path.endswith('/graphql'):
+            resource = 'graphql'
+        elif path.startswith('/search/'):
+            resource = 'search'
+        else:
+            resource = 'core'
+        return parts.netloc.lower(), resource, _auth_scope(headers)
+
+    @staticmethod
+    def query_key(query: str | None) -> str | None:
+        """
+        Return the cost key for a GraphQL query document.
+
+        Alias and variable indices are dropped and repeated lines collapsed,
+        so aliased batches of the same query share a key whatever their size.
+        """
+        if not query:
+            return None
+        lines = {re.sub(r'\d+', '', line).strip() for line in query.splitlines()}
+        return hashlib.sha1('\n'.join(sorted(lines)).encode('utf-8')).hexdigest()[:16]
+
+    def _budget(self, key: tuple) -> dict:
+        return self.budgets.setdefault(key, {
+            'limit': None,
+            'remaining': None,
+            'reset': 0.0,
+            'pause_until': 0.0,
+            'next_at': 0.0,
+            'costs': {},
+        })
+
+    def delay(self, key: tuple, query: str | None = None) -> float:
+        """
+        Reserve a request slot for a budget and return how long to wait for it.
+
+        The slot is charged the average observed cost of the ``query`` key, or
+        one point for queries not seen yet and for REST requests.
+        """
+        now = time.time()
+        with self._lock:
+            budget = self.budgets.get(key)
+            if budget is None:
+                return 0.0
+            if budget['pause_until'] > now:
+                return budget['pause_until'] - now
+
+            remaining = budget['remaining']
+            cost = budget['costs'].get(query, 1)
+            if remaining is None or budget['reset'] <= now:
+                return 0.0
+            if remaining - cost < self.reserve:
+                budget['pause_until'] = budget['reset']
+                return budget['reset'] - now
+
+            budget['remaining'] = remaining - cost
+            limit = budget['limit'] or remaining
+            if remaining > limit * self.pace_fraction:
+                return 0.0
+
+            interval = (budget['reset'] - now) * cost / (remaining - self.reserve)
+            slot = max(now, budget['next_at'])
+            budget['next_at'] = slot + interval
+            return slot - now
+
+    def observe(
+            self,
+            key: tuple,
+            remaining: int | None,
+            reset: float | None,
+            limit: int | None = None,
+            cost: int | None = None,
+            query: str | None = None,
+    ) -> None:
+        """
+        Record the latest known budget for a key.
+
+        Parameters
+        ----------
+        key : tuple
+            Budget key from ``key``.
+        remaining : int or None
+            Requests or points left in the current window.
+        reset : float or None
+            Epoch seconds when the window resets.
+        limit : int or None
+            Size of the window, when known.
+        cost : int or None
+            Points the last request used, folded into the running average
+            assumed for the next requests with the same ``query`` key.
+        query : str or None
+            Cost key from ``query_key``.
+        """
+        with self._lock:
+            budget = self._budget(key)
+            if remaining is not None:
+                budget['remaining'] = remaining
+            if reset is not None:
+                budget['reset'] = reset
+            if limit is not None:
+                budget['limit'] = limit
+            if cost is not None:
+                average = budget['costs'].get(query)
+                if average is not None:
+                    cost = average + RATE_LIMIT_COST_SMOOTHING * (cost - average)
+                budget['costs'][query] = max(1, cost)
+
+    def observe_graphql(self, key: tuple, rate_limit: dict | None, query: str | None = None) -> None:
+        """
+        Record a budget from a GraphQL ``rateLimit { cost remaining resetAt limit }`` object.
+
+        Parameters
+        ----------
+        key : tuple
+            Budget key from ``key``.
+        rate_limit : dict or None
+            The ``rateLimit`` data of a GraphQL response.
+        query : str or None
+            Cost key from ``query_key`` for the query that returned it.
+        """
+        if not rate_limit:
+            return
+        reset_at = rate_limit.get('resetAt')
+        self.observe(
+            key,
+            rate_limit.get('remaining'),
+            datetime.fromisoformat(reset_at.replace('Z', '+00:00')).timestamp() if reset_at else None,
+            rate_limit.get('limit'),
+            rate_limit.get('cost'),
+            query,
+        )
+
+    def update(self, key: tuple, response: requests.Response) -> None:
+        """
+        Update a budget from a response's rate-limit headers.
+        """
+        headers = response.headers
+
+        def header_number(name: str) -> float | None:
+            try:
+                return float(headers[name])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        remaining = header_number('X-RateLimit-Remaining')
+        reset = header_number('X-RateLimit-Reset')
+        limit = header_number('X-RateLimit-Limit')
+        retry_after = header_number('Retry-After')
+
+        if remaining is not None or reset is not None or limit is not None:
+            self.observe(
+                key,
+                int(remaining) if remaining is not None else None,
+                reset,
+                int(limit) if limit is not None else None,
+            )
+
+        pause_until = None
+        if retry_after is not None:
+            pause_until = time.time() + retry_after
+        elif response.status_code in (403, 429) and remaining == 0 and reset:
+            pause_until = reset
+        if pause_until is not None:
+            log.warning(f'Rate limited by {key[0]} ({key[1]}), pausing requests for {pause_until - time.time():.0f}s')
+            with self._lock:
+                budget = self._budget(key)
+                budget['pause_until'] = max(budget['pause_until'], pause_until)
+
+    @contextmanager
+    def slot(self, key: tuple, query: str | None = None):
+        """
+        Wait until a request for ``key`` may be sent, holding a per-host concurrency slot.
+        """
+        wait = self.delay(key, query)
+        if wait > 0:
+            if wait > self.max_wait:
+                log.warning(f'Rate limit wait for {key[0]} ({key[1]}) capped at {self.max_wait}s')
+            time.sleep(min(wait, self.max_wait))
+
+        with self._lock:
+            semaphore = self._semaphores.setdefault(key[0], BoundedSemaphore(self.max_concurrent))
+        with semaphore:
+            yield
+
+
+class ScheduledRequestMixin:
+    """
+    Session mixin that routes every request through a shared ``RateLimitScheduler``.
+    """
+    scheduler: RateLimitScheduler | None = None
+
+    def request(self, method, url, *args, **kwargs):
+        scheduler = self.scheduler
+        if scheduler is None:
+            return super().request(method, url, *args, **kwargs)
+
+        key = scheduler.key(url, {**self.headers, **(kwargs.get('headers') or {})})
+        payload = kwargs.get('json')
+        query = scheduler.query_key(payload.get('query')) if isinstance(payload, dict) else None
+        with scheduler.slot(key, query):
+            response = super().request(method, url, *args, **kwargs)
+        scheduler.update(key, response)
+        return response
+
+
+def _http_cache_from_env() -> HttpCache | None:
+    """
+    Create the shared HTTP cache from ``DASHBOARD_HTTP_CACHE_DIR`` and ``DASHBOARD_HTTP_CACHE_MAX_BYTES``.
+
+    Returns
+    -------
+    HttpCache or None
+        The cache, or ``None`` when the configured size is zero or invalid.
+    """
+    try:
+        max_bytes = int(os.getenv('DASHBOARD_HTTP_CACHE_MAX_BYTES', HTTP_CACHE_MAX_BYTES))
+    except ValueError:
+        max_bytes = 0
+    if max_bytes <= 0:
+        return None
+    directory = os.getenv('DASHBOARD_HTTP_CACHE_DIR') or os.path.join(CACHE_DIR, 'http')
+    return HttpCache(directory=directory, max_bytes=max_bytes)
+
+
 # setup requests sessions
 retry_adapter = HTTPAdapter(max_retries=Retry(total=5, backoff_factor=1))
+http_cache = _http_cache_from_env()
+scheduler = RateLimitScheduler()
 
 
-class TimeoutSession(requests.Session):
+class TimeoutSession(ScheduledRequestMixin, ConditionalRequestMixin, requests.Session):
     """A requests.Session that applies a default timeout to every request."""
 
     def request(self, *args, **kwargs):
+        raise_if_step_cancelled()
         kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
         return super().request(*args, **kwargs)
 
 
+class CloudScraperSession(ScheduledRequestMixin, ConditionalRequestMixin, cloudscraper.CloudScraper):
+    """A CloudScraper session that shares the HTTP cache and rate-limit scheduler."""
+
+
 # cloudscraper session
-cs = cloudscraper.CloudScraper()  # CloudScraper inherits from requests.Session
+cs = CloudScraperSession()  # CloudScraper inherits from requests.Session
 cs.mount(HTTPS, retry_adapter)
+cs.http_cache = http_cache
+cs.scheduler = scheduler
 
 # requests session
 s = TimeoutSession()
 s.mount(HTTPS, retry_adapter)
+s.http_cache = http_cache
+s.scheduler = scheduler
 
 
 class RateLimitedSession(TimeoutSession):
@@ -71,6 +723,8 @@ class RateLimitedSession(TimeoutSession):
 # readthedocs rate-limited session (60 authenticated requests per minute)
 rtd_s = RateLimitedSession(calls_per_minute=60)
 rtd_s.mount(HTTPS, retry_adapter)
+rtd_s.http_cache = http_cache
+rtd_s.scheduler = scheduler
 
 
 def is_bot_issue_author(login: str | None, account_type: str | None = None) -> bool:
@@ -86,6 +740,41 @@ def is_bot_issue_author(login: str | None, account_type: str | None = None) -> b
     )
 
 
+def batch_by_cost(items: list, cost: callable, budget: float) -> list[list]:
+    """
+    Split items into consecutive batches whose summed cost stays within a budget.
+
+    Parameters
+    ----------
+    items : list
+        Items to split, kept in their original order.
+    cost : callable
+        Function returning the estimated cost of one item.
+    budget : float
+        Maximum summed cost per batch. An item that exceeds the budget on its
+        own is placed in a batch by itself.
+
+    Returns
+    -------
+    list
+        List of non-empty batches.
+    """
+    batches = []
+    batch = []
+    total = 0
+    for item in items:
+        item_cost = cost(item)
+        if batch and total + item_cost > budget:
+            batches.append(batch)
+            batch = []
+            total = 0
+        batch.append(item)
+        total += item_cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 def debug_print(
         *values: object,
         sep: Union[str, None] = ' ',
@@ -121,6 +810,7 @@ def save_image_from_url(file_path: str, file_extension: str, image_url: str, siz
 
     og_img_data = s.get(url=image_url).content
 
+    raise_if_step_cancelled()
     file_name_with_ext = f'{file_path}.{file_extension}'
     with open(file_name_with_ext, 'wb') as handler:
         handler.write(og_img_data)
@@ -149,6 +839,7 @@ def write_json_files(file_path: str, data: any):
 
     pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
 
+    raise_if_step_cancelled()
     with open(f'{file_path}.json', 'w') as f:
         json.dump(
             obj=data,
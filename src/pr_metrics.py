@@ -1,11 +1,14 @@
 """Collect, calculate, and render pull-request metrics."""
 
 # standard imports
+import heapq
 import json
+import math
 import os
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate
 from pathlib import Path
-from statistics import median
 from urllib.parse import quote_plus
 
 # local imports
@@ -13,11 +16,20 @@ from src import helpers
 
 GRAPHQL_URL = 'https://api.github.com/graphql'
 GITHUB_OWNER = 'LizardByte'
-CACHE_VERSION = 2
+CACHE_VERSION = 3
 HISTORY_DAYS = 365
 REPORT_DAYS = 90
+WINDOW_DAYS = (7, 30, REPORT_DAYS, HISTORY_DAYS)
 CACHE_MAX_AGE = timedelta(hours=24)
+FULL_REFRESH_AGE = timedelta(days=30)
+INCREMENTAL_OVERLAP = timedelta(hours=1)
 STALE_DAYS = 30
+SKETCH_ACCURACY = 0.01
+AGGREGATE_COUNTS = (
+    'open', 'ready', 'not_reviewed', 'awaiting_approval', 'changes_requested', 'stale', 'opened', 'merged',
+    'closed_unmerged', 'merged_without_review', 'merged_without_approval', 'additions', 'deletions',
+)
+AGGREGATE_LEAD_TIMES = ('merge_hours', 'review_hours', 'approval_hours')
 SEARCH_OPEN = 'is:open'
 SEARCH_READY = '-is:draft'
 SEARCH_DRAFT = 'is:draft'
@@ -35,8 +47,61 @@ REACTION_EMOJI = {
     'EYES': '👀',
 }
 
+PULL_REQUEST_PAGE_FRAGMENT = """
+fragment PullRequestPage on PullRequestConnection {
+  nodes {
+    number
+    title
+    url
+    state
+    isDraft
+    createdAt
+    updatedAt
+    closedAt
+    mergedAt
+    additions
+    deletions
+    changedFiles
+    reviewDecision
+    author { login __typename }
+    labels(first: 20) { pageInfo { hasNextPage } nodes { name } }
+    assignees(first: 10) { pageInfo { hasNextPage } nodes { login } }
+    milestone { title }
+    reviews(
+      first: 1
+      states: [APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED]
+    ) {
+      totalCount
+      nodes {
+        submittedAt
+      }
+    }
+    approvals: reviews(first: 1, states: [APPROVED]) {
+      nodes { submittedAt }
+    }
+    reactionGroups {
+      content
+      reactors(first: 1) { totalCount }
+    }
+  }
+  pageInfo {
+    endCursor
+    hasNextPage
+  }
+}
+"""
+# nodes requested per pull request: itself, reviews, approvals, labels, assignees, and 8 reaction groups
+PULL_REQUEST_NODE_COST = 1 + 1 + 1 + 20 + 10 + len(REACTION_EMOJI)
+# numbers-only page of 100 open pull requests
+OPEN_NUMBERS_NODE_COST = 100
+# first open page of 100 pull requests and the first open numbers page
+OPEN_PAGE_NODE_COST = 100 * PULL_REQUEST_NODE_COST + OPEN_NUMBERS_NODE_COST
+# plus the first completed page of 100 pull requests
+REPOSITORY_PAGES_NODE_COST = OPEN_PAGE_NODE_COST + 100 * PULL_REQUEST_NODE_COST
+
 PULL_REQUEST_QUERY = """
 query($owner: String!, $name: String!, $states: [PullRequestState!], $cursor: String) {
+  rateLimit { cost remaining resetAt limit }
   repository(owner: $owner, name: $name) {
     pullRequests(
       first: 100
@@ -44,47 +109,49 @@ query($owner: String!, $name: String!, $states: [PullRequestState!], $cursor: St
       states: $states
       orderBy: {field: UPDATED_AT, direction: DESC}
     ) {
-      nodes {
-        number
-        title
-        url
-        state
-        isDraft
-        createdAt
-        updatedAt
-        closedAt
-        mergedAt
-        additions
-        deletions
-        changedFiles
-        reviewDecision
-        author { login }
-        reviews(
-          first: 1
-          states: [APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED]
-        ) {
-          totalCount
-          nodes {
-            submittedAt
-          }
-        }
-        approvals: reviews(first: 1, states: [APPROVED]) {
-          nodes { submittedAt }
-        }
-        reactionGroups {
-          content
-          reactors(first: 1) { totalCount }
-        }
-      }
-      pageInfo {
-        endCursor
-        hasNextPage
-      }
+      ...PullRequestPage
+    }
+  }
+}
+""" + PULL_REQUEST_PAGE_FRAGMENT
+
+OPEN_NUMBERS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  rateLimit { cost remaining resetAt limit }
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, states: [OPEN]) {
+      nodes { number }
+      pageInfo { endCursor hasNextPage }
     }
   }
 }
 """
 
+REPOSITORY_OPEN_PAGE_BLOCK = """
+  r%(index)d: repository(owner: $owner%(index)d, name: $name%(index)d) {
+    open: pullRequests(first: 100, states: [OPEN], orderBy: {field: UPDATED_AT, direction: DESC}) {
+      ...PullRequestPage
+    }
+    open_numbers: pullRequests(first: 100, states: [OPEN]) {
+      nodes { number }
+      pageInfo { endCursor hasNextPage }
+    }
+  }"""
+
+REPOSITORY_PAGES_BLOCK = """
+  r%(index)d: repository(owner: $owner%(index)d, name: $name%(index)d) {
+    open: pullRequests(first: 100, states: [OPEN], orderBy: {field: UPDATED_AT, direction: DESC}) {
+      ...PullRequestPage
+    }
+    open_numbers: pullRequests(first: 100, states: [OPEN]) {
+      nodes { number }
+      pageInfo { endCursor hasNextPage }
+    }
+    completed: pullRequests(first: 100, states: [CLOSED, MERGED], orderBy: {field: UPDATED_AT, direction: DESC}) {
+      ...PullRequestPage
+    }
+  }"""
+
 
 def _parse_datetime(value: str | None) -> datetime | None:
     """Parse a GitHub timestamp into an aware datetime."""
@@ -122,12 +189,17 @@ def cache_path(base_dir: str, repository: str) -> str:
     return os.path.join(base_dir, 'github', 'prMetrics', os.path.basename(repository))
 
 
+def is_valid_cache(cache: object) -> bool:
+    """Return whether parsed JSON has the shape of a repository metrics cache."""
+    return isinstance(cache, dict) and isinstance(cache.get('pull_requests'), list)
+
+
 def load_cache(base_dir: str, repository: str) -> dict | None:
     """Load a valid repository metrics cache, returning ``None`` on failure."""
     try:
         with open(f'{cache_path(base_dir, repository)}.json') as cache_file:
             cache = json.load(cache_file)
-        if isinstance(cache, dict) and isinstance(cache.get('pull_requests'), list):
+        if is_valid_cache(cache):
             return cache
     except Exception:
         pass
@@ -150,11 +222,11 @@ def cache_is_fresh(cache: dict | None, now: datetime) -> bool:
         return False
 
 
-def _graphql_connection(session, headers: dict, variables: dict) -> dict:
-    """Request one pull-request connection page from GitHub GraphQL."""
+def _graphql_data(session, headers: dict, query: str, variables: dict) -> dict:
+    """Run a GitHub GraphQL query and return its ``data`` object, reporting its point cost to the session."""
     response = session.post(
         url=GRAPHQL_URL,
-        json={'query': PULL_REQUEST_QUERY, 'variables': variables},
+        json={'query': query, 'variables': variables},
         headers=headers,
     )
     try:
@@ -166,12 +238,55 @@ def _graphql_connection(session, headers: dict, variables: dict) -> dict:
         detail = payload.get('errors') or payload
         raise RuntimeError(f'GitHub GraphQL request failed: {detail}')
 
-    repository = (payload.get('data') or {}).get('repository')
+    data = payload.get('data') or {}
+    scheduler = getattr(session, 'scheduler', None)
+    if scheduler is not None:
+        key = scheduler.key(GRAPHQL_URL, {**session.headers, **headers})
+        scheduler.observe_graphql(key, data.get('rateLimit'), scheduler.query_key(query))
+    return data
+
+
+def _graphql_connection(session, headers: dict, variables: dict, query: str = PULL_REQUEST_QUERY) -> dict:
+    """Request one pull-request connection page from GitHub GraphQL."""
+    repository = _graphql_data(session, headers, query, variables).get('repository')
     if repository is None:
         raise RuntimeError('GitHub GraphQL response did not include the repository')
     return repository['pullRequests']
 
 
+def fetch_first_pages(
+        repositories: list,
+        headers: dict,
+        session,
+        open_only: frozenset = frozenset(),
+) -> dict[str, dict]:
+    """
+    Fetch the first open and completed PR pages of several repositories in one aliased query.
+
+    Pass each repository's pages to ``refresh_repository`` so only repositories with more
+    pages need their own requests. Repositories named in ``open_only`` have fresh caches
+    and only get their open page.
+    """
+    variables = {}
+    definitions = []
+    blocks = []
+    for index, repository in enumerate(repositories):
+        variables[f'owner{index}'] = repository.owner.login
+        variables[f'name{index}'] = repository.name
+        definitions.append(f'$owner{index}: String!, $name{index}: String!')
+        block = REPOSITORY_OPEN_PAGE_BLOCK if repository.name in open_only else REPOSITORY_PAGES_BLOCK
+        blocks.append(block % {'index': index})
+    query = 'query(%s) {\n  rateLimit { cost remaining resetAt limit }%s\n}\n%s' % (
+        ', '.join(definitions), ''.join(blocks), PULL_REQUEST_PAGE_FRAGMENT)
+
+    data = _graphql_data(session, headers, query, variables)
+    return {
+        repository.name: data[f'r{index}']
+        for index, repository in enumerate(repositories)
+        if data.get(f'r{index}')
+    }
+
+
 def _normalize_pull(repository: str, pull: dict) -> dict:
     """Convert a GraphQL pull-request node into the stable cache schema."""
     review_times = _review_timestamps(pull.get('reviews'))
@@ -187,6 +302,13 @@ def _normalize_pull(repository: str, pull: dict) -> dict:
         'state': (pull.get('state') or '').lower(),
         'draft': bool(pull.get('isDraft')),
         'author': author.get('login'),
+        'author_type': author.get('__typename'),
+        'labels': [label['name'] for label in (pull.get('labels') or {}).get('nodes') or []],
+        'assignees': [assignee['login'] for assignee in (pull.get('assignees') or {}).get('nodes') or []],
+        'summary_truncated': any(
+            ((pull.get(field) or {}).get('pageInfo') or {}).get('hasNextPage') for field in ('labels', 'assignees')
+        ),
+        'milestone': (pull.get('milestone') or {}).get('title'),
         'created_at': pull.get('createdAt'),
         'updated_at': pull.get('updatedAt'),
         'closed_at': pull.get('closedAt'),
@@ -228,18 +350,21 @@ def _fetch_connection(
         session,
         states: list[str],
         cutoff: datetime | None = None,
+        first_page: dict | None = None,
 ) -> list[dict]:
     """Fetch and normalize one state group, stopping once updated records cross the cutoff."""
     cursor = None
     pulls = []
+    connection = first_page
 
     while True:
-        connection = _graphql_connection(session, headers, {
-            'owner': repository.owner.login,
-            'name': repository.name,
-            'states': states,
-            'cursor': cursor,
-        })
+        if connection is None:
+            connection = _graphql_connection(session, headers, {
+                'owner': repository.owner.login,
+                'name': repository.name,
+                'states': states,
+                'cursor': cursor,
+            })
         reached_cutoff = False
         for pull in connection.get('nodes') or []:
             updated_at = _parse_datetime(pull.get('updatedAt'))
@@ -254,54 +379,270 @@ def _fetch_connection(
         cursor = page_info.get('endCursor')
         if not cursor:
             raise RuntimeError('GitHub GraphQL pagination did not return an end cursor')
+        connection = None
 
     return pulls
 
 
-def fetch_repository(repository, headers: dict, session, now: datetime) -> list[dict]:
-    """Fetch every open PR and one year of recently updated completed PRs."""
+def _fetch_open_numbers(repository, headers: dict, session, first_page: dict | None = None) -> set[int]:
+    """Return the numbers of every open PR from the numbers-only connection."""
+    cursor = None
+    numbers = set()
+    connection = first_page
+
+    while True:
+        if connection is None:
+            connection = _graphql_connection(session, headers, {
+                'owner': repository.owner.login,
+                'name': repository.name,
+                'cursor': cursor,
+            }, OPEN_NUMBERS_QUERY)
+        numbers.update(pull['number'] for pull in connection.get('nodes') or [])
+
+        page_info = connection.get('pageInfo') or {}
+        if not page_info.get('hasNextPage'):
+            return numbers
+        cursor = page_info.get('endCursor')
+        if not cursor:
+            raise RuntimeError('GitHub GraphQL pagination did not return an end cursor')
+        connection = None
+
+
+def fetch_open_pulls(
+        repository,
+        headers: dict,
+        session,
+        cached: list[dict] | None = None,
+        since: datetime | None = None,
+        first_pages: dict | None = None,
+) -> list[dict]:
+    """
+    Fetch the open PRs, refetching only those updated since ``since`` when a cache is given.
+
+    Cached open PRs that are still open keep their cached record; open-set membership comes
+    from the numbers-only connection, so closed PRs drop out without paging full records.
+    An open PR the cache has never seen falls back to refetching every open PR.
+    """
+    first_pages = first_pages or {}
+    if cached is None or since is None:
+        return _fetch_connection(repository, headers, session, ['OPEN'], first_page=first_pages.get('open'))
+
+    changed = _fetch_connection(repository, headers, session, ['OPEN'], since, first_pages.get('open'))
+    numbers = _fetch_open_numbers(repository, headers, session, first_pages.get('open_numbers'))
+    open_pulls = {
+        pull['number']: pull for pull in cached
+        if pull.get('state') == 'open' and pull['number'] in numbers
+    }
+    open_pulls.update((pull['number'], pull) for pull in changed)
+    if numbers - open_pulls.keys():
+        return _fetch_connection(repository, headers, session, ['OPEN'])
+    return list(open_pulls.values())
+
+
+def fetch_repository(
+        repository,
+        headers: dict,
+        session,
+        now: datetime,
+        since: datetime | None = None,
+        first_pages: dict | None = None,
+        cached: list[dict] | None = None,
+) -> list[dict]:
+    """
+    Fetch open PRs and completed PRs updated within the history window or since ``since``.
+
+    With ``since`` and the ``cached`` pull requests, open PRs are refreshed incrementally
+    through ``fetch_open_pulls``; otherwise every open PR is fetched.
+    """
     cutoff = now - timedelta(days=HISTORY_DAYS)
-    pulls = _fetch_connection(repository, headers, session, ['OPEN'])
-    pulls.extend(_fetch_connection(repository, headers, session, ['CLOSED', 'MERGED'], cutoff))
+    if since and since > cutoff:
+        cutoff = since
+    first_pages = first_pages or {}
+    pulls = fetch_open_pulls(repository, headers, session, cached, since, first_pages)
+    pulls.extend(_fetch_connection(
+        repository, headers, session, ['CLOSED', 'MERGED'], cutoff, first_page=first_pages.get('completed')))
     unique = {pull['number']: pull for pull in pulls}
     return sorted(unique.values(), key=lambda pull: pull.get('updated_at') or '', reverse=True)
 
 
-def refresh_repository(repository, base_dir: str, headers: dict, session, now: datetime | None = None) -> bool:
-    """Refresh one repository cache when stale, returning whether it was written."""
+def _incremental_since(cache: dict | None, now: datetime) -> datetime | None:
+    """Return the cutoff for merging into a cache, or ``None`` when it needs a full refresh."""
+    if (
+            not cache
+            or cache.get('cache_version') != CACHE_VERSION
+            or cache.get('history_days') != HISTORY_DAYS
+    ):
+        return None
+    try:
+        collected_at = _parse_datetime(cache.get('collected_at'))
+        if timedelta(0) <= now - collected_at < FULL_REFRESH_AGE:
+            return collected_at - INCREMENTAL_OVERLAP
+    except Exception:
+        pass
+    return None
+
+
+def _open_since(cache: dict) -> datetime | None:
+    """Return the cutoff for refetching a cache's open PRs, or ``None`` to refetch all of them."""
+    try:
+        return _parse_datetime(cache.get('open_collected_at') or cache.get('collected_at')) - INCREMENTAL_OVERLAP
+    except Exception:
+        return None
+
+
+def merge_pulls(cached: list[dict], fetched: list[dict], now: datetime) -> list[dict]:
+    """Merge refetched PRs into cached ones and prune completed PRs outside the history window."""
+    fetched_numbers = {pull['number'] for pull in fetched}
+    unique = {
+        pull['number']: pull for pull in cached
+        if pull.get('state') != 'open' or pull['number'] in fetched_numbers
+    }
+    unique.update((pull['number'], pull) for pull in fetched)
+
+    cutoff = now - timedelta(days=HISTORY_DAYS)
+    kept = [
+        pull for pull in unique.values()
+        if pull.get('state') == 'open' or (_parse_datetime(pull.get('updated_at')) or now) >= cutoff
+    ]
+    return sorted(kept, key=lambda pull: pull.get('updated_at') or '', reverse=True)
+
+
+def refresh_repository(
+        repository,
+        base_dir: str,
+        headers: dict,
+        session,
+        now: datetime | None = None,
+        first_pages: dict | None = None,
+) -> bool:
+    """
+    Refresh one repository cache, returning whether its completed PRs were refetched.
+
+    Open PRs are refreshed on every call because they are the source of ``github/pulls``;
+    with a cache, only those updated since its last open refresh are refetched.
+    Completed PRs are only refetched once the cache is stale; when a recent cache exists,
+    only those updated since its collection time are fetched and merged in.
+    ``first_pages`` from ``fetch_first_pages`` replace the first request of each connection.
+    """
     now = now or datetime.now(tz=timezone.utc)
     existing = load_cache(base_dir, repository.name)
-    if cache_is_fresh(existing, now):
-        return False
-
-    pulls = fetch_repository(repository, headers, session, now)
+    refreshed = not cache_is_fresh(existing, now)
+    if not refreshed:
+        # keep collected_at so the next stale refresh still fetches PRs completed since then
+        collected_at = existing['collected_at']
+        open_pulls = fetch_open_pulls(
+            repository, headers, session, existing['pull_requests'], _open_since(existing), first_pages)
+        pulls = merge_pulls(existing['pull_requests'], open_pulls, now)
+    else:
+        collected_at = now.isoformat()
+        since = _incremental_since(existing, now)
+        if since:
+            pulls = merge_pulls(
+                existing['pull_requests'],
+                fetch_repository(
+                    repository, headers, session, now, since, first_pages, existing['pull_requests']),
+                now,
+            )
+        else:
+            pulls = fetch_repository(repository, headers, session, now, first_pages=first_pages)
     helpers.write_json_files(
         file_path=cache_path(base_dir, repository.name),
         data={
             'repository': repository.name,
-            'collected_at': now.isoformat(),
+            'collected_at': collected_at,
+            'open_collected_at': now.isoformat(),
             'cache_version': CACHE_VERSION,
             'history_days': HISTORY_DAYS,
             'pull_requests': pulls,
         },
     )
-    return True
+    return refreshed
+
+
+def open_pull_summaries(cache: dict | None) -> list[dict]:
+    """Return a cache's open pull requests in the ``github/pulls`` summary schema."""
+    open_pulls = [pull for pull in (cache or {}).get('pull_requests', []) if pull.get('state') == 'open']
+    summaries = []
+    for pull in sorted(open_pulls, key=lambda item: item['number'], reverse=True):
+        author = pull.get('author')
+        if author and pull.get('author_type') == 'Bot':
+            author = f'{author}[bot]'
+        summaries.append({
+            'number': pull['number'],
+            'title': pull.get('title'),
+            'author': author,
+            'labels': pull.get('labels') or [],
+            'assignees': pull.get('assignees') or [],
+            'created_at': _isoformat(_parse_datetime(pull.get('created_at'))),
+            'updated_at': _isoformat(_parse_datetime(pull.get('updated_at'))),
+            'draft': bool(pull.get('draft')),
+            'milestone': pull.get('milestone'),
+        })
+    return summaries
 
 
-def _hours_between(start: str | None, end: str | None) -> float | None:
-    """Return elapsed hours between two timestamps."""
-    start_time = _parse_datetime(start)
-    end_time = _parse_datetime(end)
-    if not start_time or not end_time:
-        return None
-    return (end_time - start_time).total_seconds() / 3600
+class PullRecord:
+    """Compact pull request with timestamps pre-parsed to epoch seconds."""
+
+    __slots__ = (
+        'pull', 'open', 'draft', 'closed_unmerged', 'review_decision', 'review_count', 'created',
+        'updated', 'merged', 'closed', 'first_review', 'first_approval', 'additions', 'deletions',
+    )
+
+    def __init__(self, pull: dict):
+        self.pull = pull
+        self.open = pull.get('state') == 'open'
+        self.draft = bool(pull.get('draft'))
+        self.closed_unmerged = pull.get('state') == 'closed' and not pull.get('merged_at')
+        self.review_decision = pull.get('review_decision')
+        self.review_count = pull.get('review_count')
+        self.created = _epoch(pull.get('created_at'))
+        self.updated = _epoch(pull.get('updated_at'))
+        self.merged = _epoch(pull.get('merged_at'))
+        self.closed = _epoch(pull.get('closed_at'))
+        self.first_review = _epoch(pull.get('first_review_at'))
+        self.first_approval = _epoch(pull.get('first_approval_at'))
+        self.additions = int(pull.get('additions') or 0)
+        self.deletions = int(pull.get('deletions') or 0)
+
+
+class PendingPull:
+    """Read-only view of a ready pull request with its age and inactivity in days."""
+
+    __slots__ = ('pull', 'age_days', 'inactive_days')
+
+    def __init__(self, pull: dict, age_days: int, inactive_days: int):
+        self.pull = pull
+        self.age_days = age_days
+        self.inactive_days = inactive_days
+
+    def __getitem__(self, key: str):
+        if key in self.__slots__[1:]:
+            return getattr(self, key)
+        return self.pull[key]
+
+    def get(self, key: str, default=None):
+        """Return a field from the pending view or the underlying pull request."""
+        if key in self.__slots__[1:]:
+            return getattr(self, key)
+        return self.pull.get(key, default)
 
 
-def _percentile(values: list[float], percentile: float) -> float | None:
-    """Return a linearly interpolated percentile."""
-    if not values:
+def _epoch(value: str | None) -> int | None:
+    """Return a GitHub timestamp as whole epoch seconds."""
+    parsed = _parse_datetime(value)
+    return int(parsed.timestamp()) if parsed else None
+
+
+def pull_records(pulls: list) -> list[PullRecord]:
+    """Parse pull requests once into compact records, reusing existing records."""
+    return [pull if isinstance(pull, PullRecord) else PullRecord(pull) for pull in pulls]
+
+
+def _percentile(ordered: list[float], percentile: float) -> float | None:
+    """Return a linearly interpolated percentile of ascending values."""
+    if not ordered:
         return None
-    ordered = sorted(values)
     index = (len(ordered) - 1) * percentile
     lower = int(index)
     upper = min(lower + 1, len(ordered) - 1)
@@ -309,43 +650,107 @@ def _percentile(values: list[float], percentile: float) -> float | None:
     return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
 
 
-def _on_or_after(timestamp: str | None, cutoff: datetime) -> bool:
-    """Return whether a timestamp is present and on or after a cutoff."""
-    parsed = _parse_datetime(timestamp)
-    return parsed is not None and parsed >= cutoff
+class QuantileSketch:
+    """Mergeable log-bucket quantile sketch with bounded relative error."""
+
+    __slots__ = ('gamma', 'count', 'zero', 'bins', 'negative_bins')
+
+    def __init__(self, relative_accuracy: float = SKETCH_ACCURACY):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.count = 0
+        self.zero = 0
+        self.bins = {}
+        self.negative_bins = {}
+
+    @classmethod
+    def from_values(cls, values: list[float], relative_accuracy: float = SKETCH_ACCURACY) -> 'QuantileSketch':
+        """Build a sketch from raw values."""
+        sketch = cls(relative_accuracy)
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    def add(self, value: float) -> None:
+        """Record one value; negative values are bucketed by magnitude and zeros counted exactly."""
+        self.count += 1
+        if value == 0:
+            self.zero += 1
+            return
+        bins = self.bins if value > 0 else self.negative_bins
+        index = math.ceil(math.log(abs(value), self.gamma))
+        bins[index] = bins.get(index, 0) + 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Add another sketch with the same accuracy into this one."""
+        self.count += other.count
+        self.zero += other.zero
+        for bins, other_bins in ((self.bins, other.bins), (self.negative_bins, other.negative_bins)):
+            for index, count in other_bins.items():
+                bins[index] = bins.get(index, 0) + count
+
+    def _bucket_value(self, index: int) -> float:
+        """Return the estimate of the magnitudes recorded in a bucket."""
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def _value_at(self, rank: int) -> float:
+        """Return the bucket estimate of the value at a zero-based rank."""
+        seen = 0
+        for index in sorted(self.negative_bins, reverse=True):
+            seen += self.negative_bins[index]
+            if seen > rank:
+                return -self._bucket_value(index)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                break
+        return self._bucket_value(index)
+
+    def quantile(self, quantile: float) -> float | None:
+        """Return a linearly interpolated estimate of a quantile between 0 and 1."""
+        if not self.count or not 0 <= quantile <= 1:
+            return None
+        rank = (self.count - 1) * quantile
+        lower = int(rank)
+        lower_value = self._value_at(lower)
+        upper_value = self._value_at(min(lower + 1, self.count - 1))
+        return lower_value + (upper_value - lower_value) * (rank - lower)
 
 
-def _elapsed_values(pulls: list[dict], end_field: str) -> list[float]:
+def _lead_time_sketch(values: list[float] | QuantileSketch) -> QuantileSketch:
+    """Return a sketch for a repository's exact lead times or an existing sketch."""
+    return values if isinstance(values, QuantileSketch) else QuantileSketch.from_values(values)
+
+
+def _quantiles(values: list[float] | QuantileSketch) -> tuple[float | None, float | None]:
+    """Return the median and 75th percentile of sorted values or a sketch."""
+    if isinstance(values, QuantileSketch):
+        return values.quantile(0.5), values.quantile(0.75)
+    return _percentile(values, 0.5), _percentile(values, 0.75)
+
+
+def _elapsed_values(records: list[PullRecord], end_field: str) -> list[float]:
     """Return elapsed hours from PR creation to a selected event."""
-    elapsed_values = []
-    for pull in pulls:
-        elapsed = _hours_between(pull.get('created_at'), pull.get(end_field))
-        if elapsed is not None:
-            elapsed_values.append(elapsed)
-    return elapsed_values
-
-
-def _pending_pulls(ready_pulls: list[dict], now: datetime) -> list[dict]:
-    """Add age and inactivity values to ready pull requests."""
-    pending = []
-    ordered = sorted(
-        ready_pulls,
-        key=lambda item: (item.get('created_at') is None, item.get('created_at') or ''),
-    )
-    for pull in ordered:
-        created_at = _parse_datetime(pull.get('created_at'))
-        updated_at = _parse_datetime(pull.get('updated_at'))
-        pending.append({
-            **pull,
-            'age_days': (now - created_at).days if created_at else 0,
-            'inactive_days': (now - updated_at).days if updated_at else 0,
-        })
-    return pending
+    return [
+        (getattr(record, end_field) - record.created) / 3600
+        for record in records
+        if record.created is not None and getattr(record, end_field) is not None
+    ]
 
 
-def _is_not_reviewed(pull: dict) -> bool:
-    """Match GitHub's ``review:none`` current review-decision bucket."""
-    return pull.get('review_decision') is None
+def _pending_pulls(ordered: list[PullRecord], now: datetime) -> list[PendingPull]:
+    """Pair oldest-first ready pull requests with their age and inactivity."""
+    now_ts = now.timestamp()
+    return [
+        PendingPull(
+            record.pull,
+            int((now_ts - record.created) // 86400) if record.created is not None else 0,
+            int((now_ts - record.updated) // 86400) if record.updated is not None else 0,
+        )
+        for record in ordered
+    ]
 
 
 def _is_awaiting_approval(pull: dict) -> bool:
@@ -354,57 +759,259 @@ def _is_awaiting_approval(pull: dict) -> bool:
     return decision == 'REVIEW_REQUIRED' or (decision is None and bool(pull.get('review_count')))
 
 
-def calculate(pulls: list[dict], now: datetime, days: int = REPORT_DAYS) -> dict:
-    """Calculate current-backlog and completed-PR metrics."""
-    cutoff = _window_cutoff(now, days)
-    stale_cutoff = _window_cutoff(now, STALE_DAYS)
-    open_pulls = [pull for pull in pulls if pull.get('state') == 'open']
-    ready_pulls = [pull for pull in open_pulls if not pull.get('draft')]
-    merged_pulls = [pull for pull in pulls if _on_or_after(pull.get('merged_at'), cutoff)]
-    closed_unmerged = [
-        pull for pull in pulls
-        if pull.get('state') == 'closed'
-        and not pull.get('merged_at')
-        and _on_or_after(pull.get('closed_at'), cutoff)
-    ]
-    opened_pulls = [pull for pull in pulls if _on_or_after(pull.get('created_at'), cutoff)]
+def aggregate(pulls: list, now: datetime, days: int = REPORT_DAYS) -> dict:
+    """Return mergeable partial metrics: counts, sums, sorted lead times, and ready records."""
+    return window_aggregates(pulls, now, (days,))[days]
 
-    merge_hours = _elapsed_values(merged_pulls, 'merged_at')
-    review_hours = _elapsed_values(merged_pulls, 'first_review_at')
-    approval_hours = _elapsed_values(merged_pulls, 'first_approval_at')
-    completed_count = len(merged_pulls) + len(closed_unmerged)
 
-    return {
-        'days': days,
+def window_aggregates(pulls: list, now: datetime, windows: tuple[int, ...] = WINDOW_DAYS) -> dict[int, dict]:
+    """Return partial aggregates for several reporting windows from one sort of each event type."""
+    records = pull_records(pulls)
+    stale_cutoff = int(_window_cutoff(now, STALE_DAYS).timestamp())
+    open_pulls = [record for record in records if record.open]
+    ready_pulls = [record for record in open_pulls if not record.draft]
+    backlog = {
         'open': len(open_pulls),
-        'draft': len(open_pulls) - len(ready_pulls),
         'ready': len(ready_pulls),
-        'not_reviewed': sum(1 for pull in ready_pulls if _is_not_reviewed(pull)),
-        'awaiting_approval': sum(1 for pull in ready_pulls if _is_awaiting_approval(pull)),
+        'not_reviewed': sum(1 for record in ready_pulls if record.review_decision is None),
+        'awaiting_approval': sum(1 for record in ready_pulls if _is_awaiting_approval(record.pull)),
         'changes_requested': sum(
-            1 for pull in ready_pulls if pull.get('review_decision') == 'CHANGES_REQUESTED'
+            1 for record in ready_pulls if record.review_decision == 'CHANGES_REQUESTED'
         ),
         'stale': sum(
-            1 for pull in open_pulls
-            if (_parse_datetime(pull.get('updated_at')) or now) < stale_cutoff
+            1 for record in open_pulls
+            if record.updated is not None and record.updated < stale_cutoff
         ),
-        'opened': len(opened_pulls),
-        'merged': len(merged_pulls),
-        'closed_unmerged': len(closed_unmerged),
-        'merge_rate': (len(merged_pulls) / completed_count * 100) if completed_count else None,
-        'median_first_review_hours': median(review_hours) if review_hours else None,
-        'p75_first_review_hours': _percentile(review_hours, 0.75),
-        'median_first_approval_hours': median(approval_hours) if approval_hours else None,
-        'p75_first_approval_hours': _percentile(approval_hours, 0.75),
-        'median_merge_hours': median(merge_hours) if merge_hours else None,
-        'p75_merge_hours': _percentile(merge_hours, 0.75),
-        'merged_without_review': sum(1 for pull in merged_pulls if not pull.get('review_count')),
-        'merged_without_approval': sum(1 for pull in merged_pulls if not pull.get('first_approval_at')),
-        'additions': sum(int(pull.get('additions') or 0) for pull in merged_pulls),
-        'deletions': sum(int(pull.get('deletions') or 0) for pull in merged_pulls),
-        'pending': _pending_pulls(ready_pulls, now),
+        'ready_pulls': sorted(ready_pulls, key=_created_order),
+    }
+
+    created = sorted(record.created for record in records if record.created is not None)
+    closed_unmerged = sorted(
+        record.closed for record in records if record.closed_unmerged and record.closed is not None
+    )
+    merged_pulls = sorted(
+        (record for record in records if record.merged is not None),
+        key=lambda record: record.merged,
+    )
+    merged_times = [record.merged for record in merged_pulls]
+    prefix = {
+        'merged_without_review': [0, *accumulate(not record.review_count for record in merged_pulls)],
+        'merged_without_approval': [
+            0, *accumulate(record.first_approval is None for record in merged_pulls)],
+        'additions': [0, *accumulate(record.additions for record in merged_pulls)],
+        'deletions': [0, *accumulate(record.deletions for record in merged_pulls)],
     }
 
+    aggregates = {}
+    for days in windows:
+        cutoff = int(_window_cutoff(now, days).timestamp())
+        start = bisect_left(merged_times, cutoff)
+        in_window = merged_pulls[start:]
+        aggregates[days] = {
+            **backlog,
+            'opened': len(created) - bisect_left(created, cutoff),
+            'merged': len(in_window),
+            'closed_unmerged': len(closed_unmerged) - bisect_left(closed_unmerged, cutoff),
+            **{field: values[-1] - values[start] for field, values in prefix.items()},
+            'merge_hours': sorted(_elapsed_values(in_window, 'merged')),
+            'review_hours': sorted(_elapsed_values(in_window, 'first_review')),
+            'approval_hours': sorted(_elapsed_values(in_window, 'first_approval')),
+        }
+    return aggregates
+
+
+def _created_order(record: PullRecord) -> tuple:
+    """Sort key placing the oldest pull requests first and undated ones last."""
+    return record.created is None, record.created or 0
+
+
+def merge_aggregates(aggregates: list[dict]) -> dict:
+    """Combine partial aggregates without revisiting the underlying pull requests.
+
+    Lead times are merged into quantile sketches so organization totals never hold every raw value.
+    """
+    merged = {field: sum(part[field] for part in aggregates) for field in AGGREGATE_COUNTS}
+    for field in AGGREGATE_LEAD_TIMES:
+        sketch = QuantileSketch()
+        for part in aggregates:
+            sketch.merge(_lead_time_sketch(part[field]))
+        merged[field] = sketch
+    merged['ready_pulls'] = list(heapq.merge(*(part['ready_pulls'] for part in aggregates), key=_created_order))
+    return merged
+
+
+def summarize(partial: dict, now: datetime, days: int = REPORT_DAYS) -> dict:
+    """Turn a partial aggregate into the report metrics returned by ``calculate``."""
+    median_merge, p75_merge = _quantiles(partial['merge_hours'])
+    median_review, p75_review = _quantiles(partial['review_hours'])
+    median_approval, p75_approval = _quantiles(partial['approval_hours'])
+    completed_count = partial['merged'] + partial['closed_unmerged']
+    return {
+        'days': days,
+        'open': partial['open'],
+        'draft': partial['open'] - partial['ready'],
+        'ready': partial['ready'],
+        'not_reviewed': partial['not_reviewed'],
+        'awaiting_approval': partial['awaiting_approval'],
+        'changes_requested': partial['changes_requested'],
+        'stale': partial['stale'],
+        'opened': partial['opened'],
+        'merged': partial['merged'],
+        'closed_unmerged': partial['closed_unmerged'],
+        'merge_rate': (partial['merged'] / completed_count * 100) if completed_count else None,
+        'median_first_review_hours': median_review,
+        'p75_first_review_hours': p75_review,
+        'median_first_approval_hours': median_approval,
+        'p75_first_approval_hours': p75_approval,
+        'median_merge_hours': median_merge,
+        'p75_merge_hours': p75_merge,
+        'merged_without_review': partial['merged_without_review'],
+        'merged_without_approval': partial['merged_without_approval'],
+        'additions': partial['additions'],
+        'deletions': partial['deletions'],
+        'pending': _pending_pulls(partial['ready_pulls'], now),
+    }
+
+
+def calculate(pulls: list, now: datetime, days: int = REPORT_DAYS) -> dict:
+    """Calculate current-backlog and completed-PR metrics from pull dicts or records."""
+    return summarize(aggregate(pulls, now, days), now, days)
+
+
+def backlog_series(pulls: list, now: datetime, days: int = HISTORY_DAYS) -> dict:
+    """Return daily open and merged PR counts for the ``days`` UTC days ending on ``now``."""
+    records = pull_records(pulls)
+    first_day = int(now.timestamp()) // 86400 - days + 1
+    open_delta = [0] * (days + 1)
+    merged = [0] * days
+    for record in records:
+        if record.created is None:
+            continue
+        opened = max(record.created // 86400 - first_day, 0)
+        ends = [value for value in (record.closed, record.merged) if value is not None]
+        ended = min(ends) // 86400 - first_day if ends else days
+        if opened < days and opened <= ended and ended > 0:
+            open_delta[opened] += 1
+            open_delta[min(ended, days)] -= 1
+        if record.merged is not None and 0 <= record.merged // 86400 - first_day < days:
+            merged[record.merged // 86400 - first_day] += 1
+    return {'open': list(accumulate(open_delta[:days])), 'merged': merged}
+
+
+def _series_start(now: datetime, days: int) -> str:
+    """Return the ISO date of the first day in a backlog series."""
+    return (now.astimezone(timezone.utc) - timedelta(days=days - 1)).date().isoformat()
+
+
+class MetricsEngine:
+    """Compute each repository's metrics once and derive organization totals from them.
+
+    A repository's cache is released as soon as its metrics are derived, and ``add`` feeds repositories
+    one at a time, so callers never need to hold every cache at once. Lead-time sketches are rebuilt in
+    memory from the caches on every run and never persisted: each window ends at ``now``, so a sketch
+    stored by an earlier build would cover the wrong pull requests.
+    """
+
+    def __init__(
+            self,
+            caches: dict[str, dict | None],
+            now: datetime,
+            days: int = REPORT_DAYS,
+            windows: tuple[int, ...] = WINDOW_DAYS,
+    ):
+        self.caches = dict(caches)
+        self.repositories = list(self.caches)
+        self.now = now
+        self.days = days
+        self.windows = tuple(sorted({days, *windows}))
+        self._aggregates = {}
+        self._metrics = {}
+        self._totals = {}
+        self._series = {}
+        self._available = {}
+
+    def add(self, repository: str, cache: dict | None) -> None:
+        """Register one repository and derive its metrics right away, releasing its cache."""
+        self.repositories.append(repository)
+        self.caches[repository] = cache
+        self._totals.clear()
+        self._derive(repository)
+
+    def _derive(self, repository: str) -> None:
+        """Derive one repository's aggregates, metrics and daily series, then drop its cache.
+
+        Each window's exact metrics are summarized first; the memoized lead times are then
+        reduced to quantile sketches, so the engine holds bounded state per repository.
+        """
+        cache = self.caches.pop(repository, None)
+        records = pull_records(cache.get('pull_requests', []) if cache else [])
+        windows = window_aggregates(records, self.now, self.windows)
+        for days, partial in windows.items():
+            self._metrics[repository, days] = summarize(partial, self.now, days)
+            for field in AGGREGATE_LEAD_TIMES:
+                partial[field] = QuantileSketch.from_values(partial[field])
+        self._aggregates[repository] = windows
+        self._series[repository] = backlog_series(records, self.now)
+        self._available[repository] = cache is not None
+
+    def aggregates(self, repository: str) -> dict[int, dict]:
+        """Return the memoized partial aggregates of every window for one repository."""
+        if repository not in self._aggregates:
+            self._derive(repository)
+        return self._aggregates[repository]
+
+    def available(self, repository: str) -> bool:
+        """Return whether a repository had a metrics cache."""
+        self.aggregates(repository)
+        return self._available[repository]
+
+    def metrics(self, repository: str, days: int | None = None) -> dict:
+        """Return the memoized exact report metrics for one repository and window."""
+        self.aggregates(repository)
+        return self._metrics[repository, days or self.days]
+
+    def totals(self, days: int | None = None) -> dict:
+        """Return organization totals merged from the per-repository aggregates."""
+        days = days or self.days
+        if days not in self._totals:
+            merged = merge_aggregates([self.aggregates(repository)[days] for repository in self.repositories])
+            self._totals[days] = summarize(merged, self.now, days)
+        return self._totals[days]
+
+    def backlog_series(self, repository: str) -> dict:
+        """Return the memoized daily open and merged series for one repository."""
+        self.aggregates(repository)
+        return self._series[repository]
+
+    def series(self) -> dict:
+        """Return JSON-ready daily series per repository and summed across the organization."""
+        repositories = {repository: self.backlog_series(repository) for repository in self.repositories}
+        return {
+            'start': _series_start(self.now, HISTORY_DAYS),
+            'days': HISTORY_DAYS,
+            'totals': {
+                field: [sum(values) for values in zip(*(series[field] for series in repositories.values()))]
+                for field in ('open', 'merged')
+            },
+            'repositories': repositories,
+        }
+
+    def summary(self) -> dict:
+        """Return JSON-ready totals and per-repository metrics for every window, without pending lists."""
+        def compact(metrics: dict) -> dict:
+            return {key: value for key, value in metrics.items() if key != 'pending'}
+
+        return {
+            'generated_at': _isoformat(self.now),
+            'days': self.days,
+            'windows': list(self.windows),
+            'totals': {str(days): compact(self.totals(days)) for days in self.windows},
+            'repositories': {
+                repository: {str(days): compact(self.metrics(repository, days)) for days in self.windows}
+                for repository in self.repositories
+            },
+        }
+
 
 def _format_duration(hours: float | None) -> str:
     """Format an elapsed-hour metric for a report table."""
@@ -504,10 +1111,24 @@ def _pending_table(pending: list[dict]) -> list[str]:
     return lines
 
 
-def render_repository_page(repository: str, cache: dict | None, now: datetime) -> str:
+def _window_row(metrics: dict) -> str:
+    """Render one reporting window's completed-work summary row."""
+    return (
+        f"| {metrics['days']} d | {metrics['opened']} | {metrics['merged']} | {metrics['closed_unmerged']} | "
+        f"{_format_percent(metrics['merge_rate'])} | {_format_duration(metrics['median_merge_hours'])} | "
+        f"{_format_duration(metrics['p75_merge_hours'])} |"
+    )
+
+
+def render_repository_page(
+        repository: str,
+        cache: dict | None,
+        now: datetime,
+        engine: MetricsEngine | None = None,
+) -> str:
     """Render one repository's Jekyll Markdown report."""
-    pulls = cache.get('pull_requests', []) if cache else []
-    metrics = calculate(pulls, now)
+    engine = engine or MetricsEngine({repository: cache}, now)
+    metrics = engine.metrics(repository)
     collected_text = _format_collected_at(cache.get('collected_at') if cache else None)
     report_cutoff = _search_timestamp(_window_cutoff(now, REPORT_DAYS))
     stale_cutoff = _search_timestamp(_window_cutoff(now, STALE_DAYS))
@@ -585,6 +1206,13 @@ def render_repository_page(repository: str, cache: dict | None, now: datetime) -
         '',
         f"Merged changes: **+{metrics['additions']:,} / -{metrics['deletions']:,} lines**.",
         '',
+        '## Completed work by window',
+        '',
+        '| Window | Opened | Merged | Closed unmerged | Merge rate | Median merge | 75th percentile merge |',
+        '| ---: | ---: | ---: | ---: | ---: | ---: | ---: |',
+        *(_window_row(engine.metrics(repository, days)) for days in engine.windows),
+        SORTABLE_TABLE,
+        '',
         '## Longest-pending ready PRs',
         '',
     ])
@@ -594,14 +1222,14 @@ def render_repository_page(repository: str, cache: dict | None, now: datetime) -
     return '\n'.join(lines)
 
 
-def render_index_page(caches: dict[str, dict | None], now: datetime) -> str:
+def render_index_page(
+        caches: dict[str, dict | None],
+        now: datetime,
+        engine: MetricsEngine | None = None,
+) -> str:
     """Render the organization-wide Jekyll Markdown report."""
-    all_pulls = [
-        pull
-        for cache in caches.values()
-        for pull in (cache.get('pull_requests', []) if cache else [])
-    ]
-    totals = calculate(all_pulls, now)
+    engine = engine or MetricsEngine(caches, now)
+    totals = engine.totals()
     report_cutoff = _search_timestamp(_window_cutoff(now, REPORT_DAYS))
     stale_cutoff = _search_timestamp(_window_cutoff(now, STALE_DAYS))
     overview_links = {
@@ -639,10 +1267,9 @@ def render_index_page(caches: dict[str, dict | None], now: datetime) -> str:
         '| Repository | Open | Draft | Not reviewed | Awaiting approval | Stale | Merged | Median merge |',
         '| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: |',
     ]
-    repository_rows = []
-    for repository, cache in caches.items():
-        metrics = calculate(cache.get('pull_requests', []) if cache else [], now)
-        repository_rows.append((repository, metrics, cache is not None))
+    repository_rows = [
+        (repository, engine.metrics(repository), engine.available(repository)) for repository in engine.repositories
+    ]
     repository_rows.sort(key=lambda row: (-row[1]['open'], row[0].lower()))
 
     for repository, metrics, available in repository_rows:
@@ -672,20 +1299,42 @@ def render_index_page(caches: dict[str, dict | None], now: datetime) -> str:
     return '\n'.join(lines)
 
 
-def write_report_pages(template_dir: str, caches: dict[str, dict | None], now: datetime) -> None:
-    """Write the organization index and all repository report pages."""
+def write_repository_page(
+        template_dir: str,
+        repository: str,
+        cache: dict | None,
+        now: datetime,
+        engine: MetricsEngine,
+) -> None:
+    """Write one repository's report page."""
     report_dir = Path(template_dir) / 'pr-metrics'
     report_dir.mkdir(parents=True, exist_ok=True)
-    expected = {'index.md'}
-    for repository, cache in caches.items():
-        filename = f'{os.path.basename(repository)}.md'
-        expected.add(filename)
-        (report_dir / filename).write_text(
-            render_repository_page(repository, cache, now),
-            encoding='utf-8',
-        )
-    (report_dir / 'index.md').write_text(render_index_page(caches, now), encoding='utf-8')
+    (report_dir / f'{os.path.basename(repository)}.md').write_text(
+        render_repository_page(repository, cache, now, engine),
+        encoding='utf-8',
+    )
+
+
+def write_index_page(template_dir: str, now: datetime, engine: MetricsEngine) -> None:
+    """Write the organization index and remove pages of repositories the engine does not cover."""
+    report_dir = Path(template_dir) / 'pr-metrics'
+    report_dir.mkdir(parents=True, exist_ok=True)
+    (report_dir / 'index.md').write_text(render_index_page({}, now, engine), encoding='utf-8')
 
+    expected = {'index.md', *(f'{os.path.basename(repository)}.md' for repository in engine.repositories)}
     for existing in report_dir.glob('*.md'):
         if existing.name not in expected:
             existing.unlink()
+
+
+def write_report_pages(
+        template_dir: str,
+        caches: dict[str, dict | None],
+        now: datetime,
+        engine: MetricsEngine | None = None,
+) -> None:
+    """Write the organization index and all repository report pages."""
+    engine = engine or MetricsEngine(caches, now)
+    for repository, cache in caches.items():
+        write_repository_page(template_dir, repository, cache, now, engine)
+    write_index_page(template_dir, now, engine)
@@ -2,8 +2,10 @@
 import json
 import math
 import os
-from queue import Queue
-from datetime import datetime, timedelta, timezone
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
 from threading import Thread
 
 # lib imports
@@ -22,7 +24,74 @@ from src.logger import log
 COMMIT_ACTIVITY_READY = 'ready'
 COMMIT_ACTIVITY_PENDING = 'pending'
 COMMIT_ACTIVITY_FAILED = 'failed'
+COMMIT_ACTIVITY_BACKOFF = 5  # seconds
+COMMIT_ACTIVITY_DEADLINE = 300  # seconds
+COMMIT_ACTIVITY_MAX_BACKOFF = 60  # seconds
+COMMIT_ACTIVITY_WORKERS = 8
+GITHUB_REPO_STEP_QUEUE_TIMEOUT = 600
 GITHUB_REPO_STEP_TIMEOUT = 90
+GITHUB_REPO_STEP_WORKERS = 32
+GITHUB_REPO_WORKERS = 1
+GRAPHQL_NODE_BUDGET = 100_000
+PR_METRICS_WORKERS = 4
+INCREMENTAL_FULL_REFRESH = timedelta(days=7)
+INCREMENTAL_OVERLAP = timedelta(minutes=10)
+SNAPSHOT_PAGE_SIZE = 100
+STARGAZERS_PER_PAGE = 100
+STAR_HISTORY_EXACT = 'exact'
+STAR_HISTORY_SAMPLED = 'sampled'
+STAR_HISTORY_WORKERS = 8
+SNAPSHOT_LABELS = 20
+SNAPSHOT_ASSIGNEES = 10
+SNAPSHOT_PULLS_NODE_COST = SNAPSHOT_PAGE_SIZE * (1 + SNAPSHOT_LABELS + SNAPSHOT_ASSIGNEES)
+SNAPSHOT_NODE_COST = (
+    1
+    + SNAPSHOT_PAGE_SIZE  # languages
+    + SNAPSHOT_PAGE_SIZE * (1 + SNAPSHOT_LABELS + SNAPSHOT_ASSIGNEES)  # issues
+)
+REPOSITORY_SNAPSHOT_FRAGMENT = """
+fragment RepositorySnapshot on Repository {
+  openGraphImageUrl
+  defaultBranchRef { target { oid } }
+  languages(first: %(page)d, orderBy: {field: SIZE, direction: DESC}) {
+    pageInfo { hasNextPage }
+    edges { size node { name } }
+  }
+  issues(states: OPEN, first: %(page)d, orderBy: {field: CREATED_AT, direction: DESC}) {
+    pageInfo { hasNextPage }
+    nodes {
+      number
+      title
+      createdAt
+      updatedAt
+      author { login __typename }
+      labels(first: %(labels)d) { pageInfo { hasNextPage } nodes { name } }
+      assignees(first: %(assignees)d) { pageInfo { hasNextPage } nodes { login } }
+      milestone { title }
+    }
+  }
+}
+""" % {'page': SNAPSHOT_PAGE_SIZE, 'labels': SNAPSHOT_LABELS, 'assignees': SNAPSHOT_ASSIGNEES}
+# only selected for repositories whose open pulls do not come from the PR metrics caches
+REPOSITORY_PULLS_FRAGMENT = """
+fragment RepositoryPulls on Repository {
+  pullRequests(states: OPEN, first: %(page)d, orderBy: {field: CREATED_AT, direction: DESC}) {
+    pageInfo { hasNextPage }
+    nodes {
+      number
+      title
+      isDraft
+      createdAt
+      updatedAt
+      author { login __typename }
+      labels(first: %(labels)d) { pageInfo { hasNextPage } nodes { name } }
+      assignees(first: %(assignees)d) { pageInfo { hasNextPage } nodes { login } }
+      milestone { title }
+    }
+  }
+}
+""" % {'page': SNAPSHOT_PAGE_SIZE, 'labels': SNAPSHOT_LABELS, 'assignees': SNAPSHOT_ASSIGNEES}
+DEFAULT_BRANCH_SHAS_BATCH = 100
 COVERAGE_BADGE_COLOR_THRESHOLDS = (
     (90, 'brightgreen'),
     (70, 'green'),
@@ -31,6 +100,13 @@ COVERAGE_BADGE_COLOR_THRESHOLDS = (
     (10, 'orange'),
 )
 
+# shared pool for per-repository GitHub steps
+github_steps = helpers.StepExecutor(
+    max_workers=GITHUB_REPO_STEP_WORKERS, name='github-step', queue_timeout=GITHUB_REPO_STEP_QUEUE_TIMEOUT
+)
+# shared pool capping concurrent stargazer page requests across all repositories
+stargazer_pages = ThreadPoolExecutor(max_workers=STAR_HISTORY_WORKERS, thread_name_prefix='stargazers')
+
 
 def update_aur(aur_repos: list):
     """
@@ -368,6 +444,10 @@ def _run_github_repo_step(repo, step: str, func: callable, default=None, timeout
     """
     Run an optional per-repository GitHub step with a total timeout.
 
+    Steps run on the shared ``github_steps`` executor. A step that times out, or
+    waits longer than ``GITHUB_REPO_STEP_QUEUE_TIMEOUT`` for a free worker, is
+    cancelled, so it cannot write results after it has been skipped.
+
     Parameters
     ----------
     repo :
@@ -386,28 +466,28 @@ def _run_github_repo_step(repo, step: str, func: callable, default=None, timeout
     any
         The callable result, or ``default`` when the step fails.
     """
-    result_queue = Queue(maxsize=1)
-
-    def runner():
-        try:
-            result_queue.put((True, func()))
-        except Exception as e:
-            result_queue.put((False, e))
-
-    thread = Thread(target=runner, daemon=True)
-    thread.start()
-    thread.join(timeout=timeout)
-
-    if thread.is_alive():
-        log.warning(f'Timeout after {timeout}s while running GitHub {step} for {repo.name}, skipping.')
-        return default
+    try:
+        return github_steps.run(step, func, timeout)
+    except helpers.StepTimeoutError as e:
+        log.warning(f'Timeout while running GitHub {step} for {repo.name}: {e}, skipping.')
+    except Exception as e:
+        log.warning(f'Error running GitHub {step} for {repo.name}: {e}')
+    return default
 
-    success, value = result_queue.get()
-    if success:
-        return value
 
-    log.warning(f'Error running GitHub {step} for {repo.name}: {value}')
-    return default
+def _log_github_step_stats() -> None:
+    """
+    Log per-step run and timeout accounting for the shared GitHub step executor.
+    """
+    for step, stats in sorted(github_steps.stats.items()):
+        message = (
+            f"GitHub {step}: {stats['runs']} runs, {stats['errors']} errors, "
+            f"{stats['timeouts']} timeouts, {stats['skipped']} skipped, {stats['seconds']:.1f}s total"
+        )
+        if stats['timeouts'] or stats['skipped']:
+            log.warning(message)
+        else:
+            log.info(message)
 
 
 def _participation_to_commit_activity(participation: dict) -> list[dict]:
@@ -537,6 +617,7 @@ def _seed_star_history(repo, total: int, initial_samples: int) -> list[dict]:
     history = []
     stargazers = repo.get_stargazers_with_dates()
     for page_idx in pages_to_fetch:
+        helpers.raise_if_step_cancelled()
         try:
             page = stargazers.get_page(page_idx)
             if not page:
@@ -566,6 +647,10 @@ def _collect_star_history(repo, initial_samples: int = 5) -> list:
     star count, so **no additional API requests are made after the initial
     seed**.
 
+    When ``DASHBOARD_STAR_HISTORY_MODE`` is ``exact`` the history is instead
+    built from every stargazer by ``_collect_exact_star_history``, falling
+    back to the sampled history if the stargazers can't be listed.
+
     Parameters
     ----------
     repo :
@@ -584,6 +669,15 @@ def _collect_star_history(repo, initial_samples: int = 5) -> list:
         return []
 
     today = datetime.now(tz=timezone.utc).strftime('%Y-%m-%d')
+    if _star_history_mode() == STAR_HISTORY_EXACT:
+        history = _collect_exact_star_history(repo)
+        if history is not None:
+            if history and history[-1]['date'] == today:
+                history[-1]['stars'] = total
+            else:
+                history.append({'date': today, 'stars': total})
+            return history
+
     cache_path = os.path.join(BASE_DIR, 'github', 'starHistory', f'{repo.name}.json')
 
     existing = []
@@ -607,114 +701,481 @@ def _collect_star_history(repo, initial_samples: int = 5) -> list:
     return history
 
 
-def _fetch_code_scanning_alerts(repo) -> list:
+def _star_history_mode() -> str:
+    """
+    Return the configured star history mode.
+
+    Returns
+    -------
+    str
+        ``STAR_HISTORY_EXACT`` when ``DASHBOARD_STAR_HISTORY_MODE`` is set to
+        it, otherwise ``STAR_HISTORY_SAMPLED``.
+    """
+    mode = (os.getenv('DASHBOARD_STAR_HISTORY_MODE') or STAR_HISTORY_SAMPLED).lower()
+    if mode not in (STAR_HISTORY_SAMPLED, STAR_HISTORY_EXACT):
+        log.warning(f'Invalid DASHBOARD_STAR_HISTORY_MODE {mode!r}, using {STAR_HISTORY_SAMPLED}')
+        return STAR_HISTORY_SAMPLED
+    return mode
+
+
+def _star_history_cursor_path(repo) -> str:
     """
-    Fetch all code scanning alerts for a repository.
+    Build the path for a repository's exact star history cursor.
 
     Parameters
     ----------
-    repo
+    repo :
+        PyGithub Repository object.
+
+    Returns
+    -------
+    str
+        Path to the cursor JSON file.
+    """
+    return os.path.join(BASE_DIR, 'github', 'starHistoryCursors', f'{repo.name}.json')
+
+
+def _load_star_history_cursor(repo) -> dict | None:
+    """
+    Load a repository's exact star history cursor.
+
+    Parameters
+    ----------
+    repo :
         PyGithub Repository object.
 
     Returns
     -------
+    dict or None
+        Cursor with ``count``, ``anchor`` and ``series`` keys, or ``None`` when
+        it is missing or unreadable.
+    """
+    try:
+        with open(_star_history_cursor_path(repo)) as f:
+            cursor = json.load(f)
+        if cursor['count'] > 0 and cursor['anchor'] and cursor['series']:
+            return cursor
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _append_star_series(series: list, stargazers: list) -> None:
+    """
+    Extend a cumulative ``[date, stars]`` series with stargazers in starred order.
+
+    Parameters
+    ----------
+    series : list
+        Series to extend in place, one entry per day.
+    stargazers : list
+        Stargazer objects with ``starred_at``, oldest first.
+    """
+    stars = series[-1][1] if series else 0
+    for stargazer in stargazers:
+        stars += 1
+        day = stargazer.starred_at.strftime('%Y-%m-%d')
+        if series and series[-1][0] == day:
+            series[-1][1] = stars
+        else:
+            series.append([day, stars])
+
+
+def _fetch_stargazer_pages(repo, first_page: int, backfill_pages: int = 0):
+    """
+    Fetch stargazer pages from ``first_page`` until a page comes back short.
+
+    Pages known to exist are requested ``STAR_HISTORY_WORKERS`` at a time on
+    the shared ``stargazer_pages`` pool, which caps the concurrent requests of
+    all repositories together. Later pages are requested one at a time.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+    first_page : int
+        Zero-based index of the first page to fetch.
+    backfill_pages : int
+        Number of pages known to exist from ``first_page`` on.
+
+    Yields
+    ------
     list
-        List of alert objects, or an empty list when unavailable.
+        Stargazers of each batch of pages in starred order, oldest first.
+    """
+    stargazers = repo.get_stargazers_with_dates()
+    page = first_page
+    last_page = first_page + backfill_pages
+    while True:
+        helpers.raise_if_step_cancelled()
+        count = max(1, min(STAR_HISTORY_WORKERS, last_page - page))
+        pages = list(stargazer_pages.map(stargazers.get_page, range(page, page + count)))
+        page += count
+        yield [stargazer for batch in pages for stargazer in batch]
+        if len(pages[-1]) < STARGAZERS_PER_PAGE:
+            return
+
+
+def _collect_exact_star_history(repo) -> list | None:
     """
+    Build an exact cumulative star history from every stargazer.
+
+    The first run fetches every stargazer page in concurrent batches. The
+    cursor is saved after each batch, so a backfill cut short by the step
+    timeout resumes where it stopped on the next run. Later runs resume from
+    the persisted cursor and only fetch stargazers added since. The cursor
+    records how many stargazers were consumed and the login of the last one; if
+    that login moved because someone unstarred, the history is rebuilt.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+
+    Returns
+    -------
+    list or None
+        List of ``{date, stars}`` dicts, one per day on which stars were added,
+        or ``None`` when the stargazers could not be listed.
+    """
+    total_pages = max(1, math.ceil(repo.stargazers_count / STARGAZERS_PER_PAGE))
+    cursor = _load_star_history_cursor(repo)
+
+    def save(new_stargazers: list):
+        if new_stargazers:
+            _append_star_series(cursor['series'], new_stargazers)
+            cursor['count'] += len(new_stargazers)
+            cursor['anchor'] = new_stargazers[-1].user.login
+            helpers.write_json_files(file_path=os.path.splitext(_star_history_cursor_path(repo))[0], data=cursor)
+
     try:
-        alerts = list(repo.get_codescan_alerts())
-        return alerts
-    except GithubException as e:
-        if e.status == 404:
-            log.warning(f'No code scanning analysis for {repo.name}, skipping code scanning alerts.')
-        return []
+        if cursor:
+            anchor_index = cursor['count'] - 1
+            first_page = anchor_index // STARGAZERS_PER_PAGE
+            batches = _fetch_stargazer_pages(repo, first_page, total_pages - first_page)
+            stargazers = next(batches)
+            offset = anchor_index % STARGAZERS_PER_PAGE
+            if len(stargazers) > offset and stargazers[offset].user.login == cursor['anchor']:
+                save(stargazers[offset + 1:])
+            else:
+                cursor = None
+        if not cursor:
+            cursor = {'count': 0, 'anchor': None, 'series': []}
+            batches = _fetch_stargazer_pages(repo, 0, total_pages)
+        for stargazers in batches:
+            save(stargazers)
+    except helpers.StepCancelledError:
+        raise
+    except Exception as e:
+        log.warning(f'Error listing stargazers for {repo.name}, using sampled star history: {e}')
+        return None
 
+    return [{'date': day, 'stars': stars} for day, stars in cursor['series']]
 
-def _alert_dates(alert) -> set:
+
+def _code_scanning_table_path(repo) -> str:
     """
-    Return the set of YYYY-MM-DD strings that are significant for an alert.
+    Build the path for a repository's compact code scanning alert table.
 
     Parameters
     ----------
-    alert :
-        Code scanning alert object.
+    repo :
+        PyGithub Repository object.
 
     Returns
     -------
-    set
-        Dates on which the alert was created, dismissed, or fixed.
+    str
+        Path to the alert table JSON file.
     """
-    dates = set()
-    for attr in ('created_at', 'dismissed_at', 'fixed_at'):
-        dt = getattr(alert, attr, None)
-        if dt:
-            dates.add(dt.strftime('%Y-%m-%d'))
-    return dates
+    return os.path.join(BASE_DIR, 'github', 'codeScanningAlerts', f'{repo.name}.json')
 
 
-def _alert_open_on(alert, date: str) -> bool:
+def _alert_row(alert) -> dict:
     """
-    Return whether an alert was open at the end of a given date.
+    Return the compact alert table row for a code scanning alert.
+    """
+    created, dismissed, fixed = _alert_days(alert)
+    return {
+        'number': alert.number,
+        'state': alert.state,
+        'created': created.isoformat() if created else None,
+        'dismissed': dismissed.isoformat() if dismissed else None,
+        'fixed': fixed.isoformat() if fixed else None,
+    }
+
+
+def _load_code_scanning_table(repo) -> tuple[dict | None, datetime | None]:
+    """
+    Load a repository's alert table and the time to fetch changed alerts since.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+
+    Returns
+    -------
+    tuple
+        Alert rows keyed by number and the ``since`` cutoff, or ``(None, None)``
+        when the table is missing, unreadable, or older than
+        ``INCREMENTAL_FULL_REFRESH``.
+    """
+    try:
+        with open(_code_scanning_table_path(repo)) as f:
+            table = json.load(f)
+        updated_at = datetime.fromisoformat(table['updated_at'])
+        rows = {row['number']: row for row in table['alerts']}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+    if datetime.now(tz=timezone.utc) - updated_at > INCREMENTAL_FULL_REFRESH:
+        return None, None
+    return rows, updated_at - INCREMENTAL_OVERLAP
+
+
+def _fetch_code_scanning_alerts(repo) -> list:
+    """
+    Update and return a repository's compact code scanning alert table.
+
+    Only alerts updated since the previous run are fetched and merged into the
+    table persisted at ``github/codeScanningAlerts/<repo>.json``. The full
+    alert history is fetched when there is no usable table.
+
+    Parameters
+    ----------
+    repo
+        PyGithub Repository object.
+
+    Returns
+    -------
+    list
+        Alert table rows with ``number``, ``state``, ``created``,
+        ``dismissed`` and ``fixed`` keys, or an empty list when unavailable.
+    """
+    updated_at = datetime.now(tz=timezone.utc)
+    rows, since = _load_code_scanning_table(repo)
+    try:
+        if rows is None:
+            rows = {alert.number: _alert_row(alert) for alert in helpers.iter_cancellable(repo.get_codescan_alerts())}
+        else:
+            for alert in helpers.iter_cancellable(repo.get_codescan_alerts(sort='updated', direction='desc')):
+                if alert.updated_at and alert.updated_at < since:
+                    break
+                rows[alert.number] = _alert_row(alert)
+    except GithubException as e:
+        if e.status == 404:
+            log.warning(f'No code scanning analysis for {repo.name}, skipping code scanning alerts.')
+        return []
+
+    alerts = sorted(rows.values(), key=lambda row: row['number'], reverse=True)
+    helpers.write_json_files(
+        file_path=os.path.splitext(_code_scanning_table_path(repo))[0],
+        data={'updated_at': updated_at.isoformat(), 'alerts': alerts},
+    )
+    return alerts
+
+
+def _alert_days(alert) -> tuple:
+    """
+    Return the created, dismissed, and fixed days of an alert.
 
     Parameters
     ----------
     alert :
-        Code scanning alert object.
-    date : str
-        Date string in YYYY-MM-DD format.
+        Code scanning alert object or alert table row.
 
     Returns
     -------
-    bool
-        True when the alert was created on or before ``date`` and had not yet
-        been dismissed or fixed by the end of ``date``.
+    tuple
+        ``(created, dismissed, fixed)`` as ``date`` objects, or ``None`` for
+        timestamps the alert doesn't have.
     """
-    created = getattr(alert, 'created_at', None)
-    if not created or created.strftime('%Y-%m-%d') > date:
-        return False
-    dismissed = getattr(alert, 'dismissed_at', None)
-    if dismissed and dismissed.strftime('%Y-%m-%d') <= date:
-        return False
-    fixed = getattr(alert, 'fixed_at', None)
-    if fixed and fixed.strftime('%Y-%m-%d') <= date:
-        return False
-    return True
+    if isinstance(alert, dict):
+        return tuple(
+            date.fromisoformat(alert[key]) if alert.get(key) else None
+            for key in ('created', 'dismissed', 'fixed')
+        )
+    return tuple(
+        dt.date() if dt else None
+        for dt in (getattr(alert, attr, None) for attr in ('created_at', 'dismissed_at', 'fixed_at'))
+    )
 
 
-def _build_code_scanning_history(alerts: list) -> list[dict]:
+def _build_code_scanning_history(alerts: list, fill_gaps: bool = False) -> list[dict]:
     """
     Build a complete daily history of open code scanning alert counts.
 
     For each date on which any alert was created, dismissed, or fixed the open
     count is computed as the number of alerts that were created on or before
     that date and had not yet been dismissed or fixed by the end of that date.
+    Each alert contributes a +1 on its creation day and a -1 on the day it was
+    first dismissed or fixed, so the counts are a running sum over the sorted
+    event days.
 
     Parameters
     ----------
     alerts : list
-        List of code scanning alert objects.  Each object must expose
-        ``created_at`` (datetime) and optionally ``dismissed_at`` and
-        ``fixed_at`` (datetime or None).
+        List of code scanning alert objects or alert table rows.  Each object
+        must expose ``created_at`` (datetime) and optionally ``dismissed_at``
+        and ``fixed_at`` (datetime or None).
+    fill_gaps : bool
+        Emit a record for every day between the first and last event instead
+        of only the days on which something changed.
 
     Returns
     -------
     list
         Sorted list of ``{date, open}`` records.
     """
-    dates = set()
+    deltas = {}
     for alert in alerts:
-        dates |= _alert_dates(alert)
+        created, *closed = _alert_days(alert)
+        closed = [day for day in closed if day]
+        for day in closed:
+            deltas.setdefault(day, 0)
+        if not created:
+            continue
 
-    if not dates:
+        deltas.setdefault(created, 0)
+        end = min(closed, default=None)
+        if end is None or end > created:
+            deltas[created] += 1
+            if end is not None:
+                deltas[end] -= 1
+
+    if not deltas:
         return []
 
-    return [
-        {'date': date, 'open': sum(1 for a in alerts if _alert_open_on(a, date))}
-        for date in sorted(dates)
-    ]
+    days = sorted(deltas)
+    if fill_gaps:
+        days = [days[0] + timedelta(days=offset) for offset in range((days[-1] - days[0]).days + 1)]
+
+    history = []
+    open_count = 0
+    for day in days:
+        open_count += deltas.get(day, 0)
+        history.append({'date': day.isoformat(), 'open': open_count})
+    return history
+
+
+def _incremental_cursor_path(repo) -> str:
+    """
+    Build the path for a repository's incremental collection cursors.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+
+    Returns
+    -------
+    str
+        Path to the cursor JSON file.
+    """
+    return os.path.join(BASE_DIR, 'github', 'incrementalCursors', f'{repo.name}.json')
+
+
+def _load_incremental_state(repo, kind: str) -> tuple[list | None, datetime | None]:
+    """
+    Load previously collected open items and the time to collect changes since.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+    kind : str
+        Data directory under ``github``, either ``pulls`` or ``issues``.
+
+    Returns
+    -------
+    tuple
+        Cached items and the ``since`` cutoff, or ``(None, None)`` when a full
+        refresh is needed because the cache is missing, unreadable, or older
+        than ``INCREMENTAL_FULL_REFRESH``.
+    """
+    try:
+        with open(_incremental_cursor_path(repo)) as f:
+            collected_at = datetime.fromisoformat(json.load(f)[kind])
+        with open(os.path.join(BASE_DIR, 'github', kind, f'{repo.name}.json')) as f:
+            items = json.load(f)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+    if not isinstance(items, list) or datetime.now(tz=timezone.utc) - collected_at > INCREMENTAL_FULL_REFRESH:
+        return None, None
+    return items, collected_at - INCREMENTAL_OVERLAP
+
+
+def _save_incremental_cursor(repo, kind: str, collected_at: datetime) -> None:
+    """
+    Record when a repository's open pulls or issues were last fully up to date.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+    kind : str
+        Data directory under ``github``, either ``pulls`` or ``issues``.
+    collected_at : datetime
+        Time the collection started.
+    """
+    path = _incremental_cursor_path(repo)
+    try:
+        with open(path) as f:
+            cursors = json.load(f)
+    except (OSError, ValueError):
+        cursors = {}
+    if not isinstance(cursors, dict):
+        cursors = {}
+
+    cursors[kind] = collected_at.isoformat()
+    helpers.write_json_files(file_path=os.path.splitext(path)[0], data=cursors)
 
 
-def _collect_open_pulls(repo) -> list[dict]:
+def _merge_open_items(cached: list, changes: list[tuple[int, dict | None]]) -> list[dict]:
+    """
+    Apply changed items to cached open items, dropping the ones that closed.
+
+    Parameters
+    ----------
+    cached : list
+        Previously collected open item summaries.
+    changes : list
+        ``(number, summary)`` pairs, where ``summary`` is ``None`` for items
+        that are no longer open.
+
+    Returns
+    -------
+    list
+        Open item summaries, newest first.
+    """
+    items = {item['number']: item for item in cached}
+    for number, summary in changes:
+        if summary is None:
+            items.pop(number, None)
+        else:
+            items[number] = summary
+    return sorted(items.values(), key=lambda item: item['number'], reverse=True)
+
+
+def _pull_summary(pr) -> dict:
+    """
+    Return the cached summary fields for a pull request.
+    """
+    return {
+        'number': pr.number,
+        'title': pr.title,
+        'author': pr.user.login,
+        'labels': [label.name for label in pr.labels],
+        'assignees': [assignee.login for assignee in pr.assignees],
+        'created_at': pr.created_at.isoformat(),
+        'updated_at': pr.updated_at.isoformat(),
+        'draft': pr.draft,
+        'milestone': pr.milestone.title if pr.milestone else None,
+    }
+
+
+def _collect_open_pulls(repo, cached: list | None = None, since: datetime | None = None) -> list[dict]:
     """
     Fetch open pull request summary data for a repository.
 
@@ -722,46 +1183,148 @@ def _collect_open_pulls(repo) -> list[dict]:
     ----------
     repo :
         PyGithub Repository object.
+    cached : list or None
+        Previously collected open pulls. When given together with ``since``,
+        only pulls updated after ``since`` are fetched and merged in.
+    since : datetime or None
+        Cutoff for the incremental refresh.
 
     Returns
     -------
     list
         Pull request summary dictionaries.
     """
-    pulls_data = []
-    for pr in repo.get_pulls(state='open'):
-        pulls_data.append({
-            'number': pr.number,
-            'title': pr.title,
-            'author': pr.user.login,
-            'labels': [label.name for label in pr.labels],
-            'assignees': [assignee.login for assignee in pr.assignees],
-            'created_at': pr.created_at.isoformat(),
-            'updated_at': pr.updated_at.isoformat(),
-            'draft': pr.draft,
-            'milestone': pr.milestone.title if pr.milestone else None,
-        })
-    return pulls_data
+    if cached is None or since is None:
+        return [_pull_summary(pr) for pr in helpers.iter_cancellable(repo.get_pulls(state='open'))]
 
+    changes = []
+    for pr in helpers.iter_cancellable(repo.get_pulls(state='all', sort='updated', direction='desc')):
+        if pr.updated_at < since:
+            break
+        changes.append((pr.number, _pull_summary(pr) if pr.state == 'open' else None))
+    return _merge_open_items(cached, changes)
 
-def _collect_pr_metrics(repos: list, headers: dict) -> None:
-    """Refresh cached pull-request metrics for active dashboard repositories."""
-    for repo in tqdm(
-            iterable=repos,
-            desc='Collecting GitHub PR metrics',
+
+def _refresh_pr_metrics(repo, headers: dict, first_pages: dict | None = None) -> list[dict] | None:
+    """
+    Refresh a repository's PR metrics cache and return its current open pulls.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+    first_pages : dict or None
+        Prefetched first pull request pages for the repository.
+
+    Returns
+    -------
+    list or None
+        Open pull request summaries from the cache, or ``None`` when no valid
+        cache exists or an open pull request has more labels or assignees than
+        the metrics query selects.
+    """
+    pr_metrics.refresh_repository(repo, BASE_DIR, headers, helpers.s, first_pages=first_pages)
+    cache = pr_metrics.load_cache(BASE_DIR, repo.name)
+    if cache is None or any(
+            pull.get('state') == 'open' and pull.get('summary_truncated') for pull in cache['pull_requests']
     ):
-        _run_github_repo_step(
+        return None
+    return pr_metrics.open_pull_summaries(cache)
+
+
+def _prefetch_pr_metric_pages(repos: list, headers: dict) -> dict:
+    """
+    Fetch the first pull request pages of PR metrics repositories in bulk.
+
+    Repositories are packed into aliased GraphQL queries sized so the
+    estimated node count of each query stays within ``GRAPHQL_NODE_BUDGET``.
+    Repositories with a fresh cache only need their open page, which is
+    refetched on every run. A failed batch is logged and its repositories
+    fetch their own pages.
+
+    Parameters
+    ----------
+    repos : list
+        Active PyGithub Repository objects.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+
+    Returns
+    -------
+    dict
+        Mapping of repository name to its first ``open`` and, for stale caches,
+        ``completed`` pages.
+    """
+    now = datetime.now(tz=timezone.utc)
+    fresh = frozenset(
+        repo.name for repo in repos
+        if pr_metrics.cache_is_fresh(pr_metrics.load_cache(BASE_DIR, repo.name), now)
+    )
+
+    def cost(repo) -> int:
+        return pr_metrics.OPEN_PAGE_NODE_COST if repo.name in fresh else pr_metrics.REPOSITORY_PAGES_NODE_COST
+
+    pages = {}
+    batches = helpers.batch_by_cost(repos, cost, GRAPHQL_NODE_BUDGET)
+    for batch in tqdm(
+            iterable=batches,
+            desc='Fetching GitHub PR metric pages',
+    ):
+        try:
+            pages.update(pr_metrics.fetch_first_pages(batch, headers, helpers.s, open_only=fresh))
+        except Exception as e:
+            log.warning(f'Error fetching PR metric pages for {", ".join(repo.name for repo in batch)}: {e}')
+    return pages
+
+
+def _collect_pr_metrics(repos: list, headers: dict) -> dict:
+    """
+    Refresh cached pull-request metrics for active dashboard repositories.
+
+    Repositories are refreshed ``PR_METRICS_WORKERS`` at a time. Each GraphQL
+    response reports its ``rateLimit`` to the shared rate-limit scheduler, so
+    the workers slow down or pause together as the point budget runs low.
+
+    Parameters
+    ----------
+    repos : list
+        Active PyGithub Repository objects.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+
+    Returns
+    -------
+    dict
+        Mapping of repository name to open pull request summaries. The PR
+        metrics caches refetch open pull requests on every run and are the
+        only source of ``github/pulls`` for these repositories, so the
+        snapshots skip their pull requests.
+    """
+    first_pages = _prefetch_pr_metric_pages(repos, headers)
+
+    def refresh(repo) -> list[dict] | None:
+        return _run_github_repo_step(
             repo,
             'PR metrics',
-            lambda current_repo=repo: pr_metrics.refresh_repository(
-                current_repo,
-                BASE_DIR,
-                headers,
-                helpers.s,
-            ),
+            lambda: _refresh_pr_metrics(repo, headers, first_pages.get(repo.name)),
             timeout=180,
         )
 
+    open_pulls = {}
+    with ThreadPoolExecutor(max_workers=PR_METRICS_WORKERS, thread_name_prefix='pr-metrics') as executor:
+        futures = {executor.submit(refresh, repo): repo for repo in repos}
+        for future in tqdm(
+                iterable=as_completed(futures),
+                total=len(futures),
+                desc='Collecting GitHub PR metrics',
+        ):
+            pulls = future.result()
+            if pulls is not None:
+                open_pulls[futures[future].name] = pulls
+    return open_pulls
+
 
 def _is_pull_request_issue(issue) -> bool:
     """
@@ -774,7 +1337,28 @@ def _is_pull_request_issue(issue) -> bool:
     return 'pull_request' in raw_data and raw_data.get('pull_request') is not None
 
 
-def _collect_open_issues(repo) -> list[dict]:
+def _issue_summary(issue) -> dict:
+    """
+    Return the cached summary fields for an issue.
+    """
+    author = getattr(issue, 'user', None)
+    author_login = getattr(author, 'login', None)
+    author_type = getattr(author, 'type', None)
+    return {
+        'number': issue.number,
+        'title': issue.title,
+        'author': author_login,
+        'author_type': author_type,
+        'is_bot': helpers.is_bot_issue_author(author_login, author_type),
+        'labels': [label.name for label in issue.labels],
+        'assignees': [assignee.login for assignee in issue.assignees],
+        'created_at': issue.created_at.isoformat(),
+        'updated_at': issue.updated_at.isoformat(),
+        'milestone': issue.milestone.title if issue.milestone else None,
+    }
+
+
+def _collect_open_issues(repo, cached: list | None = None, since: datetime | None = None) -> list[dict]:
     """
     Fetch open issue summary data for a repository, excluding pull requests.
 
@@ -782,33 +1366,58 @@ def _collect_open_issues(repo) -> list[dict]:
     ----------
     repo :
         PyGithub Repository object.
+    cached : list or None
+        Previously collected open issues. When given together with ``since``,
+        only issues updated after ``since`` are fetched and merged in.
+    since : datetime or None
+        Cutoff for the incremental refresh.
 
     Returns
     -------
     list
         Issue summary dictionaries.
     """
-    issues_data = []
-    for issue in repo.get_issues(state='open'):
-        if _is_pull_request_issue(issue):
-            continue
+    if cached is None or since is None:
+        return [
+            _issue_summary(issue) for issue in helpers.iter_cancellable(repo.get_issues(state='open'))
+            if not _is_pull_request_issue(issue)
+        ]
 
-        author = getattr(issue, 'user', None)
-        author_login = getattr(author, 'login', None)
-        author_type = getattr(author, 'type', None)
-        issues_data.append({
-            'number': issue.number,
-            'title': issue.title,
-            'author': author_login,
-            'author_type': author_type,
-            'is_bot': helpers.is_bot_issue_author(author_login, author_type),
-            'labels': [label.name for label in issue.labels],
-            'assignees': [assignee.login for assignee in issue.assignees],
-            'created_at': issue.created_at.isoformat(),
-            'updated_at': issue.updated_at.isoformat(),
-            'milestone': issue.milestone.title if issue.milestone else None,
-        })
-    return issues_data
+    changes = [
+        (issue.number, _issue_summary(issue) if issue.state == 'open' else None)
+        for issue in helpers.iter_cancellable(repo.get_issues(state='all', since=since))
+        if not _is_pull_request_issue(issue)
+    ]
+    return _merge_open_items(cached, changes)
+
+
+def _update_open_items(repo, kind: str, step: str, items: list | None, collect: callable) -> None:
+    """
+    Write a repository's open pulls or issues, collecting them when the snapshot lacks them.
+
+    Parameters
+    ----------
+    repo :
+        PyGithub Repository object.
+    kind : str
+        Data directory under ``github``, either ``pulls`` or ``issues``.
+    step : str
+        Step name used in timeout and error messages.
+    items : list or None
+        Items from the batched snapshot, or ``None`` to collect them.
+    collect : callable
+        Collector accepting ``(repo, cached, since)``.
+    """
+    collected_at = None
+    if items is None:
+        collected_at = datetime.now(tz=timezone.utc)
+        items = _run_github_repo_step(repo, step, lambda: collect(repo, *_load_incremental_state(repo, kind)))
+    if items is None:
+        return
+
+    helpers.write_json_files(file_path=os.path.join(BASE_DIR, 'github', kind, repo.name), data=items)
+    if collected_at is not None:
+        _save_incremental_cursor(repo, kind, collected_at)
 
 
 def _fetch_open_graph_image_url(repo, headers: dict, graphql_url: str) -> str:
@@ -845,56 +1454,382 @@ def _fetch_open_graph_image_url(repo, headers: dict, graphql_url: str) -> str:
         raise RuntimeError(f'Error: update_github: {repo_data}') from None
 
 
-def _collect_commit_activity(repos: list, headers: dict) -> None:
+def _graphql_timestamp(value: str | None) -> str | None:
     """
-    Collect weekly commit totals for active repositories.
+    Convert a GraphQL timestamp to the ISO format written by the REST collectors.
+    """
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
 
-    GitHub caches repository stats by the current default-branch SHA. Reuse
-    cached files while the SHA matches, and refresh only when the SHA changes
-    or when no cached stats file exists. The first pass gives GitHub a chance
-    to calculate participation stats for every changed repository; the second
-    pass revisits only repositories that returned ``202`` during the first
-    request.
+
+def _graphql_author(author: dict | None) -> tuple[str | None, str | None]:
+    """
+    Return the REST-style login and account type for a GraphQL actor.
+
+    GraphQL reports bot logins without the ``[bot]`` suffix used by the REST API,
+    so it is added back to keep the cached files identical.
+    """
+    if not author:
+        return None, None
+    login = author.get('login')
+    account_type = author.get('__typename')
+    if account_type == 'Bot' and login and not login.endswith('[bot]'):
+        login = f'{login}[bot]'
+    return login, account_type
+
+
+def _snapshot_item_fields(node: dict) -> dict:
+    """
+    Return the summary fields shared by snapshot pull requests and issues.
+    """
+    return {
+        'labels': [label['name'] for label in (node.get('labels') or {}).get('nodes') or []],
+        'assignees': [assignee['login'] for assignee in (node.get('assignees') or {}).get('nodes') or []],
+        'created_at': _graphql_timestamp(node.get('createdAt')),
+        'updated_at': _graphql_timestamp(node.get('updatedAt')),
+        'milestone': (node.get('milestone') or {}).get('title'),
+    }
+
+
+def _parse_repository_snapshot(data: dict) -> dict:
+    """
+    Convert one aliased ``repository`` block into the per-repository snapshot.
+
+    Connections that have more than one page, hold an item whose labels or
+    assignees have more than one page, or were not selected are returned as
+    ``None`` so the caller falls back to the paginated REST collectors for them.
+
+    Parameters
+    ----------
+    data : dict
+        The ``RepositorySnapshot`` fragment data for a repository.
+
+    Returns
+    -------
+    dict
+        Snapshot with ``open_graph_image_url``, ``default_branch_sha``,
+        ``languages``, ``pulls`` and ``issues`` keys.
+    """
+    def complete(connection: dict | None) -> bool:
+        return connection is not None and not (connection.get('pageInfo') or {}).get('hasNextPage')
+
+    def complete_items(connection: dict | None) -> bool:
+        return complete(connection) and not any(
+            ((node.get(field) or {}).get('pageInfo') or {}).get('hasNextPage')
+            for node in connection.get('nodes') or []
+            for field in ('labels', 'assignees')
+        )
+
+    target = (data.get('defaultBranchRef') or {}).get('target') or {}
+    languages = data.get('languages')
+    pulls = data.get('pullRequests')
+    issues = data.get('issues')
+
+    pulls_data = None
+    if complete_items(pulls):
+        pulls_data = []
+        for node in pulls.get('nodes') or []:
+            author, _author_type = _graphql_author(node.get('author'))
+            pulls_data.append({
+                'number': node['number'],
+                'title': node.get('title'),
+                'author': author,
+                **_snapshot_item_fields(node),
+                'draft': bool(node.get('isDraft')),
+            })
+
+    issues_data = None
+    if complete_items(issues):
+        issues_data = []
+        for node in issues.get('nodes') or []:
+            author, author_type = _graphql_author(node.get('author'))
+            issues_data.append({
+                'number': node['number'],
+                'title': node.get('title'),
+                'author': author,
+                'author_type': author_type,
+                'is_bot': helpers.is_bot_issue_author(author, author_type),
+                **_snapshot_item_fields(node),
+            })
+
+    return {
+        'open_graph_image_url': data.get('openGraphImageUrl'),
+        'default_branch_sha': target.get('oid'),
+        'languages': {
+            edge['node']['name']: edge['size'] for edge in languages.get('edges') or []
+        } if complete(languages) else None,
+        'pulls': pulls_data,
+        'issues': issues_data,
+    }
+
+
+def _fetch_repository_snapshot_batch(
+        repos: list,
+        headers: dict,
+        graphql_url: str,
+        skip_pulls: set | frozenset = frozenset(),
+) -> dict:
+    """
+    Fetch snapshots for several repositories with one aliased GraphQL query.
 
     Parameters
     ----------
     repos : list
-        Active PyGithub Repository objects.
+        PyGithub Repository objects.
     headers : dict
         HTTP headers including the GitHub authorisation token.
+    graphql_url : str
+        GitHub GraphQL endpoint URL.
+    skip_pulls : set or frozenset
+        Names of repositories whose open pulls come from the PR metrics caches.
+        Their snapshots do not select pull requests.
+
+    Returns
+    -------
+    dict
+        Mapping of repository name to snapshot. Repositories missing from the
+        response are omitted.
     """
-    pending_repos = []
+    variables = {}
+    definitions = []
+    blocks = []
+    for index, repo in enumerate(repos):
+        variables[f'owner{index}'] = repo.owner.login
+        variables[f'name{index}'] = repo.name
+        definitions.append(f'$owner{index}: String!, $name{index}: String!')
+        fragments = '...RepositorySnapshot' if repo.name in skip_pulls else '...RepositorySnapshot ...RepositoryPulls'
+        blocks.append(f'  r{index}: repository(owner: $owner{index}, name: $name{index}) {{ {fragments} }}')
+    fragments = REPOSITORY_SNAPSHOT_FRAGMENT
+    if any(repo.name not in skip_pulls for repo in repos):
+        # GraphQL rejects documents with unused fragments
+        fragments += REPOSITORY_PULLS_FRAGMENT
+    query = 'query(%s) {\n%s\n}\n%s' % (', '.join(definitions), '\n'.join(blocks), fragments)
+
+    response = helpers.s.post(url=graphql_url, json={'query': query, 'variables': variables}, headers=headers)
+    payload = response.json()
+    data = payload.get('data') if isinstance(payload, dict) else None
+    if response.status_code != 200 or not data:
+        raise RuntimeError(f'Error fetching repository snapshots: {payload}')
+    if payload.get('errors'):
+        log.warning(f'Partial errors fetching repository snapshots: {payload["errors"]}')
 
-    for repo in tqdm(
-            iterable=repos,
-            desc='Priming GitHub commit activity',
-    ):
-        sha = _run_github_repo_step(repo, 'default branch SHA', lambda repo=repo: _default_branch_sha(repo))
-        if sha and _has_cached_commit_activity(repo) and _cached_commit_activity_sha(repo) == sha:
-            continue
+    return {
+        repo.name: _parse_repository_snapshot(data[f'r{index}'])
+        for index, repo in enumerate(repos)
+        if data.get(f'r{index}')
+    }
 
-        status = _fetch_commit_activity(repo, headers, sha)
-        if status == COMMIT_ACTIVITY_PENDING:
-            pending_repos.append((repo, sha))
 
-    if not pending_repos:
-        return
+def _fetch_repository_snapshots(
+        repos: list,
+        headers: dict,
+        graphql_url: str,
+        skip_pulls: set | frozenset = frozenset(),
+) -> dict:
+    """
+    Fetch languages, open pulls and issues, default-branch SHAs, and OpenGraph URLs in bulk.
+
+    Repositories are packed into aliased GraphQL queries sized so the
+    estimated node count of each query stays within ``GRAPHQL_NODE_BUDGET``.
+    A failed batch is logged and its repositories fall back to per-repository
+    requests.
+
+    Parameters
+    ----------
+    repos : list
+        Active PyGithub Repository objects.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+    graphql_url : str
+        GitHub GraphQL endpoint URL.
+    skip_pulls : set or frozenset
+        Names of repositories whose open pulls come from the PR metrics caches.
 
-    still_pending = []
-    for repo, sha in tqdm(
-            iterable=pending_repos,
-            desc='Collecting GitHub commit activity',
+    Returns
+    -------
+    dict
+        Mapping of repository name to snapshot.
+    """
+    def cost(repo) -> int:
+        return SNAPSHOT_NODE_COST + (0 if repo.name in skip_pulls else SNAPSHOT_PULLS_NODE_COST)
+
+    snapshots = {}
+    batches = helpers.batch_by_cost(repos, cost, GRAPHQL_NODE_BUDGET)
+    for batch in tqdm(
+            iterable=batches,
+            desc='Fetching GitHub repository snapshots',
     ):
-        status = _fetch_commit_activity(repo, headers, sha)
-        if status == COMMIT_ACTIVITY_PENDING:
-            still_pending.append(repo.name)
+        try:
+            snapshots.update(_fetch_repository_snapshot_batch(batch, headers, graphql_url, skip_pulls))
+        except Exception as e:
+            log.warning(f'Error fetching repository snapshots for {", ".join(repo.name for repo in batch)}: {e}')
+    return snapshots
+
+
+def _fetch_default_branch_shas(repos: list, headers: dict, graphql_url: str) -> dict:
+    """
+    Fetch the default-branch commit SHA of specific repositories.
+
+    Used only for repositories missing from the bulk snapshot results. Each
+    request packs up to ``DEFAULT_BRANCH_SHAS_BATCH`` aliased lookups, which
+    replaces a ``get_branch`` request per repository when validating the
+    commit activity cache.
+
+    Parameters
+    ----------
+    repos : list
+        PyGithub Repository objects.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+    graphql_url : str
+        GitHub GraphQL endpoint URL.
+
+    Returns
+    -------
+    dict
+        Mapping of repository name to default-branch SHA. Repositories without
+        a default branch or in a failed batch are omitted and left to
+        per-repository lookups.
+    """
+    shas = {}
+    for start in range(0, len(repos), DEFAULT_BRANCH_SHAS_BATCH):
+        batch = repos[start:start + DEFAULT_BRANCH_SHAS_BATCH]
+        variables = {}
+        definitions = []
+        blocks = []
+        for index, repo in enumerate(batch):
+            variables[f'owner{index}'] = repo.owner.login
+            variables[f'name{index}'] = repo.name
+            definitions.append(f'$owner{index}: String!, $name{index}: String!')
+            blocks.append(
+                f'  r{index}: repository(owner: $owner{index}, name: $name{index}) '
+                '{ defaultBranchRef { target { oid } } }'
+            )
+        query = 'query(%s) {\n%s\n}' % (', '.join(definitions), '\n'.join(blocks))
+        try:
+            response = helpers.s.post(url=graphql_url, json={'query': query, 'variables': variables}, headers=headers)
+            data = response.json()['data']
+            for index, repo in enumerate(batch):
+                sha = (((data.get(f'r{index}') or {}).get('defaultBranchRef') or {}).get('target') or {}).get('oid')
+                if sha:
+                    shas[repo.name] = sha
+        except Exception as e:
+            log.warning(f'Error fetching default branch SHAs for {", ".join(repo.name for repo in batch)}: {e}')
+    return shas
+
+
+def _commit_activity_deadline() -> float:
+    """
+    Return how many seconds pending commit activity may be polled for.
+
+    Returns
+    -------
+    float
+        ``DASHBOARD_COMMIT_ACTIVITY_DEADLINE`` when set to a valid number,
+        otherwise ``COMMIT_ACTIVITY_DEADLINE``.
+    """
+    try:
+        return max(0.0, float(os.getenv('DASHBOARD_COMMIT_ACTIVITY_DEADLINE', COMMIT_ACTIVITY_DEADLINE)))
+    except ValueError:
+        log.warning(f'Invalid DASHBOARD_COMMIT_ACTIVITY_DEADLINE, using {COMMIT_ACTIVITY_DEADLINE}')
+        return COMMIT_ACTIVITY_DEADLINE
+
+
+def _poll_commit_activity(pending: list, headers: dict, deadline: float) -> None:
+    """
+    Re-poll repositories whose participation stats were still being calculated.
+
+    Waits grow exponentially from ``COMMIT_ACTIVITY_BACKOFF`` up to
+    ``COMMIT_ACTIVITY_MAX_BACKOFF`` seconds with random jitter, so repeated
+    runs don't all retry in lockstep. Polling stops once every repository is
+    ready or ``deadline`` passes.
+
+    Parameters
+    ----------
+    pending : list
+        ``(repo, sha)`` pairs that returned ``202``.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+    deadline : float
+        Epoch seconds after which no further polls are made.
+    """
+    attempt = 0
+    while pending and time.time() < deadline:
+        delay = min(COMMIT_ACTIVITY_MAX_BACKOFF, COMMIT_ACTIVITY_BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.0)
+        time.sleep(max(0.0, min(delay, deadline - time.time())))
+        attempt += 1
+        pending = [
+            (repo, sha) for repo, sha in pending
+            if _fetch_commit_activity(repo, headers, sha) == COMMIT_ACTIVITY_PENDING
+        ]
 
-    if still_pending:
-        repo_names = ', '.join(still_pending)
+    if pending:
+        repo_names = ', '.join(repo.name for repo, _sha in pending)
         log.warning(f'GitHub commit activity is still being calculated for: {repo_names}')
 
 
-def _process_github_repo(repo, headers: dict, graphql_url: str) -> None:
+def _collect_commit_activity(repos: list, headers: dict, shas: dict | None = None) -> Thread | None:
+    """
+    Collect weekly commit totals for active repositories.
+
+    GitHub caches repository stats by the current default-branch SHA. Reuse
+    cached files while the SHA matches, and refresh only when the SHA changes
+    or when no cached stats file exists. Priming requests for every changed
+    repository are sent concurrently so GitHub starts calculating their
+    participation stats; repositories that return ``202`` are re-polled on a
+    background thread until ``_commit_activity_deadline`` seconds have passed.
+
+    Parameters
+    ----------
+    repos : list
+        Active PyGithub Repository objects.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+    shas : dict or None
+        Default-branch SHAs already known from repository snapshots. Missing
+        entries are looked up per repository.
+
+    Returns
+    -------
+    Thread or None
+        The started polling thread, which the caller should join before
+        finishing, or ``None`` when nothing is pending.
+    """
+    shas = shas or {}
+
+    def prime(repo) -> tuple:
+        sha = shas.get(repo.name) or _run_github_repo_step(
+            repo, 'default branch SHA', lambda: _default_branch_sha(repo))
+        if sha and _has_cached_commit_activity(repo) and _cached_commit_activity_sha(repo) == sha:
+            return repo, sha, COMMIT_ACTIVITY_READY
+        return repo, sha, _fetch_commit_activity(repo, headers, sha)
+
+    pending = []
+    with ThreadPoolExecutor(max_workers=COMMIT_ACTIVITY_WORKERS, thread_name_prefix='commit-activity') as executor:
+        futures = [executor.submit(prime, repo) for repo in repos]
+        for future in tqdm(
+                iterable=futures,
+                desc='Priming GitHub commit activity',
+        ):
+            repo, sha, status = future.result()
+            if status == COMMIT_ACTIVITY_PENDING:
+                pending.append((repo, sha))
+
+    if not pending:
+        return None
+
+    poller = Thread(
+        name='commit-activity-poller',
+        target=_poll_commit_activity,
+        args=(pending, headers, time.time() + _commit_activity_deadline()),
+        daemon=True,
+    )
+    poller.start()
+    return poller
+
+
+def _process_github_repo(repo, headers: dict, graphql_url: str, snapshot: dict | None = None) -> None:
     """
     Collect and cache all per-repository data for a single GitHub repo.
 
@@ -906,39 +1841,41 @@ def _process_github_repo(repo, headers: dict, graphql_url: str) -> None:
         HTTP headers including the GitHub authorisation token.
     graphql_url : str
         GitHub GraphQL endpoint URL.
+    snapshot : dict or None
+        Batched GraphQL snapshot for the repository. Fields that are missing
+        from it are fetched with per-repository requests.
     """
+    snapshot = snapshot or {}
+
     # languages
-    languages = _run_github_repo_step(repo, 'languages', repo.get_languages)
+    languages = snapshot.get('languages')
+    if languages is None:
+        languages = _run_github_repo_step(repo, 'languages', repo.get_languages)
     if languages is not None:
         file_path = os.path.join(BASE_DIR, 'github', 'languages', repo.name)
         helpers.write_json_files(file_path=file_path, data=languages)
 
-    # open pull requests
-    pulls_data = _run_github_repo_step(repo, 'pull requests', lambda: _collect_open_pulls(repo))
-    if pulls_data is not None:
-        file_path = os.path.join(BASE_DIR, 'github', 'pulls', repo.name)
-        helpers.write_json_files(file_path=file_path, data=pulls_data)
-
-    # open issues
-    issues_data = _run_github_repo_step(repo, 'issues', lambda: _collect_open_issues(repo))
-    if issues_data is not None:
-        file_path = os.path.join(BASE_DIR, 'github', 'issues', repo.name)
-        helpers.write_json_files(file_path=file_path, data=issues_data)
+    # open pull requests and issues
+    _update_open_items(repo, 'pulls', 'pull requests', snapshot.get('pulls'), _collect_open_pulls)
+    _update_open_items(repo, 'issues', 'issues', snapshot.get('issues'), _collect_open_issues)
 
     # open code scanning alerts and per-day history
     alerts = _run_github_repo_step(repo, 'code scanning alerts', lambda: _fetch_code_scanning_alerts(repo))
     if alerts is not None:
         open_alert_count = sum(
-            1 for a in alerts if getattr(a, 'state', None) == 'open'
+            1 for a in alerts if a['state'] == 'open'
         )
+        # no per-run timestamp, the builder's incremental signature hashes this file
         file_path = os.path.join(BASE_DIR, 'github', 'codeScanning', repo.name)
         helpers.write_json_files(file_path=file_path, data={
             'repo': repo.name,
             'open': open_alert_count,
-            'updated_at': datetime.now(tz=timezone.utc).isoformat(),
         })
 
-        code_scanning_history = _build_code_scanning_history(alerts)
+        code_scanning_history = _build_code_scanning_history(
+            alerts,
+            fill_gaps=bool(os.getenv('DASHBOARD_CODE_SCANNING_DAILY_HISTORY')),
+        )
         file_path = os.path.join(BASE_DIR, 'github', 'codeScanningHistory', repo.name)
         helpers.write_json_files(file_path=file_path, data=code_scanning_history)
 
@@ -949,7 +1886,7 @@ def _process_github_repo(repo, headers: dict, graphql_url: str) -> None:
         helpers.write_json_files(file_path=file_path, data=star_history)
 
     # openGraphImages - uses GraphQL
-    image_url = _run_github_repo_step(
+    image_url = snapshot.get('open_graph_image_url') or _run_github_repo_step(
         repo,
         'OpenGraph image URL',
         lambda: _fetch_open_graph_image_url(repo, headers, graphql_url),
@@ -970,6 +1907,75 @@ def _process_github_repo(repo, headers: dict, graphql_url: str) -> None:
         )
 
 
+def _github_repo_workers() -> int:
+    """
+    Return how many repositories ``update_github`` should process concurrently.
+
+    The value is read from ``DASHBOARD_GITHUB_WORKERS`` and falls back to
+    ``GITHUB_REPO_WORKERS`` when unset or invalid.
+
+    Returns
+    -------
+    int
+        Number of worker threads, always at least one.
+    """
+    try:
+        workers = int(os.getenv('DASHBOARD_GITHUB_WORKERS', GITHUB_REPO_WORKERS))
+    except ValueError:
+        log.warning(f'Invalid DASHBOARD_GITHUB_WORKERS value, using {GITHUB_REPO_WORKERS}.')
+        workers = GITHUB_REPO_WORKERS
+    return max(1, workers)
+
+
+def _process_github_repos(
+        repos: list,
+        headers: dict,
+        graphql_url: str,
+        workers: int = 1,
+        snapshots: dict | None = None,
+) -> None:
+    """
+    Collect per-repository GitHub data, optionally on a bounded worker pool.
+
+    Each repository is still handled by ``_process_github_repo``, which writes
+    its own result files, so the output is identical to the serial mode.
+
+    Parameters
+    ----------
+    repos : list
+        Active PyGithub Repository objects.
+    headers : dict
+        HTTP headers including the GitHub authorisation token.
+    graphql_url : str
+        GitHub GraphQL endpoint URL.
+    workers : int
+        Maximum number of repositories processed at once. ``1`` keeps the
+        original serial behaviour.
+    snapshots : dict or None
+        Batched GraphQL snapshots keyed by repository name.
+    """
+    snapshots = snapshots or {}
+    if workers <= 1:
+        for repo in tqdm(
+                iterable=repos,
+                desc='Updating GitHub data',
+        ):
+            _process_github_repo(repo, headers, graphql_url, snapshots.get(repo.name))
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='github-repo') as executor:
+        futures = [
+            executor.submit(_process_github_repo, repo, headers, graphql_url, snapshots.get(repo.name))
+            for repo in repos
+        ]
+        for future in tqdm(
+                iterable=as_completed(futures),
+                total=len(futures),
+                desc='Updating GitHub data',
+        ):
+            future.result()
+
+
 def update_github():
     """
     Cache and update GitHub Repo banners and data.
@@ -1000,15 +2006,23 @@ def update_github():
     graphql_url = 'https://api.github.com/graphql'
 
     active_repos = [repo for repo in repos if not repo.archived]
-    _collect_commit_activity(active_repos, headers)
     metric_repos = [repo for repo in active_repos if pr_metrics.is_active_repo(repo.raw_data)]
-    _collect_pr_metrics(metric_repos, headers)
-
-    for repo in tqdm(
-            iterable=active_repos,
-            desc='Updating GitHub data',
-    ):
-        _process_github_repo(repo, headers, graphql_url)
+    snapshots = _fetch_repository_snapshots(
+        active_repos, headers, graphql_url, skip_pulls={repo.name for repo in metric_repos})
+    default_branch_shas = {
+        name: snapshot['default_branch_sha'] for name, snapshot in snapshots.items()
+        if snapshot['default_branch_sha']
+    }
+    missing = [repo for repo in active_repos if repo.name not in snapshots]
+    if missing:
+        default_branch_shas.update(_fetch_default_branch_shas(missing, headers, graphql_url))
+    commit_activity_poller = _collect_commit_activity(active_repos, headers, default_branch_shas)
+    for name, pulls in _collect_pr_metrics(metric_repos, headers).items():
+        snapshots[name] = {**snapshots.get(name, {}), 'pulls': pulls}
+    _process_github_repos(active_repos, headers, graphql_url, _github_repo_workers(), snapshots)
+    if commit_activity_poller:
+        commit_activity_poller.join()
+    _log_github_step_stats()
 
 
 def update_patreon():
@@ -91,6 +91,35 @@ describe('dashboard.js', () => {
         await expect(mod.fetchJSON('bad.json')).rejects.toThrow('Failed to fetch');
     });
 
+    test('rowsFromColumnar expands day gaps into dated rows', () => {
+        expect(mod.rowsFromColumnar([
+            { repo: 'repo-a', start: '2026-02-27', days: [0, 2, 7], stars: [1, 2, 3] },
+            { repo: 'repo-b', start: '2026-01-01', days: [0], stars: [5] },
+        ], 'date', 'stars')).toEqual([
+            { repo: 'repo-a', date: '2026-02-27', stars: 1 },
+            { repo: 'repo-a', date: '2026-03-01', stars: 2 },
+            { repo: 'repo-a', date: '2026-03-08', stars: 3 },
+            { repo: 'repo-b', date: '2026-01-01', stars: 5 },
+        ]);
+        expect(mod.rowsFromColumnar({}, 'date', 'stars')).toEqual([]);
+        expect(mod.rowsFromColumnar([{ repo: 'repo-a', start: '2026-01-01' }], 'date', 'stars')).toEqual([]);
+    });
+
+    test('fetchSeries falls back to the columnar file', async () => {
+        const rows = [{ repo: 'repo-a', week: '2026-01-05', total: 4 }];
+        globalThis.fetch.mockImplementation(async (url) => {
+            if (url.endsWith('commit_activity.columnar.json')) {
+                return { ok: true, json: async () => [{ repo: 'repo-a', start: '2026-01-05', days: [0], total: [4] }] };
+            }
+            return { ok: false, status: 404 };
+        });
+        await expect(mod.fetchSeries('commit_activity', 'week', 'total')).resolves.toEqual(rows);
+        await expect(mod.fetchSeries('star_history', 'date', 'stars')).resolves.toEqual([]);
+
+        globalThis.fetch.mockResolvedValue({ ok: true, json: async () => rows });
+        await expect(mod.fetchSeries('commit_activity', 'week', 'total')).resolves.toEqual(rows);
+    });
+
     test('isDark and plotlyTemplate branches', () => {
         document.documentElement.dataset.bsTheme = 'dark';
         expect(mod.isDark()).toBe(true);
@@ -1,5 +1,6 @@
 # standard imports
 import json
+import os
 from datetime import datetime, timezone
 
 # lib imports
@@ -130,6 +131,50 @@ def test_get_code_scanning_open_and_history_fallbacks(tmp_path):
     assert builder._get_code_scanning_history(str(tmp_path), 'demo') == []
 
 
+def test_data_files_scans_once_and_prefetches(monkeypatch, tmp_path):
+    _write_json(tmp_path / 'github' / 'pulls' / 'demo.json', [{'number': 1}])
+    _write_json(tmp_path / 'github' / 'prMetrics' / 'demo.json', {'pull_requests': 'bad'})
+    (tmp_path / 'github' / 'issues').mkdir(parents=True)
+    (tmp_path / 'github' / 'issues' / 'demo.json').write_text('{bad', encoding='utf-8')
+    scans = []
+    original_scandir = builder.os.scandir
+    monkeypatch.setattr(builder.os, 'scandir', lambda path: scans.append(path) or original_scandir(path))
+
+    files = builder.DataFiles(str(tmp_path))
+    files.prefetch(builder._repo_data_keys('demo') + builder._repo_data_keys('other'))
+    assert files.exists('github/pulls', 'demo.json')
+    assert not files.exists('github/missing', 'demo.json')
+    assert len(scans) == len({directory for directory, _ in builder.REPO_DATA_FILES}) + 1
+
+    monkeypatch.setattr(builder.DataFiles, '_read', lambda *_args: pytest.fail('prefetched file was read again'))
+    assert builder._get_prs(str(tmp_path), 'demo', files) == [{'number': 1}]
+    assert builder._get_issues(str(tmp_path), 'demo', files) is None
+    assert builder._get_pr_metric_cache(str(tmp_path), 'demo', files) is None
+    assert builder._get_pr_metric_cache(str(tmp_path), 'other', files) is None
+    with pytest.raises(FileNotFoundError):
+        files.load('github/pulls', 'other.json')
+
+
+def test_json_array_writer_streams_and_replaces_atomically(tmp_path):
+    path = tmp_path / 'rows.json'
+    with builder.JsonArrayWriter(str(path)) as writer:
+        writer.write({'repo': 'a'})
+        writer.extend(iter([{'repo': 'b'}, 3]))
+    assert path.read_text(encoding='utf-8') == json.dumps([{'repo': 'a'}, {'repo': 'b'}, 3])
+    assert writer.count == 3
+
+    with builder.JsonArrayWriter(str(path)):
+        pass
+    assert json.loads(path.read_text(encoding='utf-8')) == []
+
+    with pytest.raises(RuntimeError):
+        with builder.JsonArrayWriter(str(path)) as writer:
+            writer.write('partial')
+            raise RuntimeError('boom')
+    assert json.loads(path.read_text(encoding='utf-8')) == []
+    assert [entry.name for entry in tmp_path.iterdir()] == ['rows.json']
+
+
 def test_build_repo_entry_computes_counts_and_license():
     repo = {
         'name': 'demo',
@@ -242,10 +287,256 @@ def test_build_end_to_end(monkeypatch, tmp_path):
 
     metrics = json.loads((data_dir / 'pr_metrics.json').read_text(encoding='utf-8'))
     assert metrics == {'demo': pr_metric_cache}
+    summary = json.loads((data_dir / 'pr_metrics_summary.json').read_text(encoding='utf-8'))
+    assert summary['generated_at'] == fixed_now.isoformat()
+    assert summary['totals']['90']['open'] == 0
+    assert set(summary['repositories']['demo']) == {'7', '30', '90', '365'}
+    assert 'pending' not in summary['repositories']['demo']['365']
+    series = json.loads((data_dir / 'pr_backlog_series.json').read_text(encoding='utf-8'))
+    assert series['start'] == '2025-01-06'
+    assert series['repositories']['demo']['open'] == [0] * 365
     assert 'Pull Request Metrics' in (template / 'pr-metrics' / 'index.md').read_text(encoding='utf-8')
     assert 'PR Metrics - demo' in (template / 'pr-metrics' / 'demo.md').read_text(encoding='utf-8')
 
 
+def test_build_reuses_unchanged_repositories(monkeypatch, tmp_path):
+    base = tmp_path / 'gh-pages'
+    template = tmp_path / 'gh-pages-template'
+    data_dir = template / 'assets' / 'data'
+    repos = [
+        {'name': 'one', 'private': False, 'archived': False, 'topics': ['package-manager']},
+        {'name': 'two', 'private': False, 'archived': False},
+    ]
+    _write_json(base / 'github' / 'repos.json', repos)
+    _write_json(base / 'github' / 'starHistory' / 'one.json', [{'date': '2026-01-01', 'stars': 1}])
+    _write_json(base / 'github' / 'starHistory' / 'two.json', [{'date': '2026-01-01', 'stars': 2}])
+    _write_json(base / 'github' / 'prMetrics' / 'two.json', {'pull_requests': []})
+    monkeypatch.setattr(builder, 'BASE_DIR', str(base))
+    monkeypatch.setattr(builder, 'TEMPLATE_DIR', str(template))
+    monkeypatch.delenv('DASHBOARD_FULL_BUILD', raising=False)
+
+    builder.build()
+    first_stars = json.loads((data_dir / 'star_history.json').read_text(encoding='utf-8'))
+    manifest = json.loads((data_dir / builder.MANIFEST_FILE).read_text(encoding='utf-8'))
+    assert set(manifest['repos']) == {'one', 'two'}
+    assert 'github/starHistory/two.json' in manifest['repos']['two']['files']
+
+    rebuilt = []
+    original = builder._build_repo_outputs
+    monkeypatch.setattr(builder, '_build_repo_outputs', lambda repo, *args: rebuilt.append(repo['name']) or original(
+        repo, *args))
+    os.utime(data_dir / 'star_history.json', ns=(0, 0))
+    builder.build()
+    assert rebuilt == []
+    assert (data_dir / 'star_history.json').stat().st_mtime_ns == 0
+    assert json.loads((data_dir / 'star_history.json').read_text(encoding='utf-8')) == first_stars
+
+    _write_json(base / 'github' / 'starHistory' / 'two.json', [{'date': '2026-01-02', 'stars': 3}])
+    builder.build()
+    assert rebuilt == ['two']
+    assert json.loads((data_dir / 'star_history.json').read_text(encoding='utf-8')) == [
+        {'repo': 'one', 'date': '2026-01-01', 'stars': 1},
+        {'repo': 'two', 'date': '2026-01-02', 'stars': 3},
+    ]
+    assert json.loads((data_dir / 'pr_metrics.json').read_text(encoding='utf-8')) == {'two': {'pull_requests': []}}
+
+    # unchanged repositories are spliced from their recorded spans of the previous outputs
+    manifest = json.loads((data_dir / builder.MANIFEST_FILE).read_text(encoding='utf-8'))
+    start, end = manifest['repos']['one']['offsets']['star_history.json']
+    assert json.loads((data_dir / 'star_history.json').read_bytes()[start:end]) == first_stars[0]
+    manifest['repos']['one']['offsets']['star_history.json'] = [0, 3]
+    (data_dir / builder.MANIFEST_FILE).write_text(json.dumps(manifest), encoding='utf-8')
+    warnings = []
+    monkeypatch.setattr(builder.log, 'warning', lambda msg: warnings.append(msg))
+    _write_json(base / 'github' / 'starHistory' / 'two.json', [{'date': '2026-01-03', 'stars': 4}])
+    builder.build()
+    assert rebuilt == ['two', 'one', 'two']
+    assert warnings and 'one' in warnings[0]
+    assert json.loads((data_dir / 'star_history.json').read_text(encoding='utf-8'))[0] == first_stars[0]
+
+    rebuilt.clear()
+    _write_json(base / 'github' / 'repos.json', repos[1:])
+    builder.build()
+    assert rebuilt == []
+    assert [entry['name'] for entry in json.loads((data_dir / 'repos.json').read_text(encoding='utf-8'))] == ['two']
+
+    monkeypatch.setenv('DASHBOARD_FULL_BUILD', '1')
+    builder.build()
+    assert rebuilt == ['two']
+
+
+def test_build_writes_repository_shards_and_index(monkeypatch, tmp_path):
+    base = tmp_path / 'gh-pages'
+    template = tmp_path / 'gh-pages-template'
+    shard_dir = template / 'assets' / 'data' / builder.SHARD_DIR
+    repos = [
+        {'name': 'one', 'private': False, 'archived': False},
+        {'name': 'two', 'private': False, 'archived': False, 'topics': ['package-manager']},
+    ]
+    _write_json(base / 'github' / 'repos.json', repos)
+    _write_json(base / 'github' / 'starHistory' / 'one.json', [{'date': '2026-01-01', 'stars': 1}])
+    monkeypatch.setattr(builder, 'BASE_DIR', str(base))
+    monkeypatch.setattr(builder, 'TEMPLATE_DIR', str(template))
+    monkeypatch.delenv('DASHBOARD_FULL_BUILD', raising=False)
+    monkeypatch.setenv('DASHBOARD_DATA_SHARDS', '1')
+    clock = (datetime(2026, 1, day, tzinfo=timezone.utc) for day in range(1, 29))
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(clock)
+
+    monkeypatch.setattr(builder, 'datetime', FixedDatetime)
+    shard_dir.mkdir(parents=True)
+    (shard_dir / 'gone.json').write_text('{}', encoding='utf-8')
+
+    builder.build()
+    index = json.loads((shard_dir / 'index.json').read_text(encoding='utf-8'))
+    assert index['repos']['one']['path'] == 'shards/one.json'
+    assert index['repos']['one']['size'] == (shard_dir / 'one.json').stat().st_size
+    shard = json.loads((shard_dir / 'one.json').read_text(encoding='utf-8'))
+    assert shard['repo']['name'] == 'one'
+    assert shard['star_history'] == [{'date': '2026-01-01', 'stars': 1}]
+    assert shard['pr_metrics'] is None
+    assert 'pr_metrics' not in json.loads((shard_dir / 'two.json').read_text(encoding='utf-8'))
+    assert not (shard_dir / 'gone.json').exists()
+
+    (shard_dir / 'two.json').unlink()
+    builder.build()
+    index = json.loads((shard_dir / 'index.json').read_text(encoding='utf-8'))
+    assert index['updated_at'] == '2026-01-02T00:00:00+00:00'
+    assert index['repos']['one']['updated_at'] == '2026-01-01T00:00:00+00:00'
+    assert index['repos']['two']['updated_at'] == '2026-01-02T00:00:00+00:00'
+
+    # a repository changed while sharding was off gets its shard rewritten once sharding is back on
+    monkeypatch.delenv('DASHBOARD_DATA_SHARDS')
+    _write_json(base / 'github' / 'starHistory' / 'one.json', [{'date': '2026-01-03', 'stars': 7}])
+    builder.build()
+    monkeypatch.setenv('DASHBOARD_DATA_SHARDS', '1')
+    builder.build()
+    shard = json.loads((shard_dir / 'one.json').read_text(encoding='utf-8'))
+    assert shard['star_history'] == [{'date': '2026-01-03', 'stars': 7}]
+
+    (shard_dir / 'index.json').write_text('{bad', encoding='utf-8')
+    assert builder.RepoShards(str(shard_dir.parent), datetime.now(timezone.utc)).previous == {}
+
+
+def test_columnar_series_round_trip(monkeypatch):
+    rows = [
+        {'repo': 'demo', 'date': '2026-01-05T12:00:00Z', 'coverage': 80.0},
+        {'repo': 'demo', 'date': '2026-01-01', 'coverage': 70.0},
+        {'repo': 'demo', 'date': None, 'coverage': 1.0},
+        {'repo': 'demo', 'date': '2026-02-01', 'coverage': 90.0},
+    ]
+    series = builder._columnar_series('demo', rows, 'date', 'coverage')
+    assert series == {'repo': 'demo', 'start': '2026-01-01', 'days': [0, 4, 27], 'coverage': [70.0, 80.0, 90.0]}
+    assert builder._rows_from_columnar(series, 'date', 'coverage') == [
+        {'repo': 'demo', 'date': '2026-01-01', 'coverage': 70.0},
+        {'repo': 'demo', 'date': '2026-01-05', 'coverage': 80.0},
+        {'repo': 'demo', 'date': '2026-02-01', 'coverage': 90.0},
+    ]
+    assert builder._columnar_series('demo', [], 'date', 'coverage') is None
+
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'Columnar')
+    assert builder._series_format() == builder.SERIES_COLUMNAR
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'parquet')
+    assert builder._series_format() == builder.SERIES_ROWS
+
+
+def test_build_writes_columnar_series(monkeypatch, tmp_path):
+    base = tmp_path / 'gh-pages'
+    data_dir = tmp_path / 'gh-pages-template' / 'assets' / 'data'
+    repos = [
+        {'name': 'one', 'private': False, 'archived': False, 'topics': ['package-manager']},
+        {'name': 'two', 'private': False, 'archived': False, 'topics': ['package-manager']},
+    ]
+    _write_json(base / 'github' / 'repos.json', repos)
+    _write_json(base / 'github' / 'starHistory' / 'one.json', [
+        {'date': '2026-01-01', 'stars': 1}, {'date': '2026-01-08', 'stars': 4}])
+    _write_json(base / 'github' / 'commitActivity' / 'two.json', [{'week': 86400 * 7, 'total': 2}])
+    monkeypatch.setattr(builder, 'BASE_DIR', str(base))
+    monkeypatch.setattr(builder, 'TEMPLATE_DIR', str(tmp_path / 'gh-pages-template'))
+    monkeypatch.delenv('DASHBOARD_FULL_BUILD', raising=False)
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'columnar')
+
+    builder.build()
+    assert not (data_dir / 'star_history.json').exists()
+    assert (data_dir / 'prs.json').exists()
+    stars = json.loads((data_dir / 'star_history.columnar.json').read_text(encoding='utf-8'))
+    assert stars == [{'repo': 'one', 'start': '2026-01-01', 'days': [0, 7], 'stars': [1, 4]}]
+    commits = json.loads((data_dir / 'commit_activity.columnar.json').read_text(encoding='utf-8'))
+    assert commits == [{'repo': 'two', 'start': '1970-01-08', 'days': [0], 'total': [2]}]
+
+    _write_json(base / 'github' / 'commitActivity' / 'two.json', [{'week': 86400 * 14, 'total': 5}])
+    builder.build()
+    stars = json.loads((data_dir / 'star_history.columnar.json').read_text(encoding='utf-8'))
+    assert stars == [{'repo': 'one', 'start': '2026-01-01', 'days': [0, 7], 'stars': [1, 4]}]
+    commits = json.loads((data_dir / 'commit_activity.columnar.json').read_text(encoding='utf-8'))
+    assert commits == [{'repo': 'two', 'start': '1970-01-15', 'days': [0], 'total': [5]}]
+
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'both')
+    builder.build()
+    assert json.loads((data_dir / 'star_history.json').read_text(encoding='utf-8')) == [
+        {'repo': 'one', 'date': '2026-01-01', 'stars': 1},
+        {'repo': 'one', 'date': '2026-01-08', 'stars': 4},
+    ]
+    (data_dir / 'prs.json').unlink()
+    assert not builder._previous_outputs_exist(str(data_dir), builder.SERIES_BOTH)
+    builder.build()
+    assert (data_dir / 'prs.json').exists()
+
+
+def test_build_switching_series_format_keeps_spliced_rows_current(monkeypatch, tmp_path):
+    base = tmp_path / 'gh-pages'
+    data_dir = tmp_path / 'gh-pages-template' / 'assets' / 'data'
+    repos = [
+        {'name': 'one', 'private': False, 'archived': False, 'topics': ['package-manager']},
+        {'name': 'two', 'private': False, 'archived': False, 'topics': ['package-manager']},
+    ]
+    _write_json(base / 'github' / 'repos.json', repos)
+    _write_json(base / 'github' / 'starHistory' / 'one.json', [{'date': '2026-01-01', 'stars': 1}])
+    _write_json(base / 'github' / 'starHistory' / 'two.json', [{'date': '2026-01-01', 'stars': 2}])
+    monkeypatch.setattr(builder, 'BASE_DIR', str(base))
+    monkeypatch.setattr(builder, 'TEMPLATE_DIR', str(tmp_path / 'gh-pages-template'))
+    monkeypatch.delenv('DASHBOARD_FULL_BUILD', raising=False)
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'rows')
+    builder.build()
+    assert (data_dir / 'star_history.json').exists()
+
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'columnar')
+    _write_json(base / 'github' / 'starHistory' / 'one.json', [
+        {'date': '2026-01-01', 'stars': 1}, {'date': '2026-01-02', 'stars': 3}])
+    builder.build()
+    assert not (data_dir / 'star_history.json').exists()
+
+    # a stale row file restored from an older deployment is never read back
+    _write_json(data_dir / 'star_history.json', [{'repo': 'one', 'date': '2026-01-01', 'stars': 1}])
+    _write_json(base / 'github' / 'starHistory' / 'two.json', [{'date': '2026-01-02', 'stars': 5}])
+    builder.build()
+    stars = json.loads((data_dir / 'star_history.columnar.json').read_text(encoding='utf-8'))
+    assert stars == [
+        {'repo': 'one', 'start': '2026-01-01', 'days': [0, 1], 'stars': [1, 3]},
+        {'repo': 'two', 'start': '2026-01-02', 'days': [0], 'stars': [5]},
+    ]
+    assert not (data_dir / 'star_history.json').exists()
+
+    monkeypatch.setenv('DASHBOARD_SERIES_FORMAT', 'rows')
+    builder.build()
+    assert not (data_dir / 'star_history.columnar.json').exists()
+
+
+def test_build_manifest_helpers_tolerate_missing_data(tmp_path):
+    assert builder._load_manifest(str(tmp_path)) == {}
+    (tmp_path / builder.MANIFEST_FILE).write_text('[]', encoding='utf-8')
+    assert builder._load_manifest(str(tmp_path)) == {}
+    assert not builder._previous_outputs_exist(str(tmp_path), builder.SERIES_ROWS)
+    assert builder._read_span(str(tmp_path), 'missing.json', None) == []
+    with pytest.raises(ValueError, match='No previous entry'):
+        builder._previous_repo_outputs(str(tmp_path), builder.SERIES_ROWS, 'demo', {})
+    assert not builder._same_inputs({'repo': 'a', 'files': {}}, None)
+    assert not builder._same_inputs({'repo': 'a', 'files': {}}, {'repo': 'b'})
+
+
 def test_build_logs_error_when_repos_missing(monkeypatch, tmp_path):
     monkeypatch.setattr(builder, 'BASE_DIR', str(tmp_path / 'gh-pages'))
     monkeypatch.setattr(builder, 'TEMPLATE_DIR', str(tmp_path / 'gh-pages-template'))
@@ -1,5 +1,13 @@
 # standard imports
 import json
+import os
+from threading import Event, Thread, current_thread
+import time
+
+# lib imports
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
 
 # local imports
 from src import helpers
@@ -36,6 +44,16 @@ def test_timeout_session_keeps_explicit_timeout(monkeypatch):
     assert called['kwargs']['timeout'] == 5
 
 
+def test_timeout_session_stops_cancelled_steps(monkeypatch):
+    monkeypatch.setattr('requests.Session.request', lambda *args, **kwargs: pytest.fail('unexpected request'))
+    cancelled = Event()
+    cancelled.set()
+    monkeypatch.setattr(helpers._step_context, 'cancelled', cancelled, raising=False)
+
+    with pytest.raises(helpers.StepCancelledError):
+        helpers.TimeoutSession().request('GET', 'https://example.com')
+
+
 def test_rate_limited_session_waits_when_called_too_fast(monkeypatch):
     timeline = iter([100.0, 100.1])
     slept = []
@@ -77,6 +95,15 @@ def test_is_bot_issue_author():
     assert helpers.is_bot_issue_author(None, None) is False
 
 
+def test_batch_by_cost():
+    assert helpers.batch_by_cost([], len, 5) == []
+    assert helpers.batch_by_cost(['aa', 'bb', 'c', 'dddddd', 'e'], len, 5) == [
+        ['aa', 'bb', 'c'],
+        ['dddddd'],
+        ['e'],
+    ]
+
+
 def test_debug_print_logs_and_prints(monkeypatch):
     logs = []
     prints = []
@@ -154,3 +181,400 @@ def test_write_json_files_with_and_without_indent(monkeypatch, tmp_path):
     content = (tmp_path / 'b' / 'file.json').read_text()
     assert '\n' in content
     assert json.loads(content) == payload
+
+
+def test_step_executor_returns_results_and_errors():
+    executor = helpers.StepExecutor(max_workers=2, name='test')
+
+    def fail():
+        raise RuntimeError('boom')
+
+    first = executor.run('ok', lambda: current_thread().name, timeout=5)
+    assert executor.run('ok', lambda: current_thread().name, timeout=5) == first
+    assert first.startswith('test-')
+    with pytest.raises(RuntimeError, match='boom'):
+        executor.run('broken', fail, timeout=5)
+
+    assert executor.stats['ok']['runs'] == 2
+    assert executor.stats['ok']['errors'] == 0
+    assert executor.stats['broken']['errors'] == 1
+    assert executor.stats['broken']['timeouts'] == 0
+
+
+def test_step_executor_cancels_timed_out_steps(monkeypatch, tmp_path):
+    monkeypatch.setattr(helpers, 'debug_print', lambda *args, **kwargs: None)
+    executor = helpers.StepExecutor(max_workers=1, name='test-cancel')
+    release = Event()
+    finished = Event()
+    outcome = []
+    fetched = []
+
+    def slow_write():
+        release.wait(5)
+        try:
+            helpers.write_json_files(str(tmp_path / 'stale'), {'x': 1})
+        except helpers.StepCancelledError as e:
+            outcome.append(e)
+            raise
+        finally:
+            finished.set()
+
+    def slow_pages():
+        for item in helpers.iter_cancellable(range(3)):
+            fetched.append(item)
+            release.wait(5)
+
+    with pytest.raises(helpers.StepTimeoutError):
+        executor.run('slow', slow_write, timeout=0.01)
+    release.set()
+    assert finished.wait(5)
+    assert outcome
+    assert not (tmp_path / 'stale.json').exists()
+
+    release.clear()
+    with pytest.raises(helpers.StepTimeoutError):
+        executor.run('pages', slow_pages, timeout=0.01)
+    release.set()
+    workers = {executor.run('after', lambda: current_thread().name, timeout=5) for _ in range(3)}
+
+    assert fetched == [0]
+    assert workers == {'test-cancel-1'}
+    assert executor.stats['slow']['timeouts'] == 1
+    assert executor.stats['pages']['timeouts'] == 1
+
+
+def test_step_executor_timeout_starts_when_step_runs():
+    executor = helpers.StepExecutor(max_workers=1, name='test-queue')
+    release = Event()
+    results = []
+
+    def blocker():
+        release.wait(5)
+        return 'blocker'
+
+    first = Thread(target=lambda: results.append(executor.run('blocker', blocker, timeout=5)))
+    first.start()
+    queued = Thread(target=lambda: results.append(executor.run('queued', lambda: 'queued', timeout=0.05)))
+    queued.start()
+    time.sleep(0.2)
+    release.set()
+    first.join(5)
+    queued.join(5)
+
+    assert sorted(results) == ['blocker', 'queued']
+    assert executor.stats['queued']['timeouts'] == 0
+    assert executor.stats['queued']['seconds'] < 0.2
+
+    task = helpers._StepTask(lambda: pytest.fail('cancelled task ran'))
+    task.cancelled.set()
+    task.run()
+    assert task.done.is_set()
+    assert not task.success
+
+
+def _response(status_code=200, body=b'{}', headers=None, url='https://example.com/data'):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    response.encoding = 'utf-8'
+    return response
+
+
+def test_http_cache_key_scopes_by_auth_params_and_accept():
+    key = helpers.HttpCache.key('https://example.com/a', {'page': 1}, {'Authorization': 'token a'})
+
+    assert key == helpers.HttpCache.key('https://example.com/a', {'page': 1}, {'authorization': 'token a'})
+    assert key != helpers.HttpCache.key('https://example.com/a', {'page': 1}, {'Authorization': 'token b'})
+    assert key != helpers.HttpCache.key('https://example.com/a', {'page': 2}, {'Authorization': 'token a'})
+    assert key != helpers.HttpCache.key(
+        'https://example.com/a', {'page': 1}, {'Authorization': 'token a', 'Accept': 'text/html'})
+    assert helpers.HttpCache.key('https://example.com/a', None, None) != key
+
+
+def test_http_cache_store_load_and_evict(tmp_path):
+    cache = helpers.HttpCache(str(tmp_path), max_bytes=3000)
+
+    assert cache.load('missing') is None
+    cache.store('nothing', _response(body=b'x'))
+    assert cache.load('nothing') is None
+
+    cache.store('aa1', _response(body=b'a' * 1000, headers={'ETag': '"1"', 'Set-Cookie': 'secret'}))
+    meta, body = cache.load('aa1')
+    assert body == b'a' * 1000
+    assert meta['etag'] == '"1"'
+    assert 'Set-Cookie' not in meta['headers']
+
+    (tmp_path / 'aa' / 'ignored.txt').write_text('x', encoding='utf-8')
+    (tmp_path / 'aa' / 'orphan.json').write_text('{}', encoding='utf-8')
+    cache.store('aa2', _response(body=b'b' * 1000, headers={'Last-Modified': 'yesterday'}))
+    assert cache.load('aa2') is not None
+
+    old = time.time() - 100
+    os.utime(tmp_path / 'aa' / 'aa1.json', (old, old))
+    cache.store('bb3', _response(body=b'c' * 1000, headers={'ETag': '"3"'}))
+
+    assert cache.load('aa1') is None
+    assert cache.load('bb3') is not None
+    assert cache._size <= 3000
+
+
+def test_conditional_request_mixin_revalidates(monkeypatch, tmp_path):
+    responses = [
+        _response(body=b'{"v": 1}', headers={'ETag': '"v1"', 'Last-Modified': 'today', 'X-RateLimit-Remaining': '9'}),
+        _response(status_code=304, body=b'', headers={'X-RateLimit-Remaining': '8'}),
+        _response(status_code=500, body=b'err'),
+    ]
+    calls = []
+
+    def fake_request(self, method, url, *args, **kwargs):
+        calls.append((method, kwargs.get('headers')))
+        return responses.pop(0)
+
+    monkeypatch.setattr('requests.Session.request', fake_request)
+    session = helpers.TimeoutSession()
+    session.http_cache = helpers.HttpCache(str(tmp_path))
+
+    first = session.request('GET', 'https://example.com/data', headers={'Authorization': 'token'})
+    second = session.request('GET', 'https://example.com/data', headers={'Authorization': 'token'})
+    third = session.request('GET', 'https://example.com/data', headers={'Authorization': 'token'})
+
+    assert first.json() == {'v': 1}
+    assert second.status_code == 200
+    assert second.json() == {'v': 1}
+    assert second.from_cache is True
+    assert second.headers['X-RateLimit-Remaining'] == '8'
+    assert calls[1][1]['If-None-Match'] == '"v1"'
+    assert calls[1][1]['If-Modified-Since'] == 'today'
+    assert third.status_code == 500
+
+
+def test_conditional_request_mixin_passthrough_and_store_errors(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        'requests.Session.request',
+        lambda self, method, url, *args, **kwargs: _response(headers={'ETag': '"x"'}),
+    )
+    session = helpers.TimeoutSession()
+    assert session.request('POST', 'https://example.com').status_code == 200
+
+    session.http_cache = helpers.HttpCache(str(tmp_path))
+    assert session.request('POST', 'https://example.com').status_code == 200
+    assert session.request('GET', 'https://example.com', stream=True).status_code == 200
+    assert not any(tmp_path.iterdir())
+
+    warnings = []
+    monkeypatch.setattr(helpers.log, 'warning', lambda msg: warnings.append(msg))
+
+    def fail_store(key, response):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(session.http_cache, 'store', fail_store)
+    assert session.request('GET', 'https://example.com').status_code == 200
+    assert warnings
+
+
+def test_http_cache_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv('DASHBOARD_HTTP_CACHE_MAX_BYTES', raising=False)
+    monkeypatch.delenv('DASHBOARD_HTTP_CACHE_DIR', raising=False)
+    cache = helpers._http_cache_from_env()
+    assert cache.directory.endswith('http')
+    assert cache.max_bytes == helpers.HTTP_CACHE_MAX_BYTES
+
+    monkeypatch.setenv('DASHBOARD_HTTP_CACHE_DIR', str(tmp_path))
+    monkeypatch.setenv('DASHBOARD_HTTP_CACHE_MAX_BYTES', '1000')
+    cache = helpers._http_cache_from_env()
+    assert cache.directory == str(tmp_path)
+    assert cache.max_bytes == 1000
+
+    monkeypatch.setenv('DASHBOARD_HTTP_CACHE_MAX_BYTES', '0')
+    assert helpers._http_cache_from_env() is None
+    monkeypatch.setenv('DASHBOARD_HTTP_CACHE_MAX_BYTES', 'lots')
+    assert helpers._http_cache_from_env() is None
+
+
+def test_rate_limit_scheduler_key():
+    key = helpers.RateLimitScheduler.key
+    auth = {'Authorization': 'token abc'}
+
+    assert key('https://API.github.com/repos/o/r', auth)[:2] == ('api.github.com', 'core')
+    assert key('https://api.github.com/graphql', auth)[1] == 'graphql'
+    assert key('https://api.github.com/search/issues?q=x', auth)[1] == 'search'
+    assert key('https://api.github.com/repos/o/r', None)[2] == 'anonymous'
+    assert key('https://api.github.com/repos/o/r', auth)[2] != key('https://api.github.com/repos/o/r', {})[2]
+
+
+def test_rate_limit_scheduler_paces_and_pauses(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 1000.0)
+    scheduler = helpers.RateLimitScheduler(reserve=10, pace_fraction=0.1)
+    key = ('api.github.com', 'core', 'anonymous')
+
+    assert scheduler.delay(key) == 0.0
+
+    scheduler.observe(key, remaining=4000, reset=1100.0, limit=5000)
+    assert scheduler.delay(key) == 0.0
+    assert scheduler.budgets[key]['remaining'] == 3999
+
+    scheduler.observe(key, remaining=60, reset=1100.0)
+    assert scheduler.delay(key) == 0.0
+    assert scheduler.delay(key) == pytest.approx(2.0)
+    assert scheduler.budgets[key]['remaining'] == 58
+
+    scheduler.observe(key, remaining=10, reset=1100.0)
+    assert scheduler.delay(key) == 100.0
+    scheduler.observe(key, remaining=5000, reset=1100.0)
+    assert scheduler.delay(key) == 100.0
+
+    scheduler.observe(key, remaining=0, reset=900.0)
+    scheduler.budgets[key]['pause_until'] = 0.0
+    assert scheduler.delay(key) == 0.0
+
+
+def test_rate_limit_scheduler_graphql_cost(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 1000.0)
+    scheduler = helpers.RateLimitScheduler(reserve=10, pace_fraction=0.1)
+    key = ('api.github.com', 'graphql', 'anonymous')
+
+    scheduler.observe_graphql(key, None)
+    assert key not in scheduler.budgets
+
+    scheduler.observe_graphql(key, {
+        'cost': 5,
+        'remaining': 60,
+        'resetAt': '1970-01-01T00:18:20Z',
+        'limit': 5000,
+    })
+    assert scheduler.budgets[key]['reset'] == 1100.0
+    assert scheduler.delay(key) == 0.0
+    assert scheduler.delay(key) == pytest.approx(10.0)
+    assert scheduler.budgets[key]['remaining'] == 50
+
+    scheduler.observe_graphql(key, {'cost': 5, 'remaining': 14, 'resetAt': None})
+    assert scheduler.delay(key) == 100.0
+
+
+def test_rate_limit_scheduler_tracks_graphql_cost_per_query(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 1000.0)
+    scheduler = helpers.RateLimitScheduler(reserve=10, pace_fraction=0.1)
+    key = ('api.github.com', 'graphql', 'anonymous')
+    batched = scheduler.query_key('query {\n  r0: repository { name }\n  r1: repository { name }\n}')
+    cheap = scheduler.query_key('query { viewer { login } }')
+
+    assert scheduler.query_key(None) is None
+    assert batched == scheduler.query_key('query {\n  r0: repository { name }\n}')
+    assert batched != cheap
+
+    scheduler.observe_graphql(key, {'cost': 40, 'remaining': 4000, 'resetAt': '1970-01-01T00:18:20Z'}, batched)
+    scheduler.observe_graphql(key, {'cost': 20}, batched)
+    assert scheduler.budgets[key]['costs'] == {batched: pytest.approx(34.0)}
+
+    # the expensive batched query does not throttle cheaper ones
+    assert scheduler.delay(key, cheap) == 0.0
+    assert scheduler.budgets[key]['remaining'] == 3999
+    assert scheduler.delay(key, batched) == 0.0
+    assert scheduler.budgets[key]['remaining'] == pytest.approx(3965.0)
+
+
+def test_rate_limit_scheduler_update_from_headers(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 1000.0)
+    warnings = []
+    monkeypatch.setattr(helpers.log, 'warning', lambda msg: warnings.append(msg))
+    scheduler = helpers.RateLimitScheduler()
+    key = ('api.github.com', 'core', 'anonymous')
+
+    scheduler.update(key, _response(headers={'Content-Type': 'text/plain'}))
+    assert key not in scheduler.budgets
+
+    scheduler.update(key, _response(headers={
+        'X-RateLimit-Remaining': '4999',
+        'X-RateLimit-Reset': '4600',
+        'X-RateLimit-Limit': '5000',
+    }))
+    assert scheduler.budgets[key]['remaining'] == 4999
+    assert scheduler.budgets[key]['reset'] == 4600.0
+    assert scheduler.budgets[key]['limit'] == 5000
+
+    scheduler.update(key, _response(status_code=429, headers={'Retry-After': '30'}))
+    assert scheduler.budgets[key]['pause_until'] == 1030.0
+
+    exhausted = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '2000'}
+    scheduler.update(key, _response(status_code=403, headers=exhausted))
+    assert scheduler.budgets[key]['pause_until'] == 2000.0
+    assert len(warnings) == 2
+
+
+def test_rate_limit_scheduler_slot_waits(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 1000.0)
+    slept = []
+    monkeypatch.setattr('time.sleep', lambda secs: slept.append(secs))
+    warnings = []
+    monkeypatch.setattr(helpers.log, 'warning', lambda msg: warnings.append(msg))
+    scheduler = helpers.RateLimitScheduler(max_concurrent=1, max_wait=60)
+    key = ('api.github.com', 'core', 'anonymous')
+
+    with scheduler.slot(key):
+        assert not scheduler._semaphores['api.github.com'].acquire(blocking=False)
+    assert slept == []
+
+    scheduler.budgets[key] = {
+        'limit': None, 'remaining': None, 'reset': 0.0, 'pause_until': 1500.0, 'next_at': 0.0, 'costs': {}}
+    with scheduler.slot(key):
+        pass
+    assert slept == [60]
+    assert warnings
+
+
+def test_scheduled_request_mixin(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 1000.0)
+    slept = []
+    monkeypatch.setattr('time.sleep', lambda secs: slept.append(secs))
+    calls = []
+
+    def fake_request(self, method, url, *args, **kwargs):
+        calls.append(url)
+        return _response(headers={'X-RateLimit-Remaining': '1', 'X-RateLimit-Reset': '1010'})
+
+    slots = []
+    slot = helpers.RateLimitScheduler.slot
+    monkeypatch.setattr(
+        helpers.RateLimitScheduler, 'slot', lambda self, key, query=None: slots.append(query) or slot(self, key, query))
+
+    monkeypatch.setattr('requests.Session.request', fake_request)
+    session = helpers.TimeoutSession()
+    session.request('GET', 'https://api.github.com/repos/o/r')
+    session.request('GET', 'https://api.github.com/repos/o/r')
+    assert slept == []
+
+    session.scheduler = helpers.RateLimitScheduler()
+    session.headers['Authorization'] = 'token abc'
+    session.request('GET', 'https://api.github.com/repos/o/r')
+    session.request('GET', 'https://api.github.com/repos/o/r', headers={'Accept': 'application/json'})
+    assert slept == [10.0]
+    assert len(calls) == 4
+
+    session.request('POST', 'https://api.github.com/graphql', json={'query': 'query { viewer { login } }'})
+    assert slots == [None, None, session.scheduler.query_key('query { viewer { login } }')]
+
+
+def test_shared_sessions_use_http_cache():
+    assert isinstance(helpers.cs, helpers.CloudScraperSession)
+    assert helpers.s.http_cache is helpers.http_cache
+    assert helpers.cs.http_cache is helpers.http_cache
+    assert helpers.rtd_s.http_cache is helpers.http_cache
+    assert helpers.s.scheduler is helpers.scheduler
+    assert helpers.cs.scheduler is helpers.scheduler
+    assert helpers.rtd_s.scheduler is helpers.scheduler
+
+
+def test_step_executor_skips_steps_no_worker_picks_up():
+    executor = helpers.StepExecutor(max_workers=1, name='test-busy', queue_timeout=0.05)
+    release = Event()
+
+    with pytest.raises(helpers.StepTimeoutError, match='hog did not finish'):
+        executor.run('hog', lambda: release.wait(5), timeout=0.01)
+    with pytest.raises(helpers.StepTimeoutError, match='queued was not started within 0.05s'):
+        executor.run('queued', lambda: pytest.fail('skipped step ran'), timeout=5)
+    release.set()
+
+    assert executor.run('after', lambda: 'ran', timeout=5) == 'ran'
+    assert executor.stats['queued'] == {'runs': 1, 'errors': 0, 'timeouts': 0, 'skipped': 1, 'seconds': 0.0}
@@ -13,5 +13,7 @@ def test_src_init_sets_paths_and_loads_dotenv(monkeypatch):
     assert calls
     assert reloaded.BASE_DIR.endswith('gh-pages')
     assert reloaded.TEMPLATE_DIR.endswith('gh-pages-template')
+    assert reloaded.CACHE_DIR.endswith('.cache')
     assert os.path.isabs(reloaded.BASE_DIR)
     assert os.path.isabs(reloaded.TEMPLATE_DIR)
+    assert os.path.isabs(reloaded.CACHE_DIR)
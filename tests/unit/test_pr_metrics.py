@@ -1,12 +1,14 @@
 # standard imports
 import json
 from datetime import datetime, timedelta, timezone
+from statistics import median
 from types import SimpleNamespace
 
 # lib imports
 import pytest
 
 # local imports
+from src import helpers
 from src import pr_metrics
 
 
@@ -51,7 +53,10 @@ def _node(number=1, state='OPEN', updated='2026-03-01T00:00:00Z', reviews=None,
         'deletions': 2,
         'changedFiles': 3,
         'reviewDecision': None,
-        'author': {'login': 'author'},
+        'author': {'login': 'author', '__typename': 'User'},
+        'labels': {'nodes': [{'name': 'bug'}]},
+        'assignees': {'nodes': [{'login': 'owner'}]},
+        'milestone': {'title': 'v1'},
         'reviews': {'totalCount': len(reviews), 'nodes': reviews},
         'approvals': {'nodes': approvals},
         'reactionGroups': reactions,
@@ -152,6 +157,18 @@ def test_graphql_connection_success_and_errors():
     with pytest.raises(RuntimeError, match='failed'):
         pr_metrics._graphql_connection(http_error_session, {}, {})
 
+    scheduler = helpers.RateLimitScheduler()
+    scheduled_session = FakeSession([FakeResponse({'data': {
+        'rateLimit': {'cost': 3, 'remaining': 4000, 'resetAt': '2026-01-01T00:00:00Z', 'limit': 5000},
+        'repository': {'pullRequests': connection},
+    }})])
+    scheduled_session.scheduler = scheduler
+    scheduled_session.headers = {}
+    pr_metrics._graphql_connection(scheduled_session, {'Authorization': 'token a'}, {})
+    budget = scheduler.budgets[scheduler.key(pr_metrics.GRAPHQL_URL, {'Authorization': 'token a'})]
+    assert (budget['remaining'], budget['limit']) == (4000, 5000)
+    assert budget['costs'] == {scheduler.query_key(pr_metrics.PULL_REQUEST_QUERY): 3}
+
     missing_repo_session = FakeSession([FakeResponse({'data': {'repository': None}})])
     with pytest.raises(RuntimeError, match='did not include'):
         pr_metrics._graphql_connection(missing_repo_session, {}, {})
@@ -174,6 +191,10 @@ def test_normalize_pull_handles_reviews_and_missing_optional_data():
     assert normalized['first_review_at'] == '2026-01-02T00:00:00+00:00'
     assert normalized['first_approval_at'] == '2026-01-02T00:00:00+00:00'
     assert normalized['reactions'] == [{'content': 'THUMBS_UP', 'count': 2}]
+    assert normalized['labels'] == ['bug']
+    assert normalized['assignees'] == ['owner']
+    assert normalized['summary_truncated'] is False
+    assert normalized['milestone'] == 'v1'
 
     minimal = _node(number=2, reviews=[])
     minimal.update({
@@ -189,7 +210,9 @@ def test_normalize_pull_handles_reviews_and_missing_optional_data():
         'approvals': None,
         'reactionGroups': None,
     })
+    minimal['assignees'] = {'pageInfo': {'hasNextPage': True}, 'nodes': [{'login': 'owner'}]}
     normalized_minimal = pr_metrics._normalize_pull('demo', minimal)
+    assert normalized_minimal['summary_truncated'] is True
     assert normalized_minimal['title'] == ''
     assert normalized_minimal['state'] == ''
     assert normalized_minimal['draft'] is True
@@ -197,6 +220,40 @@ def test_normalize_pull_handles_reviews_and_missing_optional_data():
     assert normalized_minimal['review_count'] == 0
 
 
+def test_open_pull_summaries():
+    cache = {'pull_requests': [
+        _pull(1, labels=['bug'], assignees=['owner'], milestone='v1'),
+        _pull(2, state='merged'),
+        _pull(3, author='renovate', author_type='Bot', draft=True, created_at='2026-01-01T00:00:00Z'),
+    ]}
+
+    assert pr_metrics.open_pull_summaries(cache) == [
+        {
+            'number': 3,
+            'title': 'PR 3',
+            'author': 'renovate[bot]',
+            'labels': [],
+            'assignees': [],
+            'created_at': '2026-01-01T00:00:00+00:00',
+            'updated_at': '2026-03-01T00:00:00+00:00',
+            'draft': True,
+            'milestone': None,
+        },
+        {
+            'number': 1,
+            'title': 'PR 1',
+            'author': 'author',
+            'labels': ['bug'],
+            'assignees': ['owner'],
+            'created_at': '2026-01-01T00:00:00+00:00',
+            'updated_at': '2026-03-01T00:00:00+00:00',
+            'draft': False,
+            'milestone': 'v1',
+        },
+    ]
+    assert pr_metrics.open_pull_summaries(None) == []
+
+
 def test_fetch_connection_paginates_and_stops_at_cutoff(monkeypatch):
     repo = SimpleNamespace(name='demo', owner=SimpleNamespace(login='LizardByte'))
     pages = [
@@ -239,12 +296,55 @@ def test_fetch_connection_requires_cursor(monkeypatch):
         pr_metrics._fetch_connection(repo, {}, object(), ['OPEN'])
 
 
+def test_fetch_first_pages_and_follow_up(monkeypatch):
+    repos = [
+        SimpleNamespace(name='one', owner=SimpleNamespace(login='LizardByte')),
+        SimpleNamespace(name='gone', owner=SimpleNamespace(login='LizardByte')),
+    ]
+    first_pages = {
+        'open': {'nodes': [_node(1)], 'pageInfo': {'hasNextPage': False}},
+        'completed': {
+            'nodes': [_node(2, state='MERGED')],
+            'pageInfo': {'hasNextPage': True, 'endCursor': 'next'},
+        },
+    }
+    session = FakeSession([FakeResponse({'data': {'r0': first_pages, 'r1': None}})])
+
+    pages = pr_metrics.fetch_first_pages(repos, {}, session)
+
+    assert pages == {'one': first_pages}
+    query = session.calls[0]['json']['query']
+    assert 'r1: repository(owner: $owner1, name: $name1)' in query
+    assert query.count('fragment PullRequestPage') == 1
+    assert session.calls[0]['json']['variables'] == {
+        'owner0': 'LizardByte', 'name0': 'one', 'owner1': 'LizardByte', 'name1': 'gone'}
+    assert query.count('completed: pullRequests') == 2
+
+    session = FakeSession([FakeResponse({'data': {'r0': {'open': first_pages['open']}, 'r1': None}})])
+    assert pr_metrics.fetch_first_pages(repos, {}, session, open_only=frozenset({'one'})) == {
+        'one': {'open': first_pages['open']}}
+    assert session.calls[0]['json']['query'].count('completed: pullRequests') == 1
+
+    follow_ups = []
+
+    def fake_connection(session, headers, variables):
+        follow_ups.append((variables['states'], variables['cursor']))
+        return {'nodes': [_node(3, state='CLOSED')], 'pageInfo': {'hasNextPage': False}}
+
+    monkeypatch.setattr(pr_metrics, '_graphql_connection', fake_connection)
+    pulls = pr_metrics.fetch_repository(
+        repos[0], {}, object(), datetime(2026, 3, 20, tzinfo=timezone.utc), first_pages=pages['one'])
+
+    assert sorted(pull['number'] for pull in pulls) == [1, 2, 3]
+    assert follow_ups == [(['CLOSED', 'MERGED'], 'next')]
+
+
 def test_fetch_repository_combines_deduplicates_and_sorts(monkeypatch):
     now = datetime(2026, 3, 20, tzinfo=timezone.utc)
     repo = SimpleNamespace(name='demo', owner=SimpleNamespace(login='LizardByte'))
     calls = []
 
-    def fake_fetch(repository, headers, session, states, cutoff=None):
+    def fake_fetch(repository, headers, session, states, cutoff=None, first_page=None):
         calls.append((states, cutoff))
         if states == ['OPEN']:
             return [_pull(1, updated_at='2026-03-01T00:00:00+00:00')]
@@ -275,11 +375,32 @@ def test_refresh_repository_uses_fresh_cache_and_writes_stale_cache(monkeypatch,
     path = tmp_path / 'github' / 'prMetrics' / 'demo.json'
     path.parent.mkdir(parents=True)
     path.write_text(json.dumps(fresh), encoding='utf-8')
-    monkeypatch.setattr(pr_metrics, 'fetch_repository', lambda *args: pytest.fail('unexpected fetch'))
-    assert not pr_metrics.refresh_repository(repo, str(tmp_path), {}, object(), now)
+    path.write_text(json.dumps({**fresh, 'pull_requests': [_pull(1), _pull(2), _pull(3, state='merged')]}))
+    monkeypatch.setattr(pr_metrics, 'fetch_repository', lambda *args, **kwargs: pytest.fail('unexpected fetch'))
+    open_fetches = []
+
+    def fetch_open(repository, headers, session, cached, since, first_pages):
+        open_fetches.append(([pull['number'] for pull in cached], since, first_pages))
+        return [_pull(2, title='renamed'), _pull(4)]
+
+    # a fresh cache still refreshes its open pull requests, dropping ones no longer open
+    monkeypatch.setattr(pr_metrics, 'fetch_open_pulls', fetch_open)
+    assert not pr_metrics.refresh_repository(repo, str(tmp_path), {}, object(), now, {'open': 'page'})
+    written = json.loads(path.read_text(encoding='utf-8'))
+    assert sorted(pull['number'] for pull in written['pull_requests']) == [2, 3, 4]
+    assert [pull['title'] for pull in written['pull_requests'] if pull['number'] == 2] == ['renamed']
+    assert written['collected_at'] == fresh['collected_at']
+    assert written['open_collected_at'] == now.isoformat()
+    assert open_fetches == [([1, 2, 3], now - timedelta(hours=1) - pr_metrics.INCREMENTAL_OVERLAP, {'open': 'page'})]
+
+    # the next run only refetches open pull requests updated since this refresh
+    later = now + timedelta(hours=3)
+    assert not pr_metrics.refresh_repository(repo, str(tmp_path), {}, object(), later)
+    assert open_fetches[1][1] == now - pr_metrics.INCREMENTAL_OVERLAP
+    assert pr_metrics._open_since({'collected_at': 'invalid'}) is None
 
     path.write_text(json.dumps({**fresh, 'collected_at': '2026-01-01T00:00:00+00:00'}), encoding='utf-8')
-    monkeypatch.setattr(pr_metrics, 'fetch_repository', lambda *args: [_pull(1)])
+    monkeypatch.setattr(pr_metrics, 'fetch_repository', lambda *args, **kwargs: [_pull(1)])
     assert pr_metrics.refresh_repository(repo, str(tmp_path), {}, object(), now)
     written = json.loads(path.read_text(encoding='utf-8'))
     assert written['pull_requests'][0]['number'] == 1
@@ -290,6 +411,128 @@ def test_refresh_repository_uses_fresh_cache_and_writes_stale_cache(monkeypatch,
     assert pr_metrics.refresh_repository(repo, str(tmp_path), {}, object())
 
 
+def test_fetch_repository_since_narrows_completed_cutoff(monkeypatch):
+    now = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    repo = SimpleNamespace(name='demo', owner=SimpleNamespace(login='LizardByte'))
+    cutoffs = []
+    monkeypatch.setattr(
+        pr_metrics,
+        '_fetch_connection',
+        lambda repository, headers, session, states, cutoff=None, first_page=None: cutoffs.append(cutoff) or [],
+    )
+
+    pr_metrics.fetch_repository(repo, {}, object(), now, now - timedelta(days=1))
+    pr_metrics.fetch_repository(repo, {}, object(), now, now - timedelta(days=900))
+
+    assert cutoffs == [None, now - timedelta(days=1), None, now - timedelta(days=pr_metrics.HISTORY_DAYS)]
+
+
+def test_fetch_open_pulls_refetches_only_changed_pulls(monkeypatch):
+    since = datetime(2026, 3, 19, tzinfo=timezone.utc)
+    repo = SimpleNamespace(name='demo', owner=SimpleNamespace(login='LizardByte'))
+    cached = [_pull(1), _pull(2), _pull(3), _pull(4, state='merged')]
+    fetches = []
+
+    def fake_fetch(repository, headers, session, states, cutoff=None, first_page=None):
+        fetches.append((states, cutoff, first_page))
+        if cutoff:
+            return [_pull(2, title='changed')]
+        return [_pull(number, title='full') for number in (1, 2, 5)]
+
+    monkeypatch.setattr(pr_metrics, '_fetch_connection', fake_fetch)
+    first_pages = {
+        'open': 'page',
+        'open_numbers': {'nodes': [{'number': 1}, {'number': 2}], 'pageInfo': {'hasNextPage': False}},
+    }
+
+    # pull 3 closed, so it drops out without its full record being paged
+    pulls = pr_metrics.fetch_open_pulls(repo, {}, object(), cached, since, first_pages)
+    assert {pull['number']: pull['title'] for pull in pulls} == {1: 'PR 1', 2: 'changed'}
+    assert fetches == [(['OPEN'], since, 'page')]
+
+    # without a cache every open pull request is fetched
+    fetches.clear()
+    assert len(pr_metrics.fetch_open_pulls(repo, {}, object(), None, since, first_pages)) == 3
+    assert fetches == [(['OPEN'], None, 'page')]
+
+    # an open pull request the cache never saw falls back to the full open set
+    fetches.clear()
+    first_pages['open_numbers']['nodes'].append({'number': 5})
+    pulls = pr_metrics.fetch_open_pulls(repo, {}, object(), cached, since, first_pages)
+    assert sorted(pull['number'] for pull in pulls) == [1, 2, 5]
+    assert fetches == [(['OPEN'], since, 'page'), (['OPEN'], None, None)]
+
+
+def test_fetch_open_numbers_pages(monkeypatch):
+    repo = SimpleNamespace(name='demo', owner=SimpleNamespace(login='LizardByte'))
+    pages = [
+        {'nodes': [{'number': 2}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'next'}},
+        {'nodes': [{'number': 1}], 'pageInfo': {'hasNextPage': False}},
+    ]
+    requests = []
+
+    def fake_connection(session, headers, variables, query):
+        requests.append((variables['cursor'], query))
+        return pages.pop(0)
+
+    monkeypatch.setattr(pr_metrics, '_graphql_connection', fake_connection)
+    assert pr_metrics._fetch_open_numbers(repo, {}, object()) == {1, 2}
+    assert requests == [(None, pr_metrics.OPEN_NUMBERS_QUERY), ('next', pr_metrics.OPEN_NUMBERS_QUERY)]
+
+    with pytest.raises(RuntimeError, match='end cursor'):
+        pr_metrics._fetch_open_numbers(repo, {}, object(), {'nodes': [], 'pageInfo': {'hasNextPage': True}})
+
+
+def test_merge_pulls_replaces_closes_and_prunes():
+    now = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    cached = [
+        _pull(1, title='old title'),
+        _pull(2),
+        _pull(3, state='merged', updated_at='2026-02-01T00:00:00+00:00'),
+        _pull(4, state='closed', updated_at='2025-01-01T00:00:00+00:00'),
+    ]
+    fetched = [
+        _pull(1, title='new title', updated_at='2026-03-19T00:00:00+00:00'),
+        _pull(5, state='merged', updated_at='2026-03-18T00:00:00+00:00'),
+    ]
+
+    merged = pr_metrics.merge_pulls(cached, fetched, now)
+
+    assert [pull['number'] for pull in merged] == [1, 5, 3]
+    assert merged[0]['title'] == 'new title'
+
+
+def test_refresh_repository_merges_recent_cache(monkeypatch, tmp_path):
+    now = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    repo = SimpleNamespace(name='demo', owner=SimpleNamespace(login='LizardByte'))
+    collected_at = now - timedelta(days=2)
+    path = tmp_path / 'github' / 'prMetrics' / 'demo.json'
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({
+        'repository': 'demo',
+        'collected_at': collected_at.isoformat(),
+        'cache_version': pr_metrics.CACHE_VERSION,
+        'history_days': pr_metrics.HISTORY_DAYS,
+        'pull_requests': [_pull(1, state='merged')],
+    }), encoding='utf-8')
+    calls = []
+
+    def fake_fetch(repository, headers, session, current_now, since=None, first_pages=None, cached=None):
+        calls.append(since)
+        assert [pull['number'] for pull in cached] == [1]
+        return [_pull(2, updated_at='2026-03-19T00:00:00+00:00')]
+
+    monkeypatch.setattr(pr_metrics, 'fetch_repository', fake_fetch)
+    assert pr_metrics.refresh_repository(repo, str(tmp_path), {}, object(), now)
+
+    written = json.loads(path.read_text(encoding='utf-8'))
+    assert [pull['number'] for pull in written['pull_requests']] == [2, 1]
+    assert calls == [collected_at - pr_metrics.INCREMENTAL_OVERLAP]
+
+    assert pr_metrics._incremental_since(None, now) is None
+    assert pr_metrics._incremental_since({**written, 'collected_at': 'invalid'}, now) is None
+
+
 def test_calculation_and_formatting_helpers():
     now = datetime(2026, 3, 20, tzinfo=timezone.utc)
     pulls = [
@@ -353,7 +596,6 @@ def test_calculation_and_formatting_helpers():
     empty = pr_metrics.calculate([], now)
     assert empty['merge_rate'] is None
     assert empty['median_merge_hours'] is None
-    assert pr_metrics._hours_between(None, None) is None
     assert pr_metrics._percentile([], 0.75) is None
     assert pr_metrics._percentile([4], 0.75) == 4
     assert pr_metrics._format_duration(None) == '—'
@@ -378,6 +620,213 @@ def test_calculation_and_formatting_helpers():
     ]) == '6 — 👍 3 ❤️ 2 CUSTOM 1'
 
 
+def test_calculate_reuses_parsed_records_and_pending_views():
+    now = datetime(2026, 3, 20, 12, 30, 15, 500, tzinfo=timezone.utc)
+    pulls = [
+        _pull(1, created_at='2026-03-19T12:30:16Z', updated_at='2026-02-18T12:30:15Z'),
+        _pull(2, created_at='2026-03-10T00:00:00+00:00', updated_at='2026-02-18T12:30:14+00:00'),
+    ]
+    records = pr_metrics.pull_records(pulls)
+    assert pr_metrics.pull_records(records)[0] is records[0]
+    assert records[0].created == int(datetime(2026, 3, 19, 12, 30, 16, tzinfo=timezone.utc).timestamp())
+
+    metrics = pr_metrics.calculate(records, now)
+    from_dicts = pr_metrics.calculate(pulls, now)
+    assert {key: value for key, value in metrics.items() if key != 'pending'} == {
+        key: value for key, value in from_dicts.items() if key != 'pending'}
+    assert metrics['stale'] == 1
+    oldest, newest = metrics['pending']
+    assert oldest['number'] == 2
+    assert oldest.get('age_days') == 10
+    assert oldest['inactive_days'] == 30
+    assert newest['age_days'] == 0
+    assert newest.get('missing', 'default') == 'default'
+    assert newest.pull is pulls[0]
+
+
+def test_metrics_engine_memoizes_and_merges_repository_aggregates(monkeypatch):
+    now = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    merged = {
+        'state': 'merged',
+        'updated_at': '2026-03-05T00:00:00+00:00',
+        'merged_at': '2026-03-05T00:00:00+00:00',
+        'closed_at': '2026-03-05T00:00:00+00:00',
+        'first_review_at': '2026-03-02T00:00:00+00:00',
+    }
+    caches = {
+        'one': {'pull_requests': [
+            _pull(1, created_at='2026-02-01T00:00:00+00:00'),
+            _pull(2, created_at='2026-03-01T00:00:00+00:00', **merged),
+        ]},
+        'two': {'pull_requests': [
+            _pull(3, created_at='2026-01-15T00:00:00+00:00', draft=True),
+            _pull(4, created_at='2026-03-03T00:00:00+00:00', **merged),
+            _pull(5, created_at=None),
+        ]},
+        'missing': None,
+    }
+    calls = []
+    original = pr_metrics.window_aggregates
+    monkeypatch.setattr(pr_metrics, 'window_aggregates', lambda *args: calls.append(args) or original(*args))
+
+    engine = pr_metrics.MetricsEngine(caches, now)
+    totals = engine.totals()
+    assert engine.totals() is totals
+    assert engine.metrics('one') is engine.metrics('one')
+    assert len(calls) == 3
+
+    all_pulls = [pull for cache in caches.values() if cache for pull in cache['pull_requests']]
+    expected = pr_metrics.calculate(all_pulls, now)
+    for key, value in expected.items():
+        if key.endswith('_hours') and value is not None:
+            assert totals[key] == pytest.approx(value, rel=pr_metrics.SKETCH_ACCURACY)
+        elif key != 'pending':
+            assert totals[key] == value
+    assert [pull['number'] for pull in totals['pending']] == [1, 5]
+    assert totals['median_merge_hours'] == pytest.approx(72, rel=pr_metrics.SKETCH_ACCURACY)
+    assert engine.metrics('missing')['open'] == 0
+
+    summary = engine.summary()
+    assert summary['windows'] == [7, 30, 90, 365]
+    assert summary['totals']['90']['merged'] == 2
+    assert summary['totals']['7']['merged'] == 0
+    assert set(summary['repositories']) == {'one', 'two', 'missing'}
+    assert isinstance(engine.aggregates('two')[90]['merge_hours'], pr_metrics.QuantileSketch)
+    assert all('pending' not in metrics['90'] for metrics in summary['repositories'].values())
+    assert len(calls) == 4
+    assert engine.caches == {}
+
+    # repositories fed one at a time give the same results without keeping their caches
+    streamed = pr_metrics.MetricsEngine({}, now)
+    assert streamed.totals()['open'] == 0
+    for repository, cache in caches.items():
+        streamed.add(repository, cache)
+        assert streamed.caches == {}
+    assert streamed.summary() == summary
+    assert not streamed.available('missing')
+
+
+def _brute_force_window(pulls: list[dict], now: datetime, days: int) -> dict:
+    """Filter raw pull requests to one window and compute its metrics directly."""
+    cutoff = now - timedelta(days=days)
+
+    def parsed(value):
+        return datetime.fromisoformat(value) if value else None
+
+    def hours(pull, field):
+        return (parsed(pull[field]) - parsed(pull['created_at'])).total_seconds() / 3600
+
+    merged = [pull for pull in pulls if pull['merged_at'] and parsed(pull['merged_at']) >= cutoff]
+    lead_times = {
+        'merge_hours': sorted(hours(pull, 'merged_at') for pull in merged),
+        'review_hours': sorted(hours(pull, 'first_review_at') for pull in merged if pull['first_review_at']),
+        'approval_hours': sorted(hours(pull, 'first_approval_at') for pull in merged if pull['first_approval_at']),
+    }
+    return {
+        'opened': sum(1 for pull in pulls if parsed(pull['created_at']) >= cutoff),
+        'merged': len(merged),
+        'closed_unmerged': sum(
+            1 for pull in pulls
+            if pull['state'] == 'closed' and not pull['merged_at'] and parsed(pull['closed_at']) >= cutoff
+        ),
+        'merged_without_review': sum(1 for pull in merged if not pull['review_count']),
+        'merged_without_approval': sum(1 for pull in merged if not pull['first_approval_at']),
+        'additions': sum(pull['additions'] for pull in merged),
+        'deletions': sum(pull['deletions'] for pull in merged),
+        **lead_times,
+        **{f'median_{field}': median(values) if values else None for field, values in lead_times.items()},
+    }
+
+
+def test_window_aggregates_match_brute_force_reference():
+    now = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    pulls = [
+        _pull(1, state='merged', created_at='2026-03-15T00:00:00+00:00', merged_at='2026-03-16T00:00:00+00:00',
+              first_approval_at='2026-03-15T12:00:00+00:00', review_count=1, additions=5),
+        _pull(2, state='merged', created_at='2026-02-01T00:00:00+00:00', merged_at='2026-03-01T00:00:00+00:00'),
+        _pull(3, state='closed', created_at='2025-06-01T00:00:00+00:00', closed_at='2025-09-01T00:00:00+00:00'),
+        _pull(4, state='merged', created_at='2025-10-01T00:00:00+00:00', merged_at='2025-10-03T00:00:00+00:00',
+              first_review_at='2025-10-02T00:00:00+00:00'),
+        _pull(5, created_at='2026-03-19T00:00:00+00:00'),
+        _pull(6, state='merged', created_at='2026-03-10T00:00:00+00:00', merged_at='2026-03-14T06:00:00+00:00',
+              first_review_at='2026-03-11T00:00:00+00:00', first_approval_at='2026-03-12T00:00:00+00:00',
+              review_count=2, additions=40, deletions=9),
+        _pull(7, state='closed', created_at='2026-03-01T00:00:00+00:00', closed_at='2026-03-18T00:00:00+00:00'),
+        _pull(8, state='merged', created_at='2026-01-20T00:00:00+00:00', merged_at='2026-02-25T00:00:00+00:00',
+              first_review_at='2026-01-21T00:00:00+00:00', review_count=1, deletions=30),
+    ]
+    windows = pr_metrics.window_aggregates(pr_metrics.pull_records(pulls), now)
+    assert set(windows) == set(pr_metrics.WINDOW_DAYS)
+    for days, partial in windows.items():
+        expected = _brute_force_window(pulls, now, days)
+        for field in ('merge_hours', 'review_hours', 'approval_hours'):
+            assert partial[field] == pytest.approx(expected[field])
+            assert pr_metrics._percentile(partial[field], 0.5) == (
+                pytest.approx(expected[f'median_{field}']) if expected[field] else None)
+        assert {field: partial[field] for field in expected if field in partial} == pytest.approx(
+            {field: value for field, value in expected.items() if field in partial})
+    assert [windows[days]['merged'] for days in (7, 30, 365)] == [2, 4, 5]
+
+
+def test_backlog_series_sweeps_open_and_merged_events():
+    now = datetime(2026, 3, 20, 15, tzinfo=timezone.utc)
+    pulls = [
+        _pull(1, created_at='2026-03-15T10:00:00+00:00'),
+        _pull(2, state='merged', created_at='2026-03-16T00:00:00+00:00', merged_at='2026-03-18T12:00:00+00:00',
+              closed_at='2026-03-18T12:00:00+00:00'),
+        _pull(3, state='closed', created_at='2025-01-01T00:00:00+00:00', closed_at='2026-03-17T00:00:00+00:00'),
+        _pull(4, state='closed', created_at='2025-01-01T00:00:00+00:00', closed_at='2025-02-01T00:00:00+00:00'),
+        _pull(5, state='closed', created_at='2026-03-19T01:00:00+00:00', closed_at='2026-03-19T02:00:00+00:00'),
+        _pull(6, created_at=None),
+    ]
+    series = pr_metrics.backlog_series(pulls, now, days=7)
+    assert series == {
+        'open': [1, 2, 3, 2, 1, 1, 1],
+        'merged': [0, 0, 0, 0, 1, 0, 0],
+    }
+    assert pr_metrics.backlog_series(pulls, now)['open'][0] == 1
+
+    caches = {'a': {'pull_requests': pulls}, 'b': {'pull_requests': pulls[:1]}, 'c': None}
+    engine = pr_metrics.MetricsEngine(caches, now)
+    assert engine.backlog_series('a') is engine.backlog_series('a')
+    org = engine.series()
+    assert org['start'] == '2025-03-21'
+    assert org['days'] == len(org['totals']['open']) == 365
+    assert org['totals']['open'][-1] == 2
+    assert org['totals']['merged'][-3] == 1
+    assert org['repositories']['c'] == {'open': [0] * 365, 'merged': [0] * 365}
+
+
+def test_quantile_sketch_merges_within_relative_accuracy():
+    first = pr_metrics.QuantileSketch.from_values([0, 1.5, 3, 10, 200])
+    second = pr_metrics.QuantileSketch.from_values([-1, 48, 72])
+    assert first.quantile(0.5) == pytest.approx(3, rel=0.01)
+    assert first.quantile(0) == 0
+    assert first.quantile(1.5) is None
+    assert pr_metrics.QuantileSketch().quantile(0.5) is None
+
+    first.merge(second)
+    assert first.count == 8
+    assert first.zero == 1
+    assert first.quantile(0) == pytest.approx(-1, rel=0.01)
+    assert first.quantile(0.75) == pytest.approx(54, rel=0.01)
+    assert first.quantile(1) == pytest.approx(200, rel=0.01)
+
+    # negative lead times are mirrored, so symmetric values keep an exact zero median
+    mirrored = pr_metrics.QuantileSketch.from_values([-24, 24, -6, 0, 6])
+    assert mirrored.quantile(0.5) == 0
+    assert mirrored.quantile(0.25) == pytest.approx(-6, rel=0.01)
+    assert mirrored.quantile(0.125) == pytest.approx(-15, rel=0.01)
+    assert pr_metrics._lead_time_sketch(first) is first
+
+    merged = pr_metrics.merge_aggregates([
+        {**dict.fromkeys(pr_metrics.AGGREGATE_COUNTS, 0), 'merge_hours': first, 'review_hours': [1.0],
+         'approval_hours': [], 'ready_pulls': []},
+    ])
+    assert merged['merge_hours'].count == 8
+    assert pr_metrics.summarize(merged, datetime.now(timezone.utc))['median_first_approval_hours'] is None
+
+
 def test_render_repository_page_covers_pending_statuses():
     now = datetime(2026, 3, 20, tzinfo=timezone.utc)
     cache = {
@@ -402,6 +851,8 @@ def test_render_repository_page_covers_pending_statuses():
     assert 'Awaiting approval' in page
     assert '[3 — 👍 2 ❤️ 1](https://github.com/LizardByte/demo/pull/1)' in page
     assert "{{ '/pr-metrics/' | relative_url }}" in page
+    assert '## Completed work by window' in page
+    assert '| 365 d | 5 | 0 | 0 | — | — | — |' in page
     assert '{{ site.baseurl }}' not in page
     assert 'pr-metrics-sortable' in page
     assert '  - /assets/js/pr-metrics.js' in page
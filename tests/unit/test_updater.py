@@ -1,7 +1,8 @@
 # standard imports
 import json
+import os
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 # lib imports
@@ -10,6 +11,7 @@ import pytest
 import requests
 
 # local imports
+from src import builder
 from src import updater
 
 
@@ -54,8 +56,9 @@ class FakeIssue:
 
 
 class FakeStargazer:
-    def __init__(self, date):
+    def __init__(self, date, login=None):
         self.starred_at = datetime.strptime(date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        self.user = SimpleNamespace(login=login or date)
 
 
 class FakeStargazers:
@@ -386,7 +389,29 @@ def test_run_github_repo_step_timeout(monkeypatch):
     )
 
     assert result == 'fallback'
-    assert warnings == ['Timeout after 0.001s while running GitHub slow step for demo, skipping.']
+    assert warnings == [
+        'Timeout while running GitHub slow step for demo: slow step did not finish within 0.001s, skipping.'
+    ]
+
+
+def test_log_github_step_stats(monkeypatch):
+    infos = []
+    warnings = []
+    monkeypatch.setattr(updater.log, 'info', lambda msg: infos.append(msg))
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+    monkeypatch.setattr(updater.github_steps, 'stats', {
+        'languages': {'runs': 2, 'errors': 0, 'timeouts': 0, 'skipped': 0, 'seconds': 1.0},
+        'star history': {'runs': 2, 'errors': 1, 'timeouts': 1, 'skipped': 0, 'seconds': 91.0},
+        'releases': {'runs': 1, 'errors': 0, 'timeouts': 0, 'skipped': 1, 'seconds': 0.0},
+    })
+
+    updater._log_github_step_stats()
+
+    assert infos == ['GitHub languages: 2 runs, 0 errors, 0 timeouts, 0 skipped, 1.0s total']
+    assert warnings == [
+        'GitHub releases: 1 runs, 0 errors, 0 timeouts, 1 skipped, 0.0s total',
+        'GitHub star history: 2 runs, 1 errors, 1 timeouts, 0 skipped, 91.0s total',
+    ]
 
 
 def test_commit_activity_cache_helpers(tmp_path, monkeypatch):
@@ -428,7 +453,7 @@ def test_collect_commit_activity_uses_sha_cache(monkeypatch, tmp_path):
     statuses = {
         'changed': [updater.COMMIT_ACTIVITY_READY],
         'missing': [updater.COMMIT_ACTIVITY_PENDING, updater.COMMIT_ACTIVITY_READY],
-        'stuck': [updater.COMMIT_ACTIVITY_PENDING, updater.COMMIT_ACTIVITY_PENDING],
+        'stuck': [updater.COMMIT_ACTIVITY_PENDING] * 3,
     }
 
     def fake_fetch(repo, headers, sha=None):
@@ -438,19 +463,118 @@ def test_collect_commit_activity_uses_sha_cache(monkeypatch, tmp_path):
     monkeypatch.setattr(updater, '_fetch_commit_activity', fake_fetch)
     monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
 
-    updater._collect_commit_activity([cached, changed, missing, stuck], {})
+    clock = [1000.0]
+    sleeps = []
+
+    def sleep(secs):
+        sleeps.append(secs)
+        clock[0] += secs
+
+    monkeypatch.setattr(updater.time, 'time', lambda: clock[0])
+    monkeypatch.setattr(updater.time, 'sleep', sleep)
+    monkeypatch.setattr(updater.random, 'uniform', lambda low, high: high)
+    monkeypatch.setenv('DASHBOARD_COMMIT_ACTIVITY_DEADLINE', '12')
+
+    poller = updater._collect_commit_activity([cached, changed, missing, stuck], {})
+    assert poller.name == 'commit-activity-poller'
+    poller.join()
 
     expected_warning = 'GitHub commit activity is still being calculated for: stuck'
-    assert calls == [
+    assert sorted(calls[:3]) == [
         ('changed', 'new'),
         ('missing', 'missing'),
         ('stuck', 'stuck'),
+    ]
+    assert calls[3:] == [
         ('missing', 'missing'),
         ('stuck', 'stuck'),
+        ('stuck', 'stuck'),
     ]
+    assert sleeps == [5, 7]
     assert warnings == [expected_warning]
 
 
+def test_poll_commit_activity_backoff_and_deadline(monkeypatch):
+    clock = [1000.0]
+    sleeps = []
+
+    def sleep(secs):
+        sleeps.append(secs)
+        clock[0] += secs
+
+    monkeypatch.setattr(updater.time, 'time', lambda: clock[0])
+    monkeypatch.setattr(updater.time, 'sleep', sleep)
+    monkeypatch.setattr(updater.random, 'uniform', lambda low, high: high)
+    monkeypatch.setattr(updater, '_fetch_commit_activity', lambda repo, headers, sha: updater.COMMIT_ACTIVITY_PENDING)
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+
+    updater._poll_commit_activity([(FakeRepo('slow'), 'sha')], {}, deadline=1200.0)
+
+    assert sleeps == [5, 10, 20, 40, 60, 60, 5]
+    assert warnings == ['GitHub commit activity is still being calculated for: slow']
+
+
+def test_fetch_default_branch_shas(monkeypatch):
+    monkeypatch.setattr(updater, 'DEFAULT_BRANCH_SHAS_BATCH', 2)
+    repos = [FakeRepo('one'), FakeRepo('empty'), FakeRepo('two')]
+    responses = [
+        {'data': {'r0': {'defaultBranchRef': {'target': {'oid': 'sha1'}}}, 'r1': {'defaultBranchRef': None}}},
+        {'data': {'r0': {'defaultBranchRef': {'target': {'oid': 'sha2'}}}}},
+    ]
+    requests = []
+
+    def post(url, json, headers):
+        requests.append(json['variables'])
+        return FakeResponse(responses[len(requests) - 1])
+
+    monkeypatch.setattr(updater.helpers.s, 'post', post)
+    shas = updater._fetch_default_branch_shas(repos, {}, 'https://api.github.com/graphql')
+
+    assert shas == {'one': 'sha1', 'two': 'sha2'}
+    assert [sorted(v for k, v in variables.items() if k.startswith('name')) for variables in requests] == [
+        ['empty', 'one'], ['two']]
+
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+    monkeypatch.setattr(updater.helpers.s, 'post', lambda url, json, headers: FakeResponse({'data': None}))
+    assert updater._fetch_default_branch_shas(repos, {}, 'https://api.github.com/graphql') == {}
+    assert len(warnings) == 2
+
+
+def test_commit_activity_deadline(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+    monkeypatch.delenv('DASHBOARD_COMMIT_ACTIVITY_DEADLINE', raising=False)
+    assert updater._commit_activity_deadline() == updater.COMMIT_ACTIVITY_DEADLINE
+
+    monkeypatch.setenv('DASHBOARD_COMMIT_ACTIVITY_DEADLINE', '-5')
+    assert updater._commit_activity_deadline() == 0.0
+
+    monkeypatch.setenv('DASHBOARD_COMMIT_ACTIVITY_DEADLINE', 'soon')
+    assert updater._commit_activity_deadline() == updater.COMMIT_ACTIVITY_DEADLINE
+    assert warnings
+
+
+def test_collect_commit_activity_uses_known_shas(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+
+    class NoBranchRepo(FakeRepo):
+        def get_branch(self, branch):
+            pytest.fail('unexpected branch request')
+
+    calls = []
+    monkeypatch.setattr(
+        updater,
+        '_fetch_commit_activity',
+        lambda repo, headers, sha=None: calls.append((repo.name, sha)) or updater.COMMIT_ACTIVITY_READY,
+    )
+
+    assert updater._collect_commit_activity([NoBranchRepo('known')], {}, {'known': 'snapshot-sha'}) is None
+
+    assert calls == [('known', 'snapshot-sha')]
+
+
 def test_collect_commit_activity_returns_when_all_ready(monkeypatch, tmp_path):
     monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
 
@@ -465,7 +589,7 @@ def test_collect_commit_activity_returns_when_all_ready(monkeypatch, tmp_path):
     monkeypatch.setattr(updater, '_fetch_commit_activity', fake_fetch)
     monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
 
-    updater._collect_commit_activity([repo], {})
+    assert updater._collect_commit_activity([repo], {}) is None
 
     assert calls == [('ready', 'new')]
     assert warnings == []
@@ -478,14 +602,70 @@ def test_collect_pr_metrics(monkeypatch):
     monkeypatch.setattr(
         updater.pr_metrics,
         'refresh_repository',
-        lambda repo, base_dir, headers, session: calls.append((repo.name, base_dir, headers, session)),
+        lambda repo, base_dir, headers, session, first_pages: calls.append(
+            (repo.name, base_dir, headers, session, first_pages)) or repo.name == 'one',
+    )
+    monkeypatch.setattr(updater, '_prefetch_pr_metric_pages', lambda repos, headers: {'one': {'open': 'page'}})
+    monkeypatch.setattr(
+        updater.pr_metrics,
+        'load_cache',
+        lambda base_dir, name: {'pull_requests': [{'number': 4, 'state': 'open', 'title': name}]},
+    )
+
+    open_pulls = updater._collect_pr_metrics(repos, {'Authorization': 'token'})
+
+    assert sorted(calls, key=lambda call: call[0]) == [
+        ('one', updater.BASE_DIR, {'Authorization': 'token'}, updater.helpers.s, {'open': 'page'}),
+        ('two', updater.BASE_DIR, {'Authorization': 'token'}, updater.helpers.s, None),
+    ]
+    assert sorted(open_pulls) == ['one', 'two']
+    assert open_pulls['one'][0]['number'] == 4
+    assert open_pulls['two'][0]['title'] == 'two'
+
+    monkeypatch.setattr(updater.pr_metrics, 'load_cache', lambda base_dir, name: None)
+    assert updater._collect_pr_metrics(repos, {'Authorization': 'token'}) == {}
+
+    # open pulls with truncated labels or assignees are left to the REST collector
+    monkeypatch.setattr(updater.pr_metrics, 'load_cache', lambda base_dir, name: {'pull_requests': [
+        {'number': 4, 'state': 'open', 'summary_truncated': name == 'one'},
+        {'number': 3, 'state': 'merged', 'summary_truncated': True},
+    ]})
+    assert sorted(updater._collect_pr_metrics(repos, {'Authorization': 'token'})) == ['two']
+
+
+def test_prefetch_pr_metric_pages(monkeypatch):
+    repos = [FakeRepo('fresh'), FakeRepo('one'), FakeRepo('two'), FakeRepo('three')]
+    monkeypatch.setattr(updater.pr_metrics, 'load_cache', lambda base_dir, name: name)
+    monkeypatch.setattr(updater.pr_metrics, 'cache_is_fresh', lambda cache, now: cache == 'fresh')
+    monkeypatch.setattr(
+        updater,
+        'GRAPHQL_NODE_BUDGET',
+        updater.pr_metrics.REPOSITORY_PAGES_NODE_COST + updater.pr_metrics.OPEN_PAGE_NODE_COST,
     )
+    batches = []
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
 
-    updater._collect_pr_metrics(repos, {'Authorization': 'token'})
+    def fetch_first_pages(batch, headers, session, open_only):
+        batches.append(([repo.name for repo in batch], open_only))
+        if len(batch) == 1:
+            raise RuntimeError('boom')
+        return {repo.name: {'open': repo.name} for repo in batch}
+
+    monkeypatch.setattr(updater.pr_metrics, 'fetch_first_pages', fetch_first_pages)
 
-    assert calls == [
-        ('one', updater.BASE_DIR, {'Authorization': 'token'}, updater.helpers.s),
-        ('two', updater.BASE_DIR, {'Authorization': 'token'}, updater.helpers.s),
+    pages = updater._prefetch_pr_metric_pages(repos, {})
+
+    # fresh caches still get their open page, at the cost of a single page
+    assert batches == [
+        (['fresh', 'one'], frozenset({'fresh'})),
+        (['two'], frozenset({'fresh'})),
+        (['three'], frozenset({'fresh'})),
+    ]
+    assert pages == {'fresh': {'open': 'fresh'}, 'one': {'open': 'one'}}
+    assert warnings == [
+        'Error fetching PR metric pages for two: boom',
+        'Error fetching PR metric pages for three: boom',
     ]
 
 
@@ -548,6 +728,122 @@ def test_collect_star_history(monkeypatch, tmp_path):
     assert updater._collect_star_history(FakeRepo(stars=0)) == []
 
 
+def test_collect_exact_star_history(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    monkeypatch.setattr(updater, 'STARGAZERS_PER_PAGE', 2)
+    stargazers = [
+        FakeStargazer('2026-01-01', 'a'),
+        FakeStargazer('2026-01-01', 'b'),
+        FakeStargazer('2026-01-02', 'c'),
+    ]
+    requested = []
+
+    class Repo(FakeRepo):
+        def get_stargazers_with_dates(self):
+            def get_page(idx):
+                requested.append(idx)
+                return stargazers[idx * 2:idx * 2 + 2]
+
+            return SimpleNamespace(get_page=get_page)
+
+    repo = Repo(name='demo', stars=3)
+    assert updater._collect_exact_star_history(repo) == [
+        {'date': '2026-01-01', 'stars': 2},
+        {'date': '2026-01-02', 'stars': 3},
+    ]
+    assert sorted(requested) == [0, 1]
+
+    # resume after the anchor, only fetching the pages that can hold new stargazers
+    requested.clear()
+    stargazers.extend([FakeStargazer('2026-01-03', 'd'), FakeStargazer('2026-01-03', 'e')])
+    history = updater._collect_exact_star_history(repo)
+    assert history[-1] == {'date': '2026-01-03', 'stars': 5}
+    assert requested == [1, 2]
+    with open(updater._star_history_cursor_path(repo)) as f:
+        assert json.load(f)['anchor'] == 'e'
+
+    # nothing new: the stored series is returned as is
+    assert updater._collect_exact_star_history(repo)[-1] == {'date': '2026-01-03', 'stars': 5}
+
+    # someone unstarred, so the anchor moved and the history is rebuilt
+    stargazers.pop(0)
+    repo.stargazers_count = 4
+    assert updater._collect_exact_star_history(repo) == [
+        {'date': '2026-01-01', 'stars': 1},
+        {'date': '2026-01-02', 'stars': 2},
+        {'date': '2026-01-03', 'stars': 4},
+    ]
+
+
+def test_collect_exact_star_history_resumes_cancelled_backfill(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    monkeypatch.setattr(updater, 'STARGAZERS_PER_PAGE', 2)
+    monkeypatch.setattr(updater, 'STAR_HISTORY_WORKERS', 1)
+    stargazers = [FakeStargazer(f'2026-01-0{index}', f'user{index}') for index in range(1, 6)]
+    requested = []
+
+    class Repo(FakeRepo):
+        def get_stargazers_with_dates(self):
+            def get_page(idx):
+                requested.append(idx)
+                return stargazers[idx * 2:idx * 2 + 2]
+
+            return SimpleNamespace(get_page=get_page)
+
+    repo = Repo(name='demo', stars=5)
+
+    def cancel_after_first_batch():
+        if os.path.exists(updater._star_history_cursor_path(repo)):
+            raise updater.helpers.StepCancelledError('timed out')
+
+    monkeypatch.setattr(updater.helpers, 'raise_if_step_cancelled', cancel_after_first_batch)
+    with pytest.raises(updater.helpers.StepCancelledError):
+        updater._collect_exact_star_history(repo)
+    assert requested == [0]
+    with open(updater._star_history_cursor_path(repo)) as f:
+        assert json.load(f)['count'] == 2
+
+    # the next run keeps the first batch and only continues the backfill
+    monkeypatch.undo()
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    monkeypatch.setattr(updater, 'STARGAZERS_PER_PAGE', 2)
+    requested.clear()
+    history = updater._collect_exact_star_history(repo)
+    assert history[-1] == {'date': '2026-01-05', 'stars': 5}
+    assert sorted(requested) == [0, 1, 2]
+
+
+def test_collect_star_history_exact_mode(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    monkeypatch.setattr(updater, 'STARGAZERS_PER_PAGE', 2)
+    monkeypatch.setenv('DASHBOARD_STAR_HISTORY_MODE', 'EXACT')
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+
+    history = updater._collect_star_history(FakeRepo(name='demo', stars=3))
+    assert history[:2] == [{'date': '2026-01-01', 'stars': 1}, {'date': '2026-01-02', 'stars': 2}]
+    assert history[-1]['stars'] == 3
+
+    today = datetime.now(tz=timezone.utc).strftime('%Y-%m-%d')
+    monkeypatch.setattr(updater, '_collect_exact_star_history', lambda repo: [{'date': today, 'stars': 1}])
+    assert updater._collect_star_history(FakeRepo(name='demo', stars=3)) == [{'date': today, 'stars': 3}]
+
+    class Broken(FakeRepo):
+        def get_stargazers_with_dates(self):
+            return FakeStargazers({}, fail_page=0)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'other'))
+    monkeypatch.setenv('DASHBOARD_STAR_HISTORY_MODE', 'exact')
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+    assert updater._collect_star_history(Broken(name='broken', stars=1))[-1]['stars'] == 1
+    assert any('using sampled star history' in warning for warning in warnings)
+
+    monkeypatch.setenv('DASHBOARD_STAR_HISTORY_MODE', 'approximate')
+    assert updater._star_history_mode() == updater.STAR_HISTORY_SAMPLED
+    assert any('DASHBOARD_STAR_HISTORY_MODE' in warning for warning in warnings)
+
+
 def test_collect_open_issues_filters_prs_and_flags_bots():
     issues = updater._collect_open_issues(FakeRepo(name='demo'))
 
@@ -557,6 +853,99 @@ def test_collect_open_issues_filters_prs_and_flags_bots():
     assert issues[1]['is_bot'] is True
 
 
+class FakeIncrementalRepo(FakeRepo):
+    def get_pulls(self, state='open', sort=None, direction=None):
+        if state == 'open':
+            return super().get_pulls(state)
+        assert (state, sort, direction) == ('all', 'updated', 'desc')
+        merged = FakePull(2)
+        merged.state = 'closed'
+        merged.updated_at = datetime(2026, 1, 3, tzinfo=timezone.utc)
+        updated = FakePull(5)
+        updated.state = 'open'
+        updated.updated_at = datetime(2026, 1, 3, tzinfo=timezone.utc)
+        stale = FakePull(1)
+        stale.updated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return [updated, merged, stale, pytest.fail]
+
+    def get_issues(self, state='open', since=None):
+        if state == 'open':
+            return super().get_issues(state)
+        assert state == 'all' and since is not None
+        closed = FakeIssue(1)
+        closed.state = 'closed'
+        opened = FakeIssue(7, 'renovate[bot]')
+        opened.state = 'open'
+        return [opened, closed, FakeIssue(8, is_pr=True)]
+
+
+def test_collect_open_items_incrementally():
+    repo = FakeIncrementalRepo(name='demo')
+    since = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+    pulls = updater._collect_open_pulls(repo, [{'number': 2}, {'number': 1}], since)
+    assert [pr['number'] for pr in pulls] == [5, 1]
+    assert pulls[0]['title'] == 'PR'
+
+    issues = updater._collect_open_issues(repo, [{'number': 1}, {'number': 3}], since)
+    assert [issue['number'] for issue in issues] == [7, 3]
+    assert issues[0]['is_bot'] is True
+
+    assert [pr['number'] for pr in updater._collect_open_pulls(repo, None, since)] == [3]
+
+
+def test_update_open_items_uses_incremental_cursor(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    repo = FakeIncrementalRepo(name='demo')
+    calls = []
+
+    def collect(current_repo, cached, since):
+        calls.append((cached, since))
+        return [{'number': len(calls)}]
+
+    updater._update_open_items(repo, 'pulls', 'pull requests', None, collect)
+    updater._update_open_items(repo, 'pulls', 'pull requests', None, collect)
+    updater._update_open_items(repo, 'issues', 'issues', [{'number': 9}], collect)
+
+    assert calls[0] == (None, None)
+    assert calls[1][0] == [{'number': 1}]
+    assert datetime.now(tz=timezone.utc) - calls[1][1] < updater.INCREMENTAL_OVERLAP + timedelta(minutes=1)
+    with open(tmp_path / 'gh-pages' / 'github' / 'pulls' / 'demo.json') as f:
+        assert json.load(f) == [{'number': 2}]
+    with open(tmp_path / 'gh-pages' / 'github' / 'issues' / 'demo.json') as f:
+        assert json.load(f) == [{'number': 9}]
+    with open(updater._incremental_cursor_path(repo)) as f:
+        assert set(json.load(f)) == {'pulls'}
+
+    updater._update_open_items(repo, 'issues', 'issues', None, lambda *args: None)
+    with open(tmp_path / 'gh-pages' / 'github' / 'issues' / 'demo.json') as f:
+        assert json.load(f) == [{'number': 9}]
+
+
+def test_load_incremental_state_requires_fresh_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    repo = FakeRepo(name='demo')
+    cursor_path = updater._incremental_cursor_path(repo)
+    os.makedirs(os.path.dirname(cursor_path))
+    os.makedirs(tmp_path / 'gh-pages' / 'github' / 'issues')
+    with open(tmp_path / 'gh-pages' / 'github' / 'issues' / 'demo.json', 'w') as f:
+        json.dump([{'number': 1}], f)
+
+    assert updater._load_incremental_state(repo, 'issues') == (None, None)
+
+    old = datetime.now(tz=timezone.utc) - updater.INCREMENTAL_FULL_REFRESH - timedelta(hours=1)
+    with open(cursor_path, 'w') as f:
+        json.dump({'issues': old.isoformat()}, f)
+    assert updater._load_incremental_state(repo, 'issues') == (None, None)
+
+    with open(cursor_path, 'w') as f:
+        json.dump(['not', 'a', 'dict'], f)
+    assert updater._load_incremental_state(repo, 'issues') == (None, None)
+    updater._save_incremental_cursor(repo, 'issues', old)
+    with open(cursor_path) as f:
+        assert json.load(f) == {'issues': old.isoformat()}
+
+
 def test_process_github_repo(monkeypatch, tmp_path):
     monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
 
@@ -572,7 +961,7 @@ def test_process_github_repo(monkeypatch, tmp_path):
     monkeypatch.setattr(
         updater,
         '_build_code_scanning_history',
-        lambda alerts: [{'date': '2026-01-01', 'open': 0}],
+        lambda alerts, fill_gaps: [{'date': '2026-01-01', 'open': 0}],
     )
 
     def post_ok(url, json, headers):
@@ -590,12 +979,48 @@ def test_process_github_repo(monkeypatch, tmp_path):
     assert any(path == 'img' for path, _ in writes)
 
 
+def test_process_github_repo_unchanged_data_does_not_rebuild(monkeypatch, tmp_path):
+    base = tmp_path / 'gh-pages'
+    monkeypatch.setattr(updater, 'BASE_DIR', str(base))
+    monkeypatch.setattr(builder, 'BASE_DIR', str(base))
+    monkeypatch.setattr(builder, 'TEMPLATE_DIR', str(tmp_path / 'gh-pages-template'))
+    monkeypatch.delenv('DASHBOARD_FULL_BUILD', raising=False)
+    monkeypatch.setattr(updater.helpers, 'debug_print', lambda *args, **kwargs: None)
+    monkeypatch.setattr(updater.helpers, 'save_image_from_url', lambda **kwargs: None)
+    monkeypatch.setattr(updater, '_collect_star_history', lambda repo: [{'date': '2026-01-01', 'stars': 1}])
+    monkeypatch.setattr(updater, '_fetch_code_scanning_alerts', lambda repo: [{'state': 'open'}])
+    monkeypatch.setattr(
+        updater,
+        '_build_code_scanning_history',
+        lambda alerts, fill_gaps: [{'date': '2026-01-01', 'open': 1}],
+    )
+    monkeypatch.setattr(updater.helpers.s, 'post', lambda url, json, headers: FakeResponse({}))
+    (base / 'github').mkdir(parents=True)
+    (base / 'github' / 'repos.json').write_text(json.dumps([{'name': 'demo', 'private': False}]), encoding='utf-8')
+
+    updater._process_github_repo(FakeRepo(name='demo'), {'Authorization': 'x'}, 'https://api.github.com/graphql')
+    builder.build()
+    rebuilt = []
+    original = builder._build_repo_outputs
+    monkeypatch.setattr(builder, '_build_repo_outputs', lambda repo, *args: rebuilt.append(repo['name']) or original(
+        repo, *args))
+
+    updater._process_github_repo(FakeRepo(name='demo'), {'Authorization': 'x'}, 'https://api.github.com/graphql')
+    builder.build()
+
+    assert rebuilt == []
+    assert json.loads((base / 'github' / 'codeScanning' / 'demo.json').read_text(encoding='utf-8')) == {
+        'repo': 'demo',
+        'open': 1,
+    }
+
+
 def test_process_github_repo_error_and_avatar_skip(monkeypatch, tmp_path):
     monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
     monkeypatch.setattr(updater.helpers, 'write_json_files', lambda **kwargs: None)
     monkeypatch.setattr(updater, '_collect_star_history', lambda repo: [])
     monkeypatch.setattr(updater, '_fetch_code_scanning_alerts', lambda repo: [])
-    monkeypatch.setattr(updater, '_build_code_scanning_history', lambda alerts: [])
+    monkeypatch.setattr(updater, '_build_code_scanning_history', lambda alerts, fill_gaps: [])
     warnings = []
     monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
 
@@ -619,15 +1044,214 @@ def test_process_github_repo_error_and_avatar_skip(monkeypatch, tmp_path):
     assert any('OpenGraph image URL' in warning for warning in warnings)
 
 
+def _snapshot_data(name='demo', more_pulls=False):
+    return {
+        'openGraphImageUrl': f'https://example.com/{name}.png',
+        'defaultBranchRef': {'target': {'oid': f'sha-{name}'}},
+        'languages': {
+            'pageInfo': {'hasNextPage': False},
+            'edges': [{'size': 100, 'node': {'name': 'Python'}}],
+        },
+        'pullRequests': {
+            'pageInfo': {'hasNextPage': more_pulls},
+            'nodes': [{
+                'number': 3,
+                'title': 'PR',
+                'isDraft': True,
+                'createdAt': '2026-01-01T00:00:00Z',
+                'updatedAt': '2026-01-02T00:00:00Z',
+                'author': {'login': 'renovate', '__typename': 'Bot'},
+                'labels': {'pageInfo': {'hasNextPage': False}, 'nodes': [{'name': 'label'}]},
+                'assignees': {'pageInfo': {'hasNextPage': False}, 'nodes': [{'login': 'assignee'}]},
+                'milestone': {'title': 'v1'},
+            }],
+        },
+        'issues': {
+            'pageInfo': {'hasNextPage': False},
+            'nodes': [
+                {
+                    'number': 1,
+                    'title': 'Issue',
+                    'createdAt': '2026-01-01T00:00:00Z',
+                    'updatedAt': '2026-01-02T00:00:00Z',
+                    'author': {'login': 'person', '__typename': 'User'},
+                    'labels': None,
+                    'assignees': {'nodes': []},
+                    'milestone': None,
+                },
+                {
+                    'number': 2,
+                    'title': 'Ghost issue',
+                    'createdAt': None,
+                    'updatedAt': None,
+                    'author': None,
+                },
+            ],
+        },
+    }
+
+
+def test_parse_repository_snapshot():
+    snapshot = updater._parse_repository_snapshot(_snapshot_data())
+
+    assert snapshot['open_graph_image_url'] == 'https://example.com/demo.png'
+    assert snapshot['default_branch_sha'] == 'sha-demo'
+    assert snapshot['languages'] == {'Python': 100}
+    assert snapshot['pulls'] == [{
+        'number': 3,
+        'title': 'PR',
+        'author': 'renovate[bot]',
+        'labels': ['label'],
+        'assignees': ['assignee'],
+        'created_at': '2026-01-01T00:00:00+00:00',
+        'updated_at': '2026-01-02T00:00:00+00:00',
+        'milestone': 'v1',
+        'draft': True,
+    }]
+    assert snapshot['issues'][0] == {
+        'number': 1,
+        'title': 'Issue',
+        'author': 'person',
+        'author_type': 'User',
+        'is_bot': False,
+        'labels': [],
+        'assignees': [],
+        'created_at': '2026-01-01T00:00:00+00:00',
+        'updated_at': '2026-01-02T00:00:00+00:00',
+        'milestone': None,
+    }
+    assert snapshot['issues'][1]['author'] is None
+    assert snapshot['issues'][1]['created_at'] is None
+
+    partial = updater._parse_repository_snapshot(_snapshot_data(more_pulls=True) | {
+        'defaultBranchRef': None,
+        'languages': None,
+        'issues': None,
+    })
+    assert partial['default_branch_sha'] is None
+    assert partial['languages'] is None
+    assert partial['pulls'] is None
+    assert partial['issues'] is None
+
+    # truncated labels or assignees on any item send the whole connection to the REST collectors
+    overflow = _snapshot_data()
+    overflow['pullRequests']['nodes'][0]['labels']['pageInfo']['hasNextPage'] = True
+    overflow['issues']['nodes'][0]['assignees'] = {'pageInfo': {'hasNextPage': True}, 'nodes': []}
+    truncated = updater._parse_repository_snapshot(overflow)
+    assert truncated['pulls'] is None
+    assert truncated['issues'] is None
+    assert truncated['languages'] == {'Python': 100}
+
+
+def test_fetch_repository_snapshot_batch(monkeypatch):
+    repos = [FakeRepo('one'), FakeRepo('two'), FakeRepo('three')]
+    posts = []
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+
+    def fake_post(url, json, headers):
+        posts.append(json)
+        return FakeResponse({
+            'data': {'r0': _snapshot_data('one'), 'r1': None, 'r2': _snapshot_data('three')},
+            'errors': [{'path': ['r1'], 'type': 'NOT_FOUND'}],
+        })
+
+    monkeypatch.setattr(updater.helpers.s, 'post', fake_post)
+    snapshots = updater._fetch_repository_snapshot_batch(repos, {}, 'url', skip_pulls={'one'})
+
+    assert sorted(snapshots) == ['one', 'three']
+    assert snapshots['three']['default_branch_sha'] == 'sha-three'
+    assert posts[0]['variables'] == {
+        'owner0': 'owner', 'name0': 'one',
+        'owner1': 'owner', 'name1': 'two',
+        'owner2': 'owner', 'name2': 'three',
+    }
+    assert 'r0: repository(owner: $owner0, name: $name0) { ...RepositorySnapshot }' in posts[0]['query']
+    assert 'r2: repository(owner: $owner2, name: $name2) { ...RepositorySnapshot ...RepositoryPulls }' in (
+        posts[0]['query'])
+    assert 'fragment RepositorySnapshot on Repository' in posts[0]['query']
+    assert 'fragment RepositoryPulls on Repository' in posts[0]['query']
+    assert warnings
+
+    updater._fetch_repository_snapshot_batch(repos, {}, 'url', skip_pulls={'one', 'two', 'three'})
+    assert 'pullRequests' not in posts[1]['query']
+    assert 'RepositoryPulls' not in posts[1]['query']
+
+    monkeypatch.setattr(updater.helpers.s, 'post', lambda url, json, headers: FakeResponse({'message': 'no'}, 401))
+    with pytest.raises(RuntimeError, match='repository snapshots'):
+        updater._fetch_repository_snapshot_batch(repos, {}, 'url')
+
+
+def test_fetch_repository_snapshots_batches_by_cost(monkeypatch):
+    monkeypatch.setattr(
+        updater, 'GRAPHQL_NODE_BUDGET', (updater.SNAPSHOT_NODE_COST + updater.SNAPSHOT_PULLS_NODE_COST) * 2)
+    batches = []
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+
+    def fake_batch(repos, headers, graphql_url, skip_pulls):
+        batches.append([repo.name for repo in repos])
+        if repos[0].name == 'r2':
+            raise RuntimeError('boom')
+        return {repo.name: {'default_branch_sha': repo.name} for repo in repos}
+
+    monkeypatch.setattr(updater, '_fetch_repository_snapshot_batch', fake_batch)
+    snapshots = updater._fetch_repository_snapshots([FakeRepo(f'r{index}') for index in range(5)], {}, 'url')
+
+    assert batches == [['r0', 'r1'], ['r2', 'r3'], ['r4']]
+    assert sorted(snapshots) == ['r0', 'r1', 'r4']
+    assert warnings == ['Error fetching repository snapshots for r2, r3: boom']
+
+    # repositories without pull requests in their snapshot are cheaper to pack
+    batches.clear()
+    updater._fetch_repository_snapshots(
+        [FakeRepo(f'r{index}') for index in range(4)], {}, 'url', skip_pulls={'r0', 'r1', 'r2'})
+    assert batches == [['r0', 'r1', 'r2'], ['r3']]
+
+
+def test_process_github_repo_uses_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    writes = []
+    monkeypatch.setattr(updater.helpers, 'write_json_files', lambda file_path, data: writes.append((file_path, data)))
+    monkeypatch.setattr(
+        updater.helpers,
+        'save_image_from_url',
+        lambda **kwargs: writes.append(('img', kwargs['image_url'])),
+    )
+    monkeypatch.setattr(updater, '_collect_star_history', lambda repo: [])
+    monkeypatch.setattr(updater, '_fetch_code_scanning_alerts', lambda repo: [])
+    monkeypatch.setattr(updater.helpers.s, 'post', lambda **kwargs: pytest.fail('unexpected GraphQL request'))
+
+    class SnapshotRepo(FakeRepo):
+        def get_languages(self):
+            pytest.fail('unexpected languages request')
+
+        def get_pulls(self, state='open'):
+            pytest.fail('unexpected pulls request')
+
+        def get_issues(self, state='open'):
+            pytest.fail('unexpected issues request')
+
+    snapshot = updater._parse_repository_snapshot(_snapshot_data())
+    updater._process_github_repo(SnapshotRepo(name='demo'), {}, 'url', snapshot)
+
+    written = {path.replace('\\', '/').rsplit('/', 2)[-2]: data for path, data in writes if path != 'img'}
+    assert written['languages'] == {'Python': 100}
+    assert written['pulls'] == snapshot['pulls']
+    assert written['issues'] == snapshot['issues']
+    assert ('img', 'https://example.com/demo.png') in writes
+
+
 def test_update_github(monkeypatch):
     monkeypatch.setenv('GITHUB_TOKEN', 'tok')
     monkeypatch.setenv('GITHUB_REPOSITORY_OWNER', 'owner')
 
     repo_active = FakeRepo('active', archived=False)
     repo_pending = FakeRepo('pending', archived=False)
+    repo_missing = FakeRepo('missing', archived=False)
     repo_archived = FakeRepo('archived', archived=True)
 
-    owner = SimpleNamespace(get_repos=lambda: [repo_active, repo_pending, repo_archived])
+    owner = SimpleNamespace(get_repos=lambda: [repo_active, repo_pending, repo_missing, repo_archived])
 
     class FakeGithub:
         def __init__(self, auth, timeout):
@@ -642,27 +1266,107 @@ def test_update_github(monkeypatch):
     writes = []
     monkeypatch.setattr(updater.helpers, 'write_json_files', lambda file_path, data: writes.append((file_path, data)))
     commit_repos = []
+    commit_shas = []
+    snapshot_skips = []
+    monkeypatch.setattr(
+        updater,
+        '_fetch_repository_snapshots',
+        lambda repos, headers, graphql_url, skip_pulls: snapshot_skips.append(skip_pulls) or {
+            'active': {'default_branch_sha': 'abc'},
+            'pending': {'default_branch_sha': None},
+        },
+    )
+    sha_lookups = []
+    monkeypatch.setattr(
+        updater,
+        '_fetch_default_branch_shas',
+        lambda repos, headers, graphql_url: sha_lookups.extend(repo.name for repo in repos) or {'missing': 'def'},
+    )
+    joined = []
+    poller = SimpleNamespace(join=lambda: joined.append(list(processed)))
     monkeypatch.setattr(
         updater,
         '_collect_commit_activity',
-        lambda repos, headers: commit_repos.extend(repo.name for repo in repos),
+        lambda repos, headers, shas: commit_repos.extend(repo.name for repo in repos) or commit_shas.append(shas)
+        or poller,
     )
     metric_repos = []
     monkeypatch.setattr(
         updater,
         '_collect_pr_metrics',
-        lambda repos, headers: metric_repos.extend(repo.name for repo in repos),
+        lambda repos, headers: metric_repos.extend(repo.name for repo in repos) or {
+            'pending': [{'number': 9}],
+            'archived': [{'number': 1}],
+        },
     )
     processed = []
-    monkeypatch.setattr(updater, '_process_github_repo', lambda repo, headers, graphql_url: processed.append(repo.name))
+    monkeypatch.setattr(
+        updater,
+        '_process_github_repo',
+        lambda repo, headers, graphql_url, snapshot=None: processed.append((repo.name, snapshot)),
+    )
     monkeypatch.setattr(updater, 'BASE_DIR', 'base')
 
     updater.update_github()
 
     assert any(path.endswith(('github\\repos', 'github/repos')) for path, _ in writes)
-    assert commit_repos == ['active', 'pending']
-    assert metric_repos == ['active', 'pending']
-    assert processed == ['active', 'pending']
+    assert commit_repos == ['active', 'pending', 'missing']
+    assert sha_lookups == ['missing']
+    assert commit_shas == [{'active': 'abc', 'missing': 'def'}]
+    assert metric_repos == ['active', 'pending', 'missing']
+    assert snapshot_skips == [{'active', 'pending', 'missing'}]
+    assert processed == [
+        ('active', {'default_branch_sha': 'abc'}),
+        ('pending', {'default_branch_sha': None, 'pulls': [{'number': 9}]}),
+        ('missing', None),
+    ]
+    assert joined == [processed]
+
+
+def test_github_repo_workers(monkeypatch):
+    monkeypatch.delenv('DASHBOARD_GITHUB_WORKERS', raising=False)
+    assert updater._github_repo_workers() == updater.GITHUB_REPO_WORKERS
+
+    monkeypatch.setenv('DASHBOARD_GITHUB_WORKERS', '8')
+    assert updater._github_repo_workers() == 8
+
+    monkeypatch.setenv('DASHBOARD_GITHUB_WORKERS', '0')
+    assert updater._github_repo_workers() == 1
+
+    warnings = []
+    monkeypatch.setattr(updater.log, 'warning', lambda msg: warnings.append(msg))
+    monkeypatch.setenv('DASHBOARD_GITHUB_WORKERS', 'many')
+    assert updater._github_repo_workers() == updater.GITHUB_REPO_WORKERS
+    assert warnings
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_process_github_repos(monkeypatch, workers):
+    processed = []
+    monkeypatch.setattr(
+        updater,
+        '_process_github_repo',
+        lambda repo, headers, graphql_url, snapshot: processed.append((repo.name, headers, graphql_url, snapshot)),
+    )
+
+    repos = [FakeRepo(f'repo{index}') for index in range(6)]
+    snapshots = {'repo0': {'issues': []}}
+    updater._process_github_repos(repos, {'Authorization': 'x'}, 'url', workers=workers, snapshots=snapshots)
+
+    assert sorted(processed, key=lambda item: item[0]) == [
+        (f'repo{index}', {'Authorization': 'x'}, 'url', {'issues': []} if index == 0 else None)
+        for index in range(6)
+    ]
+
+
+def test_process_github_repos_propagates_errors(monkeypatch):
+    def fail(repo, headers, graphql_url, snapshot):
+        raise RuntimeError(repo.name)
+
+    monkeypatch.setattr(updater, '_process_github_repo', fail)
+
+    with pytest.raises(RuntimeError, match='repo1'):
+        updater._process_github_repos([FakeRepo('repo1')], {}, 'url', workers=2)
 
 
 def test_update_patreon(monkeypatch):
@@ -772,18 +1476,74 @@ def test_append_thread_if_env_set_and_update(monkeypatch):
     assert 'deactivate' in joined
 
 
-def test_fetch_code_scanning_alerts(monkeypatch):
+class FakeAlert:
+    def __init__(self, number, state='open', created='2026-01-01', dismissed=None, fixed=None, updated=None):
+        def parse(value):
+            return datetime.fromisoformat(value).replace(tzinfo=timezone.utc) if value else None
+
+        self.number = number
+        self.state = state
+        self.created_at = parse(created)
+        self.dismissed_at = parse(dismissed)
+        self.fixed_at = parse(fixed)
+        self.updated_at = parse(updated)
+
+
+def test_fetch_code_scanning_alerts(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
     repo = FakeRepo(name='demo')
+    alerts = [FakeAlert(1), FakeAlert(2, 'dismissed', dismissed='2026-01-03'), FakeAlert(3)]
+    calls = []
 
-    class Alert:
-        def __init__(self, state):
-            self.state = state
+    def get_codescan_alerts(**kwargs):
+        calls.append(kwargs)
+        return alerts
 
-    alerts = [Alert('open'), Alert('dismissed'), Alert('open')]
-    monkeypatch.setattr(repo, 'get_codescan_alerts', lambda **kwargs: alerts)
+    monkeypatch.setattr(repo, 'get_codescan_alerts', get_codescan_alerts)
 
     result = updater._fetch_code_scanning_alerts(repo)
-    assert result == alerts
+    assert [row['number'] for row in result] == [3, 2, 1]
+    assert result[1] == {
+        'number': 2,
+        'state': 'dismissed',
+        'created': '2026-01-01',
+        'dismissed': '2026-01-03',
+        'fixed': None,
+    }
+    assert calls == [{}]
+
+    recent = datetime.now(tz=timezone.utc).isoformat()
+    alerts = [
+        FakeAlert(4, updated=recent),
+        FakeAlert(1, 'fixed', fixed='2026-01-05'),
+        FakeAlert(3, updated='2020-01-01'),
+        pytest.fail,
+    ]
+    result = updater._fetch_code_scanning_alerts(repo)
+    assert [(row['number'], row['state']) for row in result] == [
+        (4, 'open'),
+        (3, 'open'),
+        (2, 'dismissed'),
+        (1, 'fixed'),
+    ]
+    assert calls[1] == {'sort': 'updated', 'direction': 'desc'}
+    assert updater._build_code_scanning_history(result)[-1] == {'date': '2026-01-05', 'open': 2}
+
+    with open(updater._code_scanning_table_path(repo)) as f:
+        assert [row['number'] for row in json.load(f)['alerts']] == [4, 3, 2, 1]
+
+
+def test_load_code_scanning_table_requires_fresh_table(monkeypatch, tmp_path):
+    monkeypatch.setattr(updater, 'BASE_DIR', str(tmp_path / 'gh-pages'))
+    repo = FakeRepo(name='demo')
+    assert updater._load_code_scanning_table(repo) == (None, None)
+
+    path = updater._code_scanning_table_path(repo)
+    os.makedirs(os.path.dirname(path))
+    old = datetime.now(tz=timezone.utc) - updater.INCREMENTAL_FULL_REFRESH - timedelta(hours=1)
+    with open(path, 'w') as f:
+        json.dump({'updated_at': old.isoformat(), 'alerts': []}, f)
+    assert updater._load_code_scanning_table(repo) == (None, None)
 
 
 def test_fetch_code_scanning_alerts_404_skip(monkeypatch):
@@ -886,3 +1646,29 @@ def test_build_code_scanning_history_dismissed_and_fixed_same_day():
     assert {'date': '2026-02-01', 'open': 1} in history
     assert {'date': '2026-02-02', 'open': 2} in history
     assert {'date': '2026-02-03', 'open': 0} in history
+
+
+def test_build_code_scanning_history_fill_gaps():
+    class Alert:
+        def __init__(self, created, dismissed=None):
+            self.created_at = datetime.fromisoformat(created).replace(tzinfo=timezone.utc)
+            self.dismissed_at = datetime.fromisoformat(dismissed).replace(tzinfo=timezone.utc) if dismissed else None
+            self.fixed_at = None
+
+    alerts = [
+        Alert('2026-02-01', dismissed='2026-02-04'),
+        Alert('2026-02-03', dismissed='2026-02-02'),
+    ]
+
+    assert updater._build_code_scanning_history(alerts) == [
+        {'date': '2026-02-01', 'open': 1},
+        {'date': '2026-02-02', 'open': 1},
+        {'date': '2026-02-03', 'open': 1},
+        {'date': '2026-02-04', 'open': 0},
+    ]
+    assert updater._build_code_scanning_history(alerts[:1], fill_gaps=True) == [
+        {'date': '2026-02-01', 'open': 1},
+        {'date': '2026-02-02', 'open': 1},
+        {'date': '2026-02-03', 'open': 1},
+        {'date': '2026-02-04', 'open': 0},
+    ]